@@ -0,0 +1,73 @@
+"""
+HTML corpus for the benchmarks: the checked-in books_toscrape fixtures plus
+larger synthetic pages derived from them, and synthetic products
+"""
+
+import random
+import re
+from pathlib import Path
+from typing import Dict, List
+
+from src.core.data_models import Product
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures" / "books_toscrape"
+BASE_URL = "http://books.toscrape.com/"
+LISTING_URL = BASE_URL + "catalogue/page-1.html"
+
+CURRENCIES = ["£{:.2f}", "${:,.2f}", "{:.2f} €", "USD {:,.2f}"]
+RATINGS = ["One", "Two", "Three", "Four", "Five"]
+
+
+def fixture_pages() -> Dict[str, str]:
+    """The checked-in listing and product pages, by file stem"""
+    return {path.stem: path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("*.html"))}
+
+
+def large_listing_page(num_products: int = 1000) -> str:
+    """A listing page with ``num_products`` product cards, built from the first fixture card"""
+    html = (FIXTURES / "listing_page_1.html").read_text(encoding="utf-8")
+    cards = re.findall(r'\s*<li class="col-xs-6.*?</li>', html, re.S)
+    head, tail = html.split(cards[0], 1)[0], html.split(cards[-1], 1)[1]
+
+    template = cards[0]
+    slug = re.search(r'href="([^"/]+)/index.html"', template).group(1)
+    generated = [template.replace(slug, f"synthetic-book_{i}") for i in range(num_products)]
+    return head + "".join(generated) + tail
+
+
+def large_product_page(description_paragraphs: int = 200, table_rows: int = 200) -> str:
+    """A product page with a long description and a large information table"""
+    html = (FIXTURES / "product_sharp_objects.html").read_text(encoding="utf-8")
+    rng = random.Random(0)
+    words = re.findall(r"[A-Za-z]+", html)
+
+    description = re.search(r'(<div id="product_description".*?</div>\s*<p>)(.*?)(</p>)', html, re.S)
+    text = " ".join(rng.choice(words) for _ in range(description_paragraphs * 60))
+    html = html.replace(description.group(0), description.group(1) + text + description.group(3))
+
+    rows = "".join(f"<tr><th>Attribute {i}</th><td>{rng.choice(words)}</td></tr>" for i in range(table_rows))
+    return html.replace("</table>", rows + "</table>", 1)
+
+
+def synthetic_products(count: int, seed: int = 0) -> List[Product]:
+    """Products with varied price formats, ratings and specifications"""
+    rng = random.Random(seed)
+    products = []
+    for i in range(count):
+        price = rng.choice(CURRENCIES).format(rng.uniform(1, 2000))
+        rating = rng.choice(RATINGS)
+        products.append(Product(
+            product_url=f"{BASE_URL}catalogue/synthetic-book_{i}/index.html",
+            product_name=f"Synthetic Book {i}",
+            price=price,
+            availability=rng.choice(["In stock", "Out of stock"]),
+            description="A synthetic product description. " * rng.randint(1, 20),
+            category=rng.choice(["Poetry", "Mystery", "Travel", "Fiction"]),
+            image_url=f"{BASE_URL}media/cache/{i:032x}.jpg",
+            sku=f"{i:016x}",
+            specifications={"UPC": f"{i:016x}", "Product Type": "Books", "Tax": "£0.00"},
+            breadcrumbs="Home > Books > Fiction",
+            price_text=price,
+            rating_text=f"star-rating {rating}",
+        ))
+    return products
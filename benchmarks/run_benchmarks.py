@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Offline microbenchmarks for the parsers, normalization and exporters.
+
+Runs against the checked-in books_toscrape fixtures and larger synthetic
+pages, never the network. Reports time per item, throughput and peak
+memory; with --baseline, exits non-zero when a benchmark got slower.
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --quick --filter parse
+    python benchmarks/run_benchmarks.py --json bench.json
+    python benchmarks/run_benchmarks.py --baseline bench.json --tolerance 0.25
+"""
+
+import argparse
+import gc
+import json
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add the repository root and src to the Python path
+root_path = Path(__file__).parent.parent
+sys.path.insert(0, str(root_path))
+sys.path.insert(0, str(root_path / "src"))
+
+from benchmarks.corpus import (BASE_URL, LISTING_URL, fixture_pages, large_listing_page,
+                               large_product_page, synthetic_products)
+from src.core.normalization import normalize_batch
+from src.core.product_batch import ProductBatch
+from src.exporters.excel_exporter import ExcelExporter
+from src.exporters.google_sheets_exporter import GoogleSheetsExporter
+from src.parsers.parser_factory import PARSER_BACKENDS, create_parser
+from src.utils.config_loader import ConfigLoader
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable[[], object]
+    items: int  # pages or rows handled by one call
+    unit: str = "page"
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    items: int
+    unit: str
+    seconds: float  # best time of one call
+    peak_kb: float  # peak traced allocation of one call
+
+    @property
+    def ms_per_item(self) -> float:
+        return self.seconds * 1000 / self.items
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else float("inf")
+
+
+def build_benchmarks(quick: bool = False) -> List[Benchmark]:
+    """Parsing benchmarks for every backend, then normalization and export row preparation"""
+    website_config = ConfigLoader.load_website_config("books_toscrape")
+    pages = fixture_pages()
+    listings = {name: html for name, html in pages.items() if name.startswith("listing")}
+    products = {name: html for name, html in pages.items() if name.startswith("product")}
+    listings["synthetic_listing_large"] = large_listing_page(200 if quick else 1000)
+    products["synthetic_product_large"] = large_product_page(20 if quick else 200, 20 if quick else 200)
+
+    benchmarks = []
+    for backend in PARSER_BACKENDS:
+        parser = create_parser(backend, website_config["base_url"], website_config["selectors"],
+                               website_config.get("url_canonicalization"))
+        for name, html in products.items():
+            url = f"{BASE_URL}catalogue/{name}/index.html"
+            benchmarks.append(Benchmark(f"parse_product_page[{backend}:{name}]",
+                                        lambda p=parser, h=html, u=url: p.parse_product_page(h, u), 1))
+        for name, html in listings.items():
+            benchmarks.append(Benchmark(f"extract_product_links[{backend}:{name}]",
+                                        lambda p=parser, h=html: p.extract_product_links(h, LISTING_URL), 1))
+
+    rows = 2_000 if quick else 100_000
+    items = synthetic_products(rows)
+    batch = ProductBatch.from_products(items)
+    benchmarks.append(Benchmark("product_batch_from_products", lambda: ProductBatch.from_products(items),
+                                rows, "row"))
+    benchmarks.append(Benchmark("normalize_batch", lambda: normalize_batch(batch), rows, "row"))
+
+    export_rows = 1_000 if quick else 20_000
+    export_items = items[:export_rows]
+    # One fixed scratch directory, overwritten by every run
+    excel = ExcelExporter(str(Path(tempfile.gettempdir()) / "scraper_benchmarks"))
+    sheets = GoogleSheetsExporter(client=object())
+    benchmarks.append(Benchmark("excel_export", lambda: excel.export_products(export_items, "bench.xlsx"),
+                                export_rows, "row"))
+    benchmarks.append(Benchmark("sheets_prepare_rows", lambda: sheets._prepare_data(export_items),
+                                export_rows, "row"))
+    return benchmarks
+
+
+def run_benchmark(benchmark: Benchmark, min_time: float = 0.5, max_calls: int = 1000) -> BenchmarkResult:
+    """Best time over repeated calls, then one traced call for peak memory"""
+    benchmark.func()  # warm up caches and lazy imports
+
+    best, calls, started = float("inf"), 0, time.perf_counter()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while calls < max_calls and (calls < 3 or time.perf_counter() - started < min_time):
+            t0 = time.perf_counter()
+            benchmark.func()
+            best = min(best, time.perf_counter() - t0)
+            calls += 1
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    # Tracing slows allocation down, so memory is measured separately
+    tracemalloc.start()
+    try:
+        benchmark.func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(benchmark.name, benchmark.items, benchmark.unit, best, peak / 1024)
+
+
+def compare(results: List[BenchmarkResult], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Benchmarks slower than the baseline by more than ``tolerance``"""
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous and result.seconds > previous["seconds"] * (1 + tolerance):
+            change = result.seconds / previous["seconds"] - 1
+            regressions.append(f"{result.name}: {previous['seconds'] * 1000:.3f} ms -> "
+                               f"{result.seconds * 1000:.3f} ms (+{change:.0%})")
+    return regressions
+
+
+def print_table(results: List[BenchmarkResult]) -> None:
+    width = max(len(result.name) for result in results)
+    print(f"{'benchmark':<{width}}  {'ms/item':>10}  {'items/s':>12}  {'peak KiB':>10}")
+    for result in results:
+        print(f"{result.name:<{width}}  {result.ms_per_item:>10.4f}  "
+              f"{result.items_per_second:>10,.0f}/{result.unit[0]}  {result.peak_kb:>10,.0f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline parser and exporter benchmarks")
+    parser.add_argument("--quick", action="store_true", help="Smaller synthetic inputs and shorter runs")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--json", metavar="PATH", help="Write the results to a JSON file")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare with a JSON file from an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown against the baseline (default 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    # Per-page INFO logs would dominate the measurements
+    logging.disable(logging.INFO)
+
+    benchmarks = [b for b in build_benchmarks(args.quick) if args.filter in b.name]
+    min_time = 0.1 if args.quick else 0.5
+    results = [run_benchmark(benchmark, min_time=min_time) for benchmark in benchmarks]
+    if not results:
+        print("No benchmarks matched")
+        return 1
+    print_table(results)
+
+    if args.json:
+        data = {result.name: {**asdict(result), "ms_per_item": result.ms_per_item,
+                              "items_per_second": result.items_per_second} for result in results}
+        Path(args.json).write_text(json.dumps(data, indent=2))
+
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,78 +12,195 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-def run_cli():
+def run_distributed(scraper, role, frontier_url=None):
+    """
+    Seed the shared frontier, work on it as a crawl worker, or collect the
+    products the workers stored. Only "collect" returns products.
+    """
+    from src.core.crawl_worker import CrawlWorker
+    from src.core.shared_frontier import open_frontier
+
+    config = scraper.scraping_config
+    frontier_url = (frontier_url or config.frontier_url).format(site=scraper.website_config.get('name', 'site'))
+    frontier = open_frontier(frontier_url)
+    worker = CrawlWorker(scraper, frontier, batch_size=config.worker_batch_size,
+                         lease_seconds=config.lease_seconds)
+    try:
+        if role == 'seed':
+            worker.seed()
+        elif role == 'work':
+            worker.run()
+        else:
+            return worker.collect()
+        return None
+    finally:
+        frontier.close()
+
+def profiler_options(modes, sample_every=1):
+    """StageProfiler arguments for a --profile value such as "sample" or "cprofile,memory" """
+    modes = {mode.strip() for mode in modes.split(',') if mode.strip()}
+    unknown = modes - {'sample', 'cprofile', 'memory'}
+    if unknown:
+        raise ValueError(f"Unknown profiling mode(s): {', '.join(sorted(unknown))}")
+    cpu = 'cprofile' if 'cprofile' in modes else 'sample' if 'sample' in modes else None
+    return {'cpu': cpu, 'memory': 'memory' in modes, 'sample_every': sample_every}
+
+def run_cli(resume=False, distributed=None, frontier_url=None, metrics_path=None, profile=None,
+            profile_every=1, log_json=None):
     """Run in command line mode"""
+    from datetime import datetime
+    from src.core.data_models import ScrapingConfig
     from src.core.scraper_engine import ScraperEngine
     from src.exporters.excel_exporter import ExcelExporter
-    from src.exporters.google_sheets_exporter import GoogleSheetsExporter  # Add this
+    from src.exporters.csv_exporter import CSVExporter
+    from src.exporters.jsonl_exporter import JSONLinesExporter
+    from src.exporters.parquet_exporter import ParquetExporter
+    from src.exporters.google_sheets_exporter import GoogleSheetsExporter, spreadsheet_title
     from src.exporters.image_downloader import ImageDownloader
+    from src.exporters.image_processor import ImageProcessor
     from src.utils.config_loader import ConfigLoader
-    from src.utils.logger import setup_logger
+    from src.utils.logger import configure_logging, setup_logger
+    from src.utils.profiling import profile_stage
 
     logger = setup_logger("main")
     logger.info("Starting E-commerce Scraper in CLI mode...")
+    profiler = None
     
     try:
         # Load configuration
         config = ConfigLoader.load_config()
         logger.info("Configuration loaded successfully")
         
+        # One background log writer; per-URL messages are sampled
+        log_config = config.get('logging', {})
+        configure_logging(json_path=log_json or log_config.get('json_path'),
+                          sampling=log_config.get('sampling'))
+        
         # Load website-specific configuration
         website_config = ConfigLoader.load_website_config("books_toscrape")
         logger.info(f"Loaded configuration for: {website_config.get('name')}")
         
         # Initialize scraper
-        scraper = ScraperEngine(website_config)
+        scraper = ScraperEngine(website_config, ScrapingConfig(metrics_path=metrics_path))
+        metrics = scraper.metrics
+        if profile:
+            profiler = scraper.enable_profiling(**profiler_options(profile, profile_every))
         
-        # Start scraping
-        products = scraper.scrape_catalog()
+        # Start scraping, or take part in a distributed crawl
+        if distributed:
+            products = run_distributed(scraper, distributed, frontier_url)
+            if distributed != 'collect':
+                return
+        else:
+            products = scraper.scrape_catalog(resume=resume)
         
         # Export results
         if products:
-            # Export to Excel
-            exporter = ExcelExporter()
-            output_file = exporter.export_products(products)
-            logger.info(f"Successfully exported {len(products)} products to {output_file}")
-            
-            # Export to Google Sheets if enabled
-            if config['export']['google_sheets']['enabled']:
-                gsheets_exporter = GoogleSheetsExporter()
-                spreadsheet_url = gsheets_exporter.export_products(products)
-                if spreadsheet_url:
-                    logger.info(f"Exported to Google Sheets: {spreadsheet_url}")
-                else:
-                    logger.warning("Google Sheets export failed - check credentials")
+            with profile_stage(profiler, 'export'):
+                # Export to Excel
+                exporter = ExcelExporter(metrics=metrics)
+                output_file = exporter.export_products(products)
+                logger.info(f"Successfully exported {len(products)} products to {output_file}")
+                
+                # Export to the local analytics formats if enabled
+                for format_name, exporter_class in (('csv', CSVExporter),
+                                                    ('jsonl', JSONLinesExporter),
+                                                    ('parquet', ParquetExporter)):
+                    format_config = config['export'].get(format_name, {})
+                    if format_config.get('enabled'):
+                        exporter = exporter_class(format_config.get('output_path', './exports'), metrics=metrics)
+                        logger.info(f"Exported {format_name} to {exporter.export_products(products)}")
+                
+                # Export to Google Sheets if enabled
+                sheets_config = config['export']['google_sheets']
+                if sheets_config['enabled']:
+                    # Incremental runs need a stable name to find last run's spreadsheet
+                    incremental = sheets_config.get('incremental', False)
+                    gsheets_exporter = GoogleSheetsExporter(metrics=metrics)
+                    spreadsheet_url = gsheets_exporter.export_products(
+                        products,
+                        spreadsheet_name=spreadsheet_title(
+                            sheets_config.get('spreadsheet_name', 'Scraped Products {timestamp}'), incremental),
+                        worksheet_name=sheets_config.get('worksheet_name', 'Products'),
+                        incremental=incremental
+                    )
+                    if spreadsheet_url:
+                        logger.info(f"Exported to Google Sheets: {spreadsheet_url}")
+                    else:
+                        logger.warning("Google Sheets export failed - check credentials")
             
-            # Download images
-            image_downloader = ImageDownloader()
-            downloaded_images = image_downloader.download_product_images(products)
-            logger.info(f"Downloaded {len(downloaded_images)} product images")
+            with profile_stage(profiler, 'images'):
+                # Download images
+                image_downloader = ImageDownloader(metrics=metrics)
+                downloaded_images = image_downloader.download_product_images(products)
+                logger.info(f"Downloaded {len(downloaded_images)} product images")
+                
+                # Resize, recompress and thumbnail the images if enabled
+                post_processing = config['export'].get('images', {}).get('post_processing', {})
+                if post_processing.get('enabled') and downloaded_images:
+                    options = {key: value for key, value in post_processing.items() if key != 'enabled'}
+                    ImageProcessor(**options).process_images(list(dict.fromkeys(downloaded_images)))
         else:
             logger.warning("No products were scraped")
         
+        # Write the new/changed/removed feed when change detection is on
+        if scraper.change_tracker and not distributed:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            scraper.change_tracker.write_change_feed(f"exports/changes_{timestamp}.jsonl")
+        
         # Save progress for potential resumption
         scraper.save_progress()
         
+        # The engine logged the crawl summary; the file also gets the export timings
+        if metrics_path:
+            metrics.write(metrics_path.format(site=website_config.get('name', 'site')))
+        
     except Exception as e:
         logger.error(f"Application failed: {e}")
         sys.exit(1)
+    finally:
+        # Write the profile reports even when the run failed
+        if profiler:
+            scraper.disable_profiling()
 
 def main():
     """Main entry point with mode selection"""
     parser = argparse.ArgumentParser(description='E-commerce Product Scraper')
     parser.add_argument('--gui', action='store_true', help='Run in GUI mode')
     parser.add_argument('--cli', action='store_true', help='Run in CLI mode')
+    parser.add_argument('--resume', action='store_true',
+                        help='Resume an interrupted CLI scrape from its checkpoint')
+    parser.add_argument('--distributed', choices=('seed', 'work', 'collect'),
+                        help='Distributed crawl: queue product URLs in the shared frontier, '
+                             'scrape URLs claimed from it, or export what the workers scraped')
+    parser.add_argument('--frontier', metavar='URL',
+                        help='Shared frontier, sqlite:///path or redis://host:6379/0 '
+                             '(default: sqlite:///checkpoints/<site>_frontier.sqlite3)')
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='Write a metrics snapshot during the run, Prometheus text for .prom files '
+                             'and JSON otherwise (e.g. logs/metrics.prom)')
+    parser.add_argument('--log-json', metavar='PATH',
+                        help='Also write the logs as JSON lines to PATH (e.g. logs/scraper.jsonl)')
+    parser.add_argument('--profile', nargs='?', const='sample', metavar='MODES',
+                        help='Profile the run per stage into logs/profile/: "sample" (low-overhead stack '
+                             'sampling, the default), "cprofile", "memory" (tracemalloc), comma-separated')
+    parser.add_argument('--profile-every', type=int, metavar='N',
+                        help='With cprofile/memory, only instrument every Nth entry of a stage (default 1)')
     
     args = parser.parse_args()
     
-    if args.gui or (not args.cli and not args.gui):
+    # Any scrape option asks for a CLI run, not just --cli
+    cli_options = (args.resume, args.distributed, args.frontier, args.metrics, args.log_json,
+                   args.profile, args.profile_every)
+    if args.gui or not (args.cli or any(cli_options)):
         # Default to GUI if no arguments or --gui specified
         from src.interface.gui_interface import run_gui
         run_gui()
     else:
         # Run in CLI mode
-        run_cli()
+        run_cli(resume=args.resume, distributed=args.distributed, frontier_url=args.frontier,
+                metrics_path=args.metrics, profile=args.profile, profile_every=args.profile_every or 1,
+                log_json=args.log_json)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
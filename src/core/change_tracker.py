@@ -0,0 +1,153 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.core.data_models import Product
+from src.utils.logger import setup_logger
+
+
+def _without_timestamp(product_data: dict) -> dict:
+    return {key: value for key, value in product_data.items() if key != 'scraped_timestamp'}
+
+
+class ChangeTracker:
+    """
+    Remembers a fingerprint of every product page and the Product parsed
+    from it, so unchanged pages can skip parsing on later runs.
+
+    The fingerprint covers the configured page region (``region`` CSS
+    selector, whole page if not set or not found) plus the parser settings,
+    so changing selectors re-parses everything. Each run also builds a
+    change feed of new, changed and removed products.
+    """
+
+    def __init__(self, path: str = "cache/products.sqlite3", region: Optional[str] = None,
+                 parser_signature: str = ""):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.region = region
+        self.parser_signature = parser_signature.encode('utf-8')
+        self.logger = setup_logger(__name__)
+        self._lock = threading.Lock()
+        self._region_selector = None
+
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS products (
+                url TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                product TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._db.commit()
+
+        # Change feed of the current run
+        self.new: List[Product] = []
+        self.changed: List[Product] = []
+        self.removed: List[str] = []
+        self.unchanged = 0
+
+    def fingerprint(self, html: str) -> str:
+        """Hash of the relevant page region and the parser settings"""
+        digest = hashlib.blake2b(self.parser_signature, digest_size=16)
+        digest.update(self._region_bytes(html))
+        return digest.hexdigest()
+
+    def _region_bytes(self, html: str) -> bytes:
+        if self.region:
+            try:
+                from lxml import etree
+                from lxml.cssselect import CSSSelector
+                from src.parsers.link_extractor import parse_document
+
+                if self._region_selector is None:
+                    self._region_selector = CSSSelector(self.region, translator='html')
+                elements = self._region_selector(parse_document(html))
+                if elements:
+                    return etree.tostring(elements[0])
+            except Exception as e:
+                self.logger.debug(f"Region fingerprint failed, hashing whole page: {e}")
+        return html.encode('utf-8')
+
+    def unchanged_product(self, url: str, fingerprint: str) -> Optional[Product]:
+        """Stored Product for a page whose fingerprint has not changed"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT product FROM products WHERE url = ? AND fingerprint = ?", (url, fingerprint)
+            ).fetchone()
+        if row is None:
+            return None
+
+        self.unchanged += 1
+        product_data = json.loads(row[0])
+        # The data is reused, the timestamp records this run's check
+        product_data.pop('scraped_timestamp', None)
+        return Product(**product_data)
+
+    def record(self, url: str, fingerprint: str, product: Product) -> None:
+        """Store a freshly parsed product and add it to the change feed"""
+        product_data = product.to_dict()
+        with self._lock:
+            row = self._db.execute("SELECT product FROM products WHERE url = ?", (url,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?)",
+                (url, fingerprint, json.dumps(product_data), time.time())
+            )
+            self._db.commit()
+
+        if row is None:
+            self.new.append(product)
+        elif _without_timestamp(json.loads(row[0])) != _without_timestamp(product_data):
+            self.changed.append(product)
+        else:
+            # The page changed outside the extracted fields
+            self.unchanged += 1
+
+    def finish_run(self, discovered_urls: Optional[Iterable[str]]) -> None:
+        """
+        Forget products that were not discovered in this run. Pass None when
+        discovery was partial (e.g. max_products) to skip removal detection.
+        """
+        if discovered_urls is None:
+            self.logger.info(f"Changes: {len(self.new)} new, {len(self.changed)} changed, "
+                             f"{self.unchanged} unchanged (removals not checked)")
+            return
+
+        discovered = set(discovered_urls)
+        with self._lock:
+            stored = [row[0] for row in self._db.execute("SELECT url FROM products")]
+            self.removed = [url for url in stored if url not in discovered]
+            self._db.executemany("DELETE FROM products WHERE url = ?", ((url,) for url in self.removed))
+            self._db.commit()
+
+        self.logger.info(f"Changes: {len(self.new)} new, {len(self.changed)} changed, "
+                         f"{len(self.removed)} removed, {self.unchanged} unchanged")
+
+    def summary(self) -> Dict[str, int]:
+        return {'new': len(self.new), 'changed': len(self.changed),
+                'removed': len(self.removed), 'unchanged': self.unchanged}
+
+    def write_change_feed(self, filepath: str) -> str:
+        """Write the run's changes as JSON lines"""
+        path = Path(filepath)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for change, products in (('new', self.new), ('changed', self.changed)):
+                for product in products:
+                    f.write(json.dumps({'change': change, 'product_url': product.product_url,
+                                        'product': product.to_dict()}) + '\n')
+            for url in self.removed:
+                f.write(json.dumps({'change': 'removed', 'product_url': url}) + '\n')
+
+        self.logger.info(f"Change feed written to {path}")
+        return str(path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,116 @@
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.core.data_models import Product
+from src.utils.logger import setup_logger
+
+
+@dataclass
+class CheckpointState:
+    """What a journal says about an interrupted crawl"""
+    frontier: Optional[List[str]] = None
+    products: Dict[str, Dict] = field(default_factory=dict)
+    failed: List[str] = field(default_factory=list)
+    finished: bool = False
+
+    def remaining_urls(self) -> List[str]:
+        """Frontier URLs without a product yet (failed ones are retried)"""
+        if self.frontier is None:
+            return []
+        return [url for url in self.frontier if url not in self.products]
+
+    def restored_products(self) -> List[Product]:
+        """Products already scraped, in frontier order"""
+        order = {url: i for i, url in enumerate(self.frontier or [])}
+        urls = sorted(self.products, key=lambda url: order.get(url, len(order)))
+        return [Product(**self.products[url]) for url in urls]
+
+
+class CheckpointJournal:
+    """
+    Append-only JSON lines journal of a crawl.
+
+    Records the discovered frontier once, then one line per completed or
+    failed product URL, so a crash loses at most the line being written.
+    Every line is flushed to the OS as soon as it is written.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.logger = setup_logger(__name__)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def start(self, site_name: str) -> None:
+        """Begin a new crawl, discarding any previous journal"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.close()
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._write({'type': 'start', 'site': site_name, 'timestamp': time.time()})
+
+    def resume(self) -> None:
+        """Continue appending to an existing journal"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.close()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._write({'type': 'resume', 'timestamp': time.time()})
+
+    def record_frontier(self, urls: List[str]) -> None:
+        self._write({'type': 'frontier', 'urls': urls})
+
+    def record_product(self, url: str, product: Product) -> None:
+        self._write({'type': 'done', 'url': url, 'product': product.to_dict()})
+
+    def record_failure(self, url: str) -> None:
+        self._write({'type': 'failed', 'url': url})
+
+    def finish(self) -> None:
+        self._write({'type': 'finished', 'timestamp': time.time()})
+        self.close()
+
+    def _write(self, record: dict) -> None:
+        if self._file is None:
+            return
+        with self._lock:
+            self._file.write(json.dumps(record) + '\n')
+            self._file.flush()
+
+    def load(self) -> Optional[CheckpointState]:
+        """Replay the journal. Returns None if there is no journal"""
+        if not self.path.exists():
+            return None
+
+        state = CheckpointState()
+        failed = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave the last line half written
+                    self.logger.warning(f"Skipping unreadable journal line in {self.path}")
+                    continue
+
+                kind = record.get('type')
+                if kind == 'frontier':
+                    state.frontier = record['urls']
+                elif kind == 'done':
+                    state.products[record['url']] = record['product']
+                    failed.pop(record['url'], None)
+                elif kind == 'failed':
+                    failed[record['url']] = None
+                elif kind == 'finished':
+                    state.finished = True
+
+        state.failed = list(failed)
+        return state
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
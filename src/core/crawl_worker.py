@@ -0,0 +1,88 @@
+import os
+import socket
+import time
+import uuid
+from typing import List, Optional
+
+from src.core.data_models import Product
+from src.core.scraper_engine import ScraperEngine
+from src.core.shared_frontier import LEASED, PENDING, SharedFrontier
+from src.utils.logger import setup_logger
+
+
+class CrawlWorker:
+    """
+    Scrapes product URLs claimed from a shared frontier.
+
+    Start any number of workers, in any number of processes or machines,
+    against the same frontier. Each one claims ``batch_size`` URLs at a
+    time, scrapes them with its engine and reports every result back,
+    renewing its leases while the batch is still running.
+    """
+
+    def __init__(self, engine: ScraperEngine, frontier: SharedFrontier, worker_id: Optional[str] = None,
+                 batch_size: int = 50, lease_seconds: float = 300.0, max_attempts: int = 3,
+                 poll_interval: float = 5.0):
+        self.engine = engine
+        self.frontier = frontier
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.logger = setup_logger(__name__)
+
+    def seed(self, start_url: Optional[str] = None) -> int:
+        """Discover product URLs from the listing pages and queue them"""
+        added = self.frontier.add_urls(self.engine.discover_product_urls(start_url))
+        self.logger.info(f"Queued {added} new product URLs")
+        return added
+
+    def run(self, max_batches: Optional[int] = None) -> int:
+        """
+        Claim and scrape batches until nothing is pending or leased by
+        another worker. While other workers hold leases, poll: their URLs
+        come back if they crash. Returns the number of products scraped.
+        """
+        scraped, batches = 0, 0
+        self.logger.info(f"Worker {self.worker_id} started")
+
+        while max_batches is None or batches < max_batches:
+            urls = self.frontier.claim(self.worker_id, self.batch_size, self.lease_seconds, self.max_attempts)
+            if not urls:
+                stats = self.frontier.stats()
+                if not (stats[PENDING] or stats[LEASED]):
+                    break
+                time.sleep(self.poll_interval)
+                continue
+
+            scraped += self._scrape_batch(urls)
+            batches += 1
+
+        self.logger.info(f"Worker {self.worker_id} finished: {scraped} products in {batches} batches")
+        return scraped
+
+    def _scrape_batch(self, urls: List[str]) -> int:
+        scraped = 0
+        # Renew when half the lease has passed, so a slow batch keeps its URLs
+        renew_at = time.time() + self.lease_seconds / 2
+
+        for done, (url, product) in enumerate(self.engine.iter_product_pages(urls), start=1):
+            self._report(url, product)
+            scraped += product is not None
+
+            if time.time() >= renew_at:
+                self.frontier.renew(self.worker_id, urls[done:], self.lease_seconds)
+                renew_at = time.time() + self.lease_seconds / 2
+
+        return scraped
+
+    def _report(self, url: str, product: Optional[Product]) -> None:
+        if product:
+            self.frontier.complete(self.worker_id, url, product.to_dict())
+        else:
+            self.frontier.fail(self.worker_id, url, self.max_attempts)
+
+    def collect(self) -> List[Product]:
+        """Products all workers stored in the frontier, normalized like a local scrape"""
+        return self.engine.normalize_products([Product(**product) for _, product in self.frontier.products()])
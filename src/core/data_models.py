@@ -4,7 +4,7 @@ from datetime import datetime
 
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     product_url:str
     product_name: str
@@ -19,6 +19,10 @@ class Product:
     #brand:Optional[str] = None
     specifications: Optional[Dict[str, str]] = None
     breadcrumbs: Optional[str] = None
+    price_amount: Optional[float] = None  # filled by batch normalization
+    price_currency: Optional[str] = None  # ISO 4217 code, filled by batch normalization
+    price_text: Optional[str] = None  # price as shown on the page
+    rating_text: Optional[str] = None  # rating text or class, e.g. "star-rating Three"
     scraped_timestamp: str = None #datetime.utcnow().isoformat()
 
 
@@ -41,14 +45,32 @@ class Product:
             #"brand": self.brand,
             "specifications": self.specifications,
             "breadcrumbs": self.breadcrumbs,
+            "price_amount": self.price_amount,
+            "price_currency": self.price_currency,
+            "price_text": self.price_text,
+            "rating_text": self.rating_text,
             "scraped_timestamp": self.scraped_timestamp
         }
     
 @dataclass
 class ScrapingConfig:
     delay_between_requests: float = 1.0  # seconds
+    burst: int = 1  # requests allowed back-to-back before pacing kicks in
     timeout: int = 30 
     retry_attempts: int = 3
     max_products: Optional[int] = None  # None means no limit
+    engine: str = "sync"  # "sync", "async" or "pipeline"
+    parser_workers: Optional[int] = None  # parser processes (pipeline engine), None means CPU count
+    pipeline_queue_size: int = 64  # fetched pages waiting to be parsed (pipeline engine)
+    cache: Optional[Dict[str, Any]] = None  # HTTP cache: enabled, path, ttl_seconds, max_size_mb
+    max_concurrency_per_host: int = 8  # in-flight requests per host
+    adaptive: Optional[Dict[str, Any]] = None  # AIMD per-host concurrency/rate: enabled, min/max limits, factors
+    checkpoint_path: Optional[str] = "checkpoints/{site}.jsonl"  # crawl journal for resume, None disables
+    normalize: bool = True  # batch-normalize price and rating after scrape_catalog / in iter_batches
+    frontier_url: str = "sqlite:///checkpoints/{site}_frontier.sqlite3"  # shared frontier of crawl workers
+    worker_batch_size: int = 50  # URLs a crawl worker claims at a time
+    lease_seconds: float = 300.0  # claimed URLs return to the frontier if not reported back in time
+    metrics_path: Optional[str] = None  # metrics snapshot written during a run, e.g. "logs/metrics_{site}.prom" (else JSON)
+    metrics_interval: float = 10.0  # seconds between metrics snapshots
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36" # (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
     
\ No newline at end of file
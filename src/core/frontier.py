@@ -0,0 +1,99 @@
+import math
+from hashlib import blake2b
+from typing import Any, Dict, Optional, Set
+
+FRONTIER_MODES = ('set', 'bloom')
+
+
+class BloomFilter:
+    """
+    Fixed-size probabilistic set of strings.
+
+    Memory is set by ``capacity`` and ``error_rate`` up front (about 1.2 MB
+    per million items at 1%) and never grows. Membership checks have no
+    false negatives; about ``error_rate`` of new items are wrongly reported
+    as already seen once ``capacity`` items have been added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("Bloom filter capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Optimal bit count and number of hash functions for the target rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> bool:
+        """Add an item. Returns False if it was (probably) already present."""
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class UrlFrontier:
+    """
+    Seen-set of discovered URLs.
+
+    "set" mode keeps every URL for exact membership. "bloom" mode keeps a
+    Bloom filter instead, so memory stays bounded for crawls of tens of
+    millions of URLs, at the cost of skipping about ``error_rate`` of
+    unseen URLs.
+    """
+
+    def __init__(self, mode: str = 'set', capacity: int = 10_000_000, error_rate: float = 0.001):
+        if mode not in FRONTIER_MODES:
+            raise ValueError(f"Unknown frontier mode '{mode}' (use one of {', '.join(FRONTIER_MODES)})")
+        self.mode = mode
+        self._seen: Optional[Set[str]] = set() if mode == 'set' else None
+        self._bloom = BloomFilter(capacity, error_rate) if mode == 'bloom' else None
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "UrlFrontier":
+        """Build from a website template's "frontier" block"""
+        config = config or {}
+        return cls(
+            mode=config.get('mode', 'set'),
+            capacity=config.get('capacity', 10_000_000),
+            error_rate=config.get('error_rate', 0.001),
+        )
+
+    def add(self, url: str) -> bool:
+        """Mark a URL as seen. Returns True if it was new."""
+        if self._bloom is not None:
+            return self._bloom.add(url)
+        if url in self._seen:
+            return False
+        self._seen.add(url)
+        return True
+
+    def __contains__(self, url: str) -> bool:
+        return url in (self._bloom if self._bloom is not None else self._seen)
+
+    def __len__(self) -> int:
+        return len(self._bloom if self._bloom is not None else self._seen)
@@ -0,0 +1,133 @@
+from typing import Dict, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.core.product_batch import ProductBatch
+
+# Currency symbols and the ISO 4217 codes they stand for; longer symbols
+# first so "US$" wins over "$"
+CURRENCY_SYMBOLS = {
+    'US$': 'USD', 'C$': 'CAD', 'A$': 'AUD', 'NZ$': 'NZD', 'R$': 'BRL', 'HK$': 'HKD',
+    'zł': 'PLN', 'kr': 'SEK', 'Kč': 'CZK', 'CHF': 'CHF',
+    '$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY', '₹': 'INR', '₽': 'RUB',
+    '₩': 'KRW', '₺': 'TRY', '₪': 'ILS', '₫': 'VND', '₱': 'PHP', '฿': 'THB',
+}
+# ISO codes recognised when written out ("USD 12.00")
+CURRENCY_CODES = sorted(set(CURRENCY_SYMBOLS.values()) | {'AED', 'DKK', 'MXN', 'NOK', 'SGD', 'ZAR'})
+CURRENCY_PATTERN = '|'.join(
+    sorted((symbol.replace('$', r'\$') for symbol in CURRENCY_SYMBOLS), key=len, reverse=True)
+)
+# First number in a price, with thousands / decimal separators
+PRICE_NUMBER = r'(?P<number>\d(?:[\d.,\'\s  ]*\d)?)'
+RATING_WORDS = ['zero', 'one', 'two', 'three', 'four', 'five']
+
+
+def _field(matches: pa.Array, name: str) -> pa.Array:
+    """Named group of an extract_regex result, null where nothing matched"""
+    return pc.if_else(pc.is_valid(matches), pc.struct_field(matches, name), pa.scalar(None, pa.string()))
+
+
+def parse_prices(texts: pa.Array, decimal: Optional[str] = None,
+                 default_currency: Optional[str] = None) -> Dict[str, pa.Array]:
+    """
+    Parse price texts such as "£51.77", "1.234,56 €" or "USD 1,299" into
+    ``price_amount`` (float64) and ``price_currency`` (ISO code) columns.
+
+    A separator followed by exactly three digits ("1,234") is ambiguous;
+    it is read as a thousands separator unless ``decimal`` says that the
+    site writes decimals that way.
+    """
+    texts = pc.cast(texts, pa.string())
+
+    # Catalogs repeat the same prices a lot: parse each distinct text once
+    distinct = pc.unique(texts)
+    if len(distinct) * 2 < len(texts):
+        positions = pc.index_in(texts, value_set=distinct)
+        parsed = parse_prices(distinct, decimal=decimal, default_currency=default_currency)
+        return {name: pc.take(column, positions) for name, column in parsed.items()}
+
+    # Currency: ISO code in the text, else a known symbol
+    codes = _field(pc.extract_regex(texts, r'\b(?P<code>[A-Z]{3})\b'), 'code')
+    symbols = _field(pc.extract_regex(texts, f'(?P<symbol>{CURRENCY_PATTERN})'), 'symbol')
+    symbol_codes = pc.take(pa.array(list(CURRENCY_SYMBOLS.values())),
+                           pc.index_in(symbols, value_set=pa.array(list(CURRENCY_SYMBOLS))))
+    known_codes = pc.if_else(pc.is_in(codes, value_set=pa.array(CURRENCY_CODES)), codes,
+                             pa.scalar(None, pa.string()))
+    currency = pc.coalesce(known_codes, symbol_codes)
+    if default_currency:
+        currency = pc.coalesce(currency, pa.scalar(default_currency))
+
+    # Amount: drop grouping spaces, then decide what the separators mean
+    numbers = _field(pc.extract_regex(texts, PRICE_NUMBER), 'number')
+    numbers = pc.replace_substring_regex(numbers, r"['\s  ]", '')
+
+    last_is_comma = pc.match_substring_regex(numbers, r',\d*$')
+    single_group = pc.match_substring_regex(numbers, r'^\d{1,3}[.,]\d{3}$')
+    comma_groups = pc.match_substring_regex(numbers, r'^\d{1,3}(,\d{3}){2,}$')
+    dot_groups = pc.match_substring_regex(numbers, r'^\d{1,3}(\.\d{3}){2,}$')
+    if decimal == ',':
+        comma_decimal = pc.or_(
+            pc.and_(last_is_comma, pc.invert(comma_groups)),
+            pc.or_(dot_groups, pc.and_(single_group, pc.invert(last_is_comma)))
+        )
+    else:
+        comma_decimal = pc.or_(
+            pc.and_(last_is_comma, pc.and_(pc.invert(single_group), pc.invert(comma_groups))),
+            dot_groups
+        )
+
+    amounts = pc.if_else(
+        comma_decimal,
+        pc.replace_substring(pc.replace_substring(numbers, '.', ''), ',', '.'),
+        pc.replace_substring(numbers, ',', '')
+    )
+    # Leftover oddities ("1.2.3") become null rather than failing the batch
+    amounts = pc.if_else(pc.match_substring_regex(amounts, r'^\d+(\.\d+)?$'), amounts,
+                         pa.scalar(None, pa.string()))
+
+    return {'price_amount': pc.cast(amounts, pa.float64()), 'price_currency': currency}
+
+
+def parse_ratings(texts: pa.Array) -> pa.Array:
+    """
+    Ratings from text such as "4.5 out of 5" or icon classes such as
+    "star-rating Three", as float64
+    """
+    texts = pc.utf8_lower(pc.cast(texts, pa.string()))
+    words = _field(pc.extract_regex(texts, rf"\b(?P<word>{'|'.join(RATING_WORDS)})\b"), 'word')
+    word_ratings = pc.cast(pc.index_in(words, value_set=pa.array(RATING_WORDS)), pa.float64())
+    numbers = _field(pc.extract_regex(texts, r'(?P<number>\d+(?:\.\d+)?)'), 'number')
+    return pc.coalesce(pc.cast(numbers, pa.float64()), word_ratings)
+
+
+def normalize_batch(batch: ProductBatch, decimal: Optional[str] = None,
+                    default_currency: Optional[str] = None) -> ProductBatch:
+    """
+    Fill ``price_amount``, ``price_currency`` and missing ``rating`` values
+    of a whole batch with column operations
+    """
+    table = batch.to_arrow()
+    prices = parse_prices(pc.coalesce(table.column('price_text'), table.column('price')),
+                          decimal=decimal, default_currency=default_currency)
+    rating = pc.coalesce(table.column('rating'), parse_ratings(table.column('rating_text')))
+
+    for name, column in (('price_amount', prices['price_amount']),
+                         ('price_currency', prices['price_currency']),
+                         ('rating', rating)):
+        table = table.set_column(table.schema.get_field_index(name), name, column)
+    return ProductBatch(table)
+
+
+def normalize_frame(frame, decimal: Optional[str] = None, default_currency: Optional[str] = None):
+    """``normalize_batch`` for a pandas DataFrame of ``Product.to_dict()`` rows"""
+    frame = frame.copy()
+    price_text = frame['price_text'] if 'price_text' in frame else frame['price']
+    prices = parse_prices(pa.array(price_text.where(price_text.notna(), frame['price']), from_pandas=True),
+                          decimal=decimal, default_currency=default_currency)
+    frame['price_amount'] = prices['price_amount'].to_pandas()
+    frame['price_currency'] = prices['price_currency'].to_pandas()
+    if 'rating_text' in frame:
+        parsed = parse_ratings(pa.array(frame['rating_text'], type=pa.string(), from_pandas=True)).to_pandas()
+        frame['rating'] = frame['rating'].astype('float64').fillna(parsed) if 'rating' in frame else parsed
+    return frame
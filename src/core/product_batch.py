@@ -0,0 +1,105 @@
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List
+
+import pyarrow as pa
+
+from src.core.data_models import Product
+
+# Column types for Product.to_dict(); specifications keys differ per
+# product, so they are stored as a nested map column
+PRODUCT_SCHEMA = pa.schema([
+    ("product_url", pa.string()),
+    ("product_name", pa.string()),
+    ("price", pa.string()),
+    ("availability", pa.string()),
+    ("description", pa.string()),
+    ("rating", pa.float64()),
+    ("review_count", pa.int64()),
+    ("category", pa.string()),
+    ("image_url", pa.string()),
+    ("sku", pa.string()),
+    ("specifications", pa.map_(pa.string(), pa.string())),
+    ("breadcrumbs", pa.string()),
+    ("price_amount", pa.float64()),
+    ("price_currency", pa.string()),
+    ("price_text", pa.string()),
+    ("rating_text", pa.string()),
+    ("scraped_timestamp", pa.string()),
+])
+
+
+class ProductBatch:
+    """
+    Columnar batch of products backed by an Arrow table.
+
+    One contiguous buffer per column instead of one object per product.
+    Iterating yields ``Product`` objects and ``to_dicts()`` matches
+    ``Product.to_dict()``, so existing callers keep working, while
+    ``to_arrow()`` and ``to_pandas()`` hand the columns over without copying.
+    """
+
+    def __init__(self, table: pa.Table):
+        self.table = table
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product]) -> "ProductBatch":
+        """Build a batch column by column"""
+        products = products if isinstance(products, list) else list(products)
+        columns = {name: list(map(attrgetter(name), products)) for name in PRODUCT_SCHEMA.names}
+        try:
+            return cls(pa.Table.from_pydict(columns, schema=PRODUCT_SCHEMA))
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            # Specification values that are not strings (numbers from a parser)
+            columns["specifications"] = [
+                {str(key): str(item) for key, item in value.items()} if value else value
+                for value in columns["specifications"]
+            ]
+            return cls(pa.Table.from_pydict(columns, schema=PRODUCT_SCHEMA))
+
+    @classmethod
+    def concat(cls, batches: Iterable["ProductBatch"]) -> "ProductBatch":
+        """Join batches without copying their buffers"""
+        tables = [batch.table for batch in batches]
+        return cls(pa.concat_tables(tables) if tables else PRODUCT_SCHEMA.empty_table())
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __iter__(self) -> Iterator[Product]:
+        for batch in self.table.to_batches():
+            for row in batch.to_pylist():
+                yield self._product(row)
+
+    def __getitem__(self, index: int) -> Product:
+        if index < 0:
+            index += len(self)
+        return self._product(self.table.slice(index, 1).to_pylist()[0])
+
+    def column(self, name: str) -> pa.ChunkedArray:
+        return self.table.column(name)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Rows as ``Product.to_dict()`` dictionaries"""
+        return [self._row_dict(row) for row in self.table.to_pylist()]
+
+    def to_arrow(self) -> pa.Table:
+        return self.table
+
+    def to_pandas(self):
+        """
+        DataFrame backed by the batch's Arrow buffers (ArrowDtype columns),
+        so no column is converted or copied
+        """
+        import pandas as pd
+        return self.table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    @staticmethod
+    def _row_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+        # Arrow returns map values as key/value pairs
+        if row["specifications"] is not None:
+            row["specifications"] = dict(row["specifications"])
+        return row
+
+    @classmethod
+    def _product(cls, row: Dict[str, Any]) -> Product:
+        return Product(**cls._row_dict(row))
@@ -1,13 +1,52 @@
+import asyncio
+import multiprocessing
+import os
+import re
 import time
-from typing import List, Optional, Dict, Any
+from collections import deque
+from contextlib import aclosing
+from itertools import islice
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, AsyncIterator, Iterator, Tuple
 from pathlib import Path
 import json
 from tqdm import tqdm
 
+from src.core.change_tracker import ChangeTracker
+from src.core.checkpoint import CheckpointJournal
 from src.core.data_models import Product, ScrapingConfig
+from src.core.frontier import UrlFrontier
+from src.core.normalization import normalize_batch
+from src.core.product_batch import ProductBatch
 from src.utils.request_manager import RequestManager
-from src.parsers.bs4_parser import BS4Parser
-from src.utils.logger import setup_logger
+from src.parsers.base_parser import BaseParser
+from src.parsers.parser_factory import create_parser
+from src.utils.logger import SAMPLED, configure_logging, logging_settings, setup_logger
+from src.utils.metrics import MetricsRegistry, MetricsReporter
+from src.utils.profiling import StageProfiler, profile_stage
+
+# "Page 1 of 50" style pagination text
+TOTAL_PAGES_TEXT = r'[Pp]age\s+\d+\s+of\s+(\d+)'
+# Links to the last listing page
+LAST_PAGE_LINK = 'a[rel="last"], li.last a, a.last'
+
+# Parser used by pipeline worker processes, set once per process
+_worker_parser: Optional[BaseParser] = None
+
+
+def _init_parse_worker(parser: BaseParser, log_settings: Dict[str, Any]) -> None:
+    """Install the engine's parser and log settings in a pipeline worker process"""
+    global _worker_parser
+    _worker_parser = parser
+    configure_logging(**log_settings)
+
+
+def _parse_in_worker(html: str, product_url: str) -> Tuple[Optional[Product], float]:
+    """Parse a product page in a pipeline worker process. Returns (product, seconds)."""
+    started = time.perf_counter()
+    product = _worker_parser.parse_product_page(html, product_url)
+    return product, time.perf_counter() - started
+
 
 class ScraperEngine:
     """
@@ -25,42 +64,84 @@ class ScraperEngine:
         req_config = {
             "delay_between_requests":
                 site_req.get("delay_between_requests", self.scraping_config.delay_between_requests),
+            "burst":
+                site_req.get("burst", self.scraping_config.burst),
             "timeout":
                 site_req.get("timeout", self.scraping_config.timeout),
             "retry_attempts":
                 site_req.get("retry_attempts", self.scraping_config.retry_attempts),
             "user_agent":
                 site_req.get("user_agent", self.scraping_config.user_agent),
+            "max_concurrency_per_host":
+                site_req.get("max_concurrency_per_host", self.scraping_config.max_concurrency_per_host),
+            "cache":
+                site_req.get("cache", self.scraping_config.cache),
+            "adaptive":
+                site_req.get("adaptive", self.scraping_config.adaptive),
         }
+        if "requests_per_second" in site_req:
+            req_config["requests_per_second"] = site_req["requests_per_second"]
+        self.engine = website_config.get("engine", self.scraping_config.engine)
 
+        # Per-stage counters and latencies of this engine's runs
+        self.metrics = MetricsRegistry()
+        self.metrics_reporter = None
+        # Per-stage CPU/memory profiler, see enable_profiling()
+        self.profiler: Optional[StageProfiler] = None
+        
         # Apply merged settings
-        self.request_manager = RequestManager(req_config)
+        self.request_manager = RequestManager(req_config, metrics=self.metrics)
         
-        self.parser = BS4Parser(
+        self.parser = create_parser(
+            website_config.get('parser', 'bs4'),
             base_url=website_config.get('base_url', ''),
-            selectors=website_config.get('selectors', {})
+            selectors=website_config.get('selectors', {}),
+            url_rules=website_config.get('url_canonicalization')
         )
         
+        # Skip re-parsing products whose pages have not changed
+        self.change_tracker = self._create_change_tracker()
+        
+        # Journal of the crawl for resuming after an interruption
+        checkpoint_path = self.scraping_config.checkpoint_path
+        self.checkpoint = (CheckpointJournal(checkpoint_path.format(site=website_config.get('name', 'site')))
+                           if checkpoint_path else None)
+        
         # State management
         self.scraped_products: List[Product] = []
         self.failed_urls: List[str] = []
         
 
-    def scrape_catalog(self, start_url: Optional[str] = None) -> List[Product]:
+    def _create_change_tracker(self) -> Optional[ChangeTracker]:
+        """Open the product fingerprint store if change detection is enabled"""
+        change_config = self.website_config.get('change_detection') or {}
+        if not change_config.get('enabled'):
+            return None
+        
+        parser_signature = json.dumps({
+            'parser': self.website_config.get('parser', 'bs4'),
+            'selectors': self.website_config.get('selectors', {})
+        }, sort_keys=True)
+        return ChangeTracker(
+            path=change_config.get('path', f"cache/products_{self.website_config.get('name', 'site')}.sqlite3"),
+            region=change_config.get('region'),
+            parser_signature=parser_signature
+        )
+    
+    def scrape_catalog(self, start_url: Optional[str] = None, resume: bool = False) -> List[Product]:
         """
-        Main method to scrape entire product catalog
+        Main method to scrape entire product catalog. With ``resume``, an
+        interrupted crawl continues from its checkpoint journal.
         """
+        if self.engine == "async":
+            return asyncio.run(self.scrape_catalog_async(start_url, resume))
+
         self.logger.info(f"Starting catalog scrape for {self.website_config.get('name', 'unknown site')}")
         
-        if not start_url:
-            start_url = self.website_config.get('base_url')
-        
         try:
-            # Get product links from listing pages
-            product_urls = self._get_all_product_urls(start_url)
-            
-            # Scrape individual product pages
-            self._scrape_product_pages(product_urls)
+            for product in self.iter_products(start_url, resume):
+                self.scraped_products.append(product)
+            self.scraped_products = self.normalize_products(self.scraped_products)
             
             self.logger.info(f"Scraping completed. Success: {len(self.scraped_products)}, Failed: {len(self.failed_urls)}")
             return self.scraped_products
@@ -69,84 +150,536 @@ class ScraperEngine:
             self.logger.error(f"Catalog scraping failed: {e}")
             return self.scraped_products
     
+    async def scrape_catalog_async(self, start_url: Optional[str] = None, resume: bool = False) -> List[Product]:
+        """
+        Scrape the catalog with many product requests in flight at once
+        """
+        self.logger.info(f"Starting async catalog scrape for {self.website_config.get('name', 'unknown site')}")
+
+        try:
+            async for product in self.aiter_products(start_url, resume):
+                self.scraped_products.append(product)
+            self.scraped_products = self.normalize_products(self.scraped_products)
+
+            self.logger.info(f"Scraping completed. Success: {len(self.scraped_products)}, Failed: {len(self.failed_urls)}")
+            return self.scraped_products
+
+        except Exception as e:
+            self.logger.error(f"Catalog scraping failed: {e}")
+            return self.scraped_products
+
+    def iter_products(self, start_url: Optional[str] = None, resume: bool = False) -> Iterator[Product]:
+        """
+        Scrape the catalog, yielding products in URL order as they are parsed.
+
+        Products are not kept in ``scraped_products``, and pages are only
+        fetched a bounded window ahead of the consumer, so memory stays flat
+        however large the catalog is and a slow consumer slows the crawl.
+        Failed URLs are still collected in ``failed_urls``.
+        """
+        if self.engine == "async":
+            yield from self._iter_products_on_loop(start_url, resume)
+            return
+
+        try:
+            self._begin_run()
+            # Get product links from listing pages (or the checkpoint)
+            product_urls, remaining_urls, restored = self._start_crawl(
+                start_url or self.website_config.get('base_url'), resume
+            )
+            yield from restored
+            del restored
+            
+            # Scrape individual product pages
+            if self.engine == "pipeline":
+                pages = self._iter_product_pages_pipeline(remaining_urls)
+            else:
+                pages = self._iter_product_pages(remaining_urls)
+            
+            with tqdm(total=len(remaining_urls), desc="Scraping products") as progress:
+                for url, product in pages:
+                    self._record_result(url, product)
+                    progress.update(1)
+                    if product:
+                        yield product
+            
+            self._finish_crawl(product_urls)
+        
+        finally:
+            self._end_run()
+
+    def iter_batches(self, batch_size: int = 1000, start_url: Optional[str] = None,
+                     resume: bool = False) -> Iterator[ProductBatch]:
+        """
+        Scrape the catalog as columnar ``ProductBatch`` chunks of up to
+        ``batch_size`` products
+        """
+        products = self.iter_products(start_url, resume)
+        while chunk := list(islice(products, batch_size)):
+            batch = ProductBatch.from_products(chunk)
+            yield self._normalize_batch(batch) if self.scraping_config.normalize else batch
+
+    def _normalize_batch(self, batch: ProductBatch) -> ProductBatch:
+        """Parse price amount / currency and rating words with the site's settings"""
+        options = self.website_config.get('normalization', {})
+        with self.metrics.timer('stage_seconds', stage='normalize'):
+            return normalize_batch(batch, decimal=options.get('decimal'), default_currency=options.get('currency'))
+
+    def normalize_products(self, products: List[Product]) -> List[Product]:
+        """Normalize a whole run in one columnar pass"""
+        if not (self.scraping_config.normalize and products):
+            return products
+        return list(self._normalize_batch(ProductBatch.from_products(products)))
+
+    async def aiter_products(self, start_url: Optional[str] = None, resume: bool = False) -> AsyncIterator[Product]:
+        """
+        Async iterator version of ``iter_products``. Product pages are
+        fetched concurrently, a bounded window ahead of the consumer.
+        """
+        try:
+            self._begin_run()
+            # Discovery fetches listing pages on the request pool itself
+            product_urls, remaining_urls, restored = await asyncio.to_thread(
+                self._start_crawl, start_url or self.website_config.get('base_url'), resume
+            )
+            for product in restored:
+                yield product
+            del restored
+
+            with tqdm(total=len(remaining_urls), desc="Scraping products") as progress:
+                # Closed here, not by the garbage collector, when the consumer stops early
+                async with aclosing(self._aiter_product_pages(remaining_urls)) as pages:
+                    async for url, product in pages:
+                        self._record_result(url, product)
+                        progress.update(1)
+                        if product:
+                            yield product
+
+            self._finish_crawl(product_urls)
+
+        finally:
+            self._end_run()
+
+    def _iter_products_on_loop(self, start_url: Optional[str], resume: bool) -> Iterator[Product]:
+        """Drive ``aiter_products`` from synchronous code"""
+        return self._run_on_loop(self.aiter_products(start_url, resume))
+
+    @staticmethod
+    def _run_on_loop(items: AsyncIterator) -> Iterator:
+        """Drive an async iterator from synchronous code on a new event loop"""
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(items.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            # Finish the page tasks, async generators and request threads
+            # left running by a consumer that stopped early
+            loop.run_until_complete(items.aclose())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    def discover_product_urls(self, start_url: Optional[str] = None) -> List[str]:
+        """Product URLs from the listing pages, without scraping them"""
+        return self._get_all_product_urls(start_url or self.website_config.get('base_url'))
+
+    def iter_product_pages(self, product_urls: List[str]) -> Iterator[Tuple[str, Optional[Product]]]:
+        """
+        Fetch and parse the given product URLs with the configured engine,
+        yielding (url, product or None) in URL order. Nothing is recorded in
+        ``failed_urls`` or the checkpoint journal; crawl workers report to
+        their shared frontier instead.
+        """
+        if self.engine == "async":
+            yield from self._run_on_loop(self._aiter_product_pages(product_urls))
+        elif self.engine == "pipeline":
+            yield from self._iter_product_pages_pipeline(product_urls)
+        else:
+            yield from self._iter_product_pages(product_urls)
+
+    def _start_crawl(self, start_url: str, resume: bool) -> Tuple[List[str], List[str], List[Product]]:
+        """
+        Discover product URLs, or take them from the checkpoint journal when
+        resuming. Returns all product URLs, the ones still to scrape and the
+        products restored from the journal.
+        """
+        state = self.checkpoint.load() if (resume and self.checkpoint) else None
+        if state and state.finished:
+            # Resuming a completed run would replay stale products
+            self.logger.info(f"Checkpoint {self.checkpoint.path} is from a finished run, starting fresh")
+            state, resume = None, False
+        if state and state.frontier is not None:
+            # Products already scraped are restored, failed ones are retried
+            restored = state.restored_products()
+            remaining_urls = state.remaining_urls()
+            self.checkpoint.resume()
+            self.logger.info(f"Resuming from {self.checkpoint.path}: {len(restored)} products done, "
+                             f"{len(remaining_urls)} remaining")
+            return state.frontier, remaining_urls, restored
+
+        if resume:
+            self.logger.info("No checkpoint to resume from, starting fresh")
+        if self.checkpoint:
+            self.checkpoint.start(self.website_config.get('name', 'site'))
+
+        with self.metrics.timer('stage_seconds', stage='discovery'), profile_stage(self.profiler, 'discovery'):
+            product_urls = self._get_all_product_urls(start_url)
+        if self.checkpoint:
+            self.checkpoint.record_frontier(product_urls)
+        return product_urls, product_urls, []
+
+    def _begin_run(self) -> None:
+        """Start writing metrics snapshots if a metrics_path is configured"""
+        path = self.scraping_config.metrics_path
+        if path and self.metrics_reporter is None:
+            path = path.format(site=self.website_config.get('name', 'site'))
+            self.metrics_reporter = MetricsReporter(self.metrics, path, self.scraping_config.metrics_interval)
+            self.metrics_reporter.start()
+
+    def _end_run(self) -> None:
+        """Close the checkpoint journal, write the last metrics snapshot and log a summary"""
+        if self.checkpoint:
+            self.checkpoint.close()
+        if self.metrics_reporter:
+            self.metrics_reporter.stop()
+            self.metrics_reporter = None
+        self.logger.info("Crawl metrics:")
+        for line in self.metrics.summary():
+            self.logger.info(f"  {line}")
+
+    def enable_profiling(self, profiler: Optional[StageProfiler] = None, **options) -> StageProfiler:
+        """
+        Profile discovery, fetches and parsing per stage until
+        disable_profiling(). ``options`` are StageProfiler arguments; the
+        returned profiler can also mark stages outside the engine, e.g.
+        ``with profiler.stage('export'):``.
+        """
+        self.profiler = (profiler or StageProfiler(**options)).start()
+        self.request_manager.profiler = self.profiler
+        return self.profiler
+
+    def disable_profiling(self) -> Optional[Path]:
+        """Stop profiling and write the reports. Returns the report directory."""
+        if not self.profiler:
+            return None
+        report_dir = self.profiler.stop()
+        self.profiler = None
+        self.request_manager.profiler = None
+        return report_dir
+
+    def _finish_crawl(self, product_urls: List[str]) -> None:
+        """Close the change feed and mark the checkpoint journal complete"""
+        self._finish_change_tracking(product_urls)
+        if self.checkpoint:
+            self.checkpoint.finish()
+
     def _get_all_product_urls(self, start_url: str) -> List[str]:
         """
         Extract product URLs from all listing pages
+
+        The first page is fetched alone to detect the total page count. The
+        remaining pages are then fetched concurrently and processed in page
+        order. Without a known total, pages are fetched a window ahead, and
+        everything after the first empty or failed page is discarded.
         """
-        all_product_urls = []
-        page_number = 1
-        max_pages = self.website_config.get('pagination', {}).get('max_pages', 10)
+        # Discovered URLs in order, and the seen-set that deduplicates them
+        all_product_urls: List[str] = []
+        frontier = UrlFrontier.from_config(self.website_config.get('frontier'))
+        pagination = self.website_config.get('pagination', {})
+        max_pages = pagination.get('max_pages', 10)
+        pagination_pattern = pagination.get('pattern', '')
         
         self.logger.info(f"Discovering product URLs (max {max_pages} pages)")
         
-        while page_number <= max_pages:
-            # Build paginated URL
-            pagination_pattern = self.website_config.get('pagination', {}).get('pattern', '')
-            if pagination_pattern and '{page_number}' in pagination_pattern:
-                page_url = start_url + pagination_pattern.format(page_number=page_number)
+        def page_url_for(page_number: int) -> str:
+            return start_url + pagination_pattern.format(page_number=page_number)
+        
+        # Single page site
+        if not (pagination_pattern and '{page_number}' in pagination_pattern):
+            response = self.request_manager.get(start_url)
+            if response:
+                self._add_listing_page(all_product_urls, frontier, response, start_url, 1)
             else:
-                page_url = start_url  # Single page site
-            
-            self.logger.debug(f"Scraping listing page {page_number}: {page_url}")
-            
-            # Fetch and parse listing page
-            response = self.request_manager.get(page_url)
+                self.logger.warning(f"Failed to fetch listing page {start_url}")
+            return self._limit_product_urls(all_product_urls)
+        
+        first_url = page_url_for(1)
+        self.logger.debug(f"Scraping listing page 1: {first_url}")
+        response = self.request_manager.get(first_url)
+        if not response:
+            self.logger.warning(f"Failed to fetch listing page {first_url}")
+            return []
+        if not self._add_listing_page(all_product_urls, frontier, response, first_url, 1):
+            return self._limit_product_urls(all_product_urls)
+        
+        total_pages = self._detect_total_pages(response.text)
+        last_page = min(max_pages, total_pages) if total_pages else max_pages
+        if total_pages:
+            self.logger.info(f"Detected {total_pages} listing pages, fetching up to page {last_page}")
+        
+        page_numbers = range(2, last_page + 1)
+        page_urls = [page_url_for(n) for n in page_numbers]
+        responses = self.request_manager.iter_many(page_urls)
+        
+        for page_number, page_url, response in zip(page_numbers, page_urls, responses):
             if not response:
-                self.logger.warning(f"Failed to fetch listing page {page_url}")
+                self.logger.warning(f"Failed to fetch listing page {page_url}", extra=SAMPLED)
                 break
-            
-            # Extract product links
-            product_urls = self.parser.extract_product_links(response.text, base_page_url=page_url)
-            
-            if not product_urls:
-                self.logger.info("No more products found, stopping pagination")
-                break
-            
-            # Add to collection, avoiding duplicates
-            for url in product_urls:
-                if url not in all_product_urls:
-                    all_product_urls.append(url)
-            
-            self.logger.info(f"Page {page_number}: Found {len(product_urls)} products (Total: {len(all_product_urls)})")
-            page_number += 1
-            
-            # Check if we've reached the product limit
-            if (self.scraping_config.max_products and 
-                len(all_product_urls) >= self.scraping_config.max_products):
-                all_product_urls = all_product_urls[:self.scraping_config.max_products]
-                self.logger.info(f"Reached maximum product limit: {self.scraping_config.max_products}")
+            if not self._add_listing_page(all_product_urls, frontier, response, page_url, page_number):
                 break
         
-        self.logger.info(f"Total product URLs discovered: {len(all_product_urls)}")
-        return all_product_urls
+        return self._limit_product_urls(all_product_urls)
     
-    def _scrape_product_pages(self, product_urls: List[str]) -> None:
+    def _add_listing_page(self, all_product_urls: List[str], frontier: UrlFrontier, response,
+                          page_url: str, page_number: int) -> bool:
         """
-        Scrape individual product pages
+        Add the product links of a listing page. Returns False when
+        pagination should stop (empty page or product limit reached).
+        """
+        self.metrics.inc('listing_pages_total')
+        product_urls = self.parser.extract_product_links(response.text, base_page_url=page_url)
+        
+        if not product_urls:
+            self.logger.info("No more products found, stopping pagination")
+            return False
+        
+        # Add to collection, avoiding duplicates
+        all_product_urls.extend(url for url in product_urls if frontier.add(url))
+        
+        self.logger.info(f"Page {page_number}: Found {len(product_urls)} products (Total: {len(all_product_urls)})",
+                         extra=SAMPLED)
+        
+        # Check if we've reached the product limit
+        if (self.scraping_config.max_products and 
+            len(all_product_urls) >= self.scraping_config.max_products):
+            self.logger.info(f"Reached maximum product limit: {self.scraping_config.max_products}")
+            return False
+        
+        return True
+    
+    def _limit_product_urls(self, all_product_urls: List[str]) -> List[str]:
+        """Apply max_products to the discovered URLs"""
+        urls = all_product_urls
+        if self.scraping_config.max_products:
+            urls = urls[:self.scraping_config.max_products]
+        
+        self.logger.info(f"Total product URLs discovered: {len(urls)}")
+        return urls
+    
+    def _detect_total_pages(self, html: str) -> Optional[int]:
+        """
+        Detect the number of listing pages from the first one, using
+        "Page 1 of 50" style text, or the page number in the link to the
+        last page. Returns None if neither is found.
+        """
+        pagination = self.website_config.get('pagination', {})
+        
+        text_pattern = pagination.get('total_pages_pattern', TOTAL_PAGES_TEXT)
+        match = re.search(text_pattern, html)
+        if match:
+            return int(match.group(1))
+        
+        # Only an explicit "last" link is trusted: numbered page links are
+        # often windowed ("1 2 3 ... next") and would undercount
+        last_links = self.parser.extract_links(html, pagination.get('last_page_link', LAST_PAGE_LINK))
+        page_pattern = pagination.get('pattern', '').rsplit('/', 1)[-1]
+        number_pattern = re.escape(page_pattern).replace(re.escape('{page_number}'), r'(\d+)')
+        for link in last_links:
+            match = re.search(number_pattern, link)
+            if match:
+                return int(match.group(1))
+        
+        return None
+    
+    def _iter_product_pages(self, product_urls: List[str]) -> Iterator[Tuple[str, Optional[Product]]]:
+        """
+        Scrape individual product pages, yielding (url, product or None)
         """
         self.logger.info(f"Scraping {len(product_urls)} product pages...")
         
-        for url in tqdm(product_urls, desc="Scraping products"):
+        # Pages are fetched concurrently on the request pool and parsed here in order
+        responses = self.request_manager.iter_many(product_urls)
+        
+        for url, response in zip(product_urls, responses):
             try:
-                product = self._scrape_single_product(url)
-                if product:
-                    self.scraped_products.append(product)
-                else:
-                    self.failed_urls.append(url)
-                    
+                product = self._product_from_response(url, response)
             except Exception as e:
-                self.logger.error(f"Unexpected error scraping {url}: {e}")
-                self.failed_urls.append(url)
+                self.logger.error(f"Unexpected error scraping {url}: {e}", extra=SAMPLED)
+                product = None
+            yield url, product
     
+    def _iter_product_pages_pipeline(self, product_urls: List[str]) -> Iterator[Tuple[str, Optional[Product]]]:
+        """
+        Scrape product pages with fetching and parsing overlapped.
+
+        Pages are fetched on the request pool and handed to a pool of parser
+        processes. At most ``pipeline_queue_size`` pages wait to be parsed;
+        when the queue is full, fetching waits for the oldest page, so
+        products are yielded in URL order.
+        """
+        workers = self.scraping_config.parser_workers or os.cpu_count() or 1
+        queue_size = max(1, self.scraping_config.pipeline_queue_size)
+        self.logger.info(f"Scraping {len(product_urls)} product pages with {workers} parser processes...")
+        
+        pending = deque()
+        
+        # Spawned, not forked: a fork copies locks held by the request and
+        # log writer threads, and the child could deadlock on them
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_parse_worker,
+                                 initargs=(self.parser, logging_settings())) as pool:
+            responses = self.request_manager.iter_many(product_urls, window=queue_size)
+            
+            for url, response in zip(product_urls, responses):
+                future, fingerprint = None, None
+                if response:
+                    stored = None
+                    if self.change_tracker:
+                        fingerprint = self.change_tracker.fingerprint(response.text)
+                        stored = self.change_tracker.unchanged_product(url, fingerprint)
+                    if stored:
+                        # Unchanged page: no parse needed, nothing new to record
+                        future, fingerprint = Future(), None
+                        future.set_result((stored, None))
+                        self.metrics.inc('pages_total', result='unchanged')
+                    else:
+                        future = pool.submit(_parse_in_worker, response.text, url)
+                else:
+                    self.metrics.inc('pages_total', result='fetch_failed')
+                pending.append((url, future, fingerprint))
+                
+                if len(pending) >= queue_size:
+                    yield self._collect_parsed_product(*pending.popleft())
+            
+            while pending:
+                yield self._collect_parsed_product(*pending.popleft())
+    
+    def _collect_parsed_product(self, url: str, future: Optional[Future],
+                                fingerprint: Optional[str]) -> Tuple[str, Optional[Product]]:
+        """Wait for a pipeline parse result"""
+        try:
+            product, seconds = future.result() if future else (None, None)
+            if seconds is not None:
+                self.metrics.observe('parse_seconds', seconds)
+                self.metrics.inc('pages_total', result='parsed' if product else 'parse_failed')
+            if product and fingerprint:
+                self.change_tracker.record(url, fingerprint, product)
+        except Exception as e:
+            self.logger.error(f"Unexpected error scraping {url}: {e}", extra=SAMPLED)
+            self.metrics.inc('pages_total', result='parse_failed')
+            product = None
+        return url, product
+    
+    def _record_result(self, url: str, product: Optional[Product]) -> None:
+        """Note a product page result in failed_urls and the checkpoint journal"""
+        if not product:
+            self.failed_urls.append(url)
+        if not self.checkpoint:
+            return
+        if product:
+            self.checkpoint.record_product(url, product)
+        else:
+            self.checkpoint.record_failure(url)
+    
+    async def _aiter_product_pages(self, product_urls: List[str]) -> AsyncIterator[Tuple[str, Optional[Product]]]:
+        """
+        Scrape product pages concurrently, yielding results in URL order.
+        At most twice the per-host concurrency is scheduled ahead of the
+        consumer. Pages are parsed on a separate thread so parsing never
+        blocks the event loop's fetches.
+        """
+        concurrency = self.request_manager.config['max_concurrency_per_host']
+        self.logger.info(f"Scraping {len(product_urls)} product pages (up to {concurrency} per host)...")
+        # One thread: the parser is used from one thread at a time, as in the sync engine
+        parse_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parse-worker")
+
+        async def scrape(url: str) -> Optional[Product]:
+            try:
+                return await self._scrape_single_product_async(url, parse_executor)
+            except Exception as e:
+                self.logger.error(f"Unexpected error scraping {url}: {e}", extra=SAMPLED)
+                return None
+
+        pending = deque()
+        try:
+            for url in product_urls:
+                pending.append((url, asyncio.ensure_future(scrape(url))))
+                if len(pending) >= concurrency * 2:
+                    url, task = pending.popleft()
+                    yield url, await task
+
+            while pending:
+                url, task = pending.popleft()
+                yield url, await task
+        finally:
+            # The consumer stopped early
+            for _, task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+            parse_executor.shutdown()
+
+    async def _scrape_single_product_async(self, product_url: str,
+                                           parse_executor: Optional[ThreadPoolExecutor] = None) -> Optional[Product]:
+        """
+        Scrape a single product page from a coroutine, parsing it on
+        ``parse_executor`` (the loop's default executor if None)
+        """
+        response = await self.request_manager.get_async(product_url)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(parse_executor, self._product_from_response, product_url, response)
+
     def _scrape_single_product(self, product_url: str) -> Optional[Product]:
         """
         Scrape a single product page
         """
         response = self.request_manager.get(product_url)
+        return self._product_from_response(product_url, response)
+    
+    def _product_from_response(self, product_url: str, response) -> Optional[Product]:
+        """
+        Parse a fetched product page, or reuse the stored Product when
+        change detection finds the page unchanged
+        """
         if not response:
+            self.metrics.inc('pages_total', result='fetch_failed')
             return None
         
-        return self.parser.parse_product_page(response.text, product_url)
+        if not self.change_tracker:
+            return self._parse_product_page(response.text, product_url)
+        
+        fingerprint = self.change_tracker.fingerprint(response.text)
+        product = self.change_tracker.unchanged_product(product_url, fingerprint)
+        if product:
+            self.metrics.inc('pages_total', result='unchanged')
+            return product
+        
+        product = self._parse_product_page(response.text, product_url)
+        if product:
+            self.change_tracker.record(product_url, fingerprint, product)
+        return product
+    
+    def _parse_product_page(self, html: str, product_url: str) -> Optional[Product]:
+        """Parse a product page, timing it and counting the outcome"""
+        started = time.perf_counter()
+        with profile_stage(self.profiler, 'parse'):
+            product = self.parser.parse_product_page(html, product_url)
+        self.metrics.observe('parse_seconds', time.perf_counter() - started)
+        self.metrics.inc('pages_total', result='parsed' if product else 'parse_failed')
+        return product
+    
+    def _finish_change_tracking(self, product_urls: List[str]) -> None:
+        """Close the run's change feed"""
+        if not self.change_tracker:
+            return
+        
+        # Removals can only be detected from a complete URL list
+        complete = not self.scraping_config.max_products
+        self.change_tracker.finish_run(product_urls if complete else None)
     
     def save_progress(self, filepath: str = "scraping_progress.json") -> None:
         """
@@ -155,6 +688,7 @@ class ScraperEngine:
         progress_data = {
             'scraped_urls': [p.product_url for p in self.scraped_products],
             'failed_urls': self.failed_urls,
+            'checkpoint': str(self.checkpoint.path) if self.checkpoint else None,
             'website_config': self.website_config,
             'timestamp': time.time()
         }
@@ -167,7 +701,17 @@ class ScraperEngine:
     def load_progress(self, filepath: str = "scraping_progress.json") -> List[str]:
         """
         Load scraping progress and return remaining URLs
+
+        The checkpoint journal already holds the discovered URLs, so no
+        listing pages are fetched. Old progress files without a journal
+        still need discovery.
         """
+        state = self.checkpoint.load() if self.checkpoint else None
+        if state and state.frontier is not None:
+            remaining_urls = state.remaining_urls()
+            self.logger.info(f"Loaded checkpoint {self.checkpoint.path}. Remaining URLs: {len(remaining_urls)}")
+            return remaining_urls
+        
         try:
             with open(filepath, 'r') as f:
                 progress_data = json.load(f)
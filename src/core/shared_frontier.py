@@ -0,0 +1,320 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.utils.logger import setup_logger
+
+# Frontier URL states
+PENDING, LEASED, DONE, FAILED = 'pending', 'leased', 'done', 'failed'
+
+
+class SharedFrontier(ABC):
+    """
+    Work queue of product URLs shared by crawl workers.
+
+    Workers ``claim`` a batch of URLs under a time-limited lease and report
+    each one back with ``complete`` or ``fail``. Leases of workers that
+    crash or stall run out and their URLs are handed to the next claimer,
+    so a URL is only lost if it fails, or its lease runs out,
+    ``max_attempts`` times.
+    """
+
+    @abstractmethod
+    def add_urls(self, urls: Iterable[str]) -> int:
+        """Queue URLs that are not known yet. Returns how many were new."""
+
+    @abstractmethod
+    def claim(self, worker_id: str, batch_size: int, lease_seconds: float, max_attempts: int = 3) -> List[str]:
+        """
+        Lease up to ``batch_size`` pending URLs. Expired leases are reclaimed
+        first: requeued, or failed once claimed ``max_attempts`` times.
+        """
+
+    @abstractmethod
+    def renew(self, worker_id: str, urls: Iterable[str], lease_seconds: float) -> None:
+        """Extend the worker's leases on URLs it is still working on"""
+
+    @abstractmethod
+    def complete(self, worker_id: str, url: str, product: dict) -> None:
+        """Store the product scraped from a URL"""
+
+    @abstractmethod
+    def fail(self, worker_id: str, url: str, max_attempts: int = 3) -> None:
+        """Requeue a URL, or mark it failed after ``max_attempts`` claims"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Number of URLs per state"""
+
+    @abstractmethod
+    def products(self) -> Iterator[Tuple[str, dict]]:
+        """(url, product dict) of every completed URL"""
+
+    @abstractmethod
+    def failed_urls(self) -> List[str]:
+        """URLs that ran out of attempts"""
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteFrontier(SharedFrontier):
+    """
+    Shared frontier in a SQLite file, for workers on one machine.
+
+    Every claim runs in an immediate (write-locked) transaction, so two
+    processes never lease the same URL.
+    """
+
+    def __init__(self, path: str = "checkpoints/frontier.sqlite3"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = setup_logger(__name__)
+        self._lock = threading.Lock()
+
+        # Autocommit mode: transactions are opened explicitly in _transaction
+        self._db = sqlite3.connect(str(self.path), timeout=60, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS frontier (
+                url TEXT PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT 'pending',
+                worker TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                product TEXT
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS frontier_status ON frontier (status, lease_expires)")
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def add_urls(self, urls: Iterable[str]) -> int:
+        with self._transaction() as db:
+            before = db.total_changes
+            db.executemany("INSERT OR IGNORE INTO frontier (url) VALUES (?)", ((url,) for url in urls))
+            return db.total_changes - before
+
+    def claim(self, worker_id: str, batch_size: int, lease_seconds: float, max_attempts: int = 3) -> List[str]:
+        now = time.time()
+        with self._transaction() as db:
+            # A URL whose leases keep expiring (it crashes its workers) is given up on
+            exhausted = db.execute(
+                "UPDATE frontier SET status = ?, worker = NULL, lease_expires = NULL "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, LEASED, now, max_attempts)
+            ).rowcount
+            reclaimed = db.execute(
+                "UPDATE frontier SET status = ?, worker = NULL WHERE status = ? AND lease_expires < ?",
+                (PENDING, LEASED, now)
+            ).rowcount
+            if reclaimed or exhausted:
+                self.logger.info(f"Reclaimed {reclaimed} URLs from expired leases, "
+                                 f"{exhausted} out of attempts")
+
+            urls = [row[0] for row in db.execute(
+                "SELECT url FROM frontier WHERE status = ? ORDER BY rowid LIMIT ?", (PENDING, batch_size)
+            )]
+            db.executemany(
+                "UPDATE frontier SET status = ?, worker = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE url = ?",
+                ((LEASED, worker_id, now + lease_seconds, url) for url in urls)
+            )
+        return urls
+
+    def renew(self, worker_id: str, urls: Iterable[str], lease_seconds: float) -> None:
+        expires = time.time() + lease_seconds
+        with self._transaction() as db:
+            db.executemany(
+                "UPDATE frontier SET lease_expires = ? WHERE url = ? AND worker = ? AND status = ?",
+                ((expires, url, worker_id, LEASED) for url in urls)
+            )
+
+    def complete(self, worker_id: str, url: str, product: dict) -> None:
+        # A late result from an expired lease is still a valid result
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE frontier SET status = ?, worker = NULL, lease_expires = NULL, product = ? "
+                "WHERE url = ? AND status != ?",
+                (DONE, json.dumps(product), url, DONE)
+            )
+
+    def fail(self, worker_id: str, url: str, max_attempts: int = 3) -> None:
+        # Only the current lease holder may requeue a URL
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE frontier SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "worker = NULL, lease_expires = NULL WHERE url = ? AND worker = ? AND status = ?",
+                (max_attempts, FAILED, PENDING, url, worker_id, LEASED)
+            )
+
+    def stats(self) -> Dict[str, int]:
+        counts = dict.fromkeys((PENDING, LEASED, DONE, FAILED), 0)
+        with self._lock:
+            counts.update(self._db.execute("SELECT status, COUNT(*) FROM frontier GROUP BY status"))
+        return counts
+
+    def products(self, page_size: int = 1000) -> Iterator[Tuple[str, dict]]:
+        # Paged by rowid, so a large frontier is never loaded at once
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT rowid, url, product FROM frontier WHERE status = ? AND rowid > ? "
+                    "ORDER BY rowid LIMIT ?", (DONE, last_rowid, page_size)
+                ).fetchall()
+            if not rows:
+                return
+            for last_rowid, url, product in rows:
+                yield url, json.loads(product)
+
+    def failed_urls(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._db.execute(
+                "SELECT url FROM frontier WHERE status = ? ORDER BY rowid", (FAILED,)
+            )]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def _text(value) -> Optional[str]:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+class RedisFrontier(SharedFrontier):
+    """
+    Shared frontier in Redis, for workers on several machines.
+
+    ``client`` is a redis-py client or anything with the same commands
+    (a Redis-compatible server or an in-process stand-in). Keys live
+    under ``prefix``:
+
+      seen      set of every queued URL
+      pending   list of URLs waiting to be claimed
+      leases    sorted set of leased URLs, scored by lease expiry
+      owners    hash of leased URL -> worker id
+      attempts  hash of URL -> times claimed
+      done      hash of URL -> product JSON
+      failed    set of URLs out of attempts
+
+    A worker that dies between popping a URL and recording its lease
+    drops that URL; ``stats()`` then counts fewer URLs than were queued.
+    """
+
+    def __init__(self, client, prefix: str = "frontier"):
+        self.client = client
+        self.prefix = prefix
+        self.logger = setup_logger(__name__)
+
+    def _key(self, name: str) -> str:
+        return f"{self.prefix}:{name}"
+
+    def add_urls(self, urls: Iterable[str]) -> int:
+        added = 0
+        for url in urls:
+            if self.client.sadd(self._key('seen'), url):
+                self.client.rpush(self._key('pending'), url)
+                added += 1
+        return added
+
+    def claim(self, worker_id: str, batch_size: int, lease_seconds: float, max_attempts: int = 3) -> List[str]:
+        now = time.time()
+
+        # ZREM succeeds for exactly one claimer, so an expired URL is requeued once
+        reclaimed = exhausted = 0
+        for url in self.client.zrangebyscore(self._key('leases'), '-inf', now):
+            if self.client.zrem(self._key('leases'), url):
+                self.client.hdel(self._key('owners'), url)
+                if int(self.client.hget(self._key('attempts'), url) or 0) >= max_attempts:
+                    self.client.sadd(self._key('failed'), url)
+                    exhausted += 1
+                else:
+                    self.client.lpush(self._key('pending'), url)
+                    reclaimed += 1
+        if reclaimed or exhausted:
+            self.logger.info(f"Reclaimed {reclaimed} URLs from expired leases, "
+                             f"{exhausted} out of attempts")
+
+        urls = []
+        while len(urls) < batch_size:
+            url = _text(self.client.lpop(self._key('pending')))
+            if url is None:
+                break
+            self.client.zadd(self._key('leases'), {url: now + lease_seconds})
+            self.client.hset(self._key('owners'), url, worker_id)
+            self.client.hincrby(self._key('attempts'), url, 1)
+            urls.append(url)
+        return urls
+
+    def renew(self, worker_id: str, urls: Iterable[str], lease_seconds: float) -> None:
+        expires = time.time() + lease_seconds
+        for url in urls:
+            if _text(self.client.hget(self._key('owners'), url)) == worker_id:
+                self.client.zadd(self._key('leases'), {url: expires})
+
+    def complete(self, worker_id: str, url: str, product: dict) -> None:
+        self.client.hset(self._key('done'), url, json.dumps(product))
+        if self.client.zrem(self._key('leases'), url):
+            self.client.hdel(self._key('owners'), url)
+
+    def fail(self, worker_id: str, url: str, max_attempts: int = 3) -> None:
+        if _text(self.client.hget(self._key('owners'), url)) != worker_id:
+            return
+        if not self.client.zrem(self._key('leases'), url):
+            return
+        self.client.hdel(self._key('owners'), url)
+        if int(self.client.hget(self._key('attempts'), url) or 0) >= max_attempts:
+            self.client.sadd(self._key('failed'), url)
+        else:
+            self.client.rpush(self._key('pending'), url)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            PENDING: self.client.llen(self._key('pending')),
+            LEASED: self.client.zcard(self._key('leases')),
+            DONE: self.client.hlen(self._key('done')),
+            FAILED: self.client.scard(self._key('failed')),
+        }
+
+    def products(self) -> Iterator[Tuple[str, dict]]:
+        for url, product in self.client.hgetall(self._key('done')).items():
+            yield _text(url), json.loads(product)
+
+    def failed_urls(self) -> List[str]:
+        return sorted(_text(url) for url in self.client.smembers(self._key('failed')))
+
+
+def open_frontier(url: str) -> SharedFrontier:
+    """
+    Open a shared frontier from a URL: "sqlite:///path/to/file.sqlite3"
+    or "redis://host:6379/0#prefix" (needs the optional redis package)
+    """
+    parts = urlsplit(url)
+    if url.startswith('sqlite:///'):
+        # sqlite:///relative/path or sqlite:////absolute/path
+        return SQLiteFrontier(url[len('sqlite:///'):])
+    if parts.scheme in ('redis', 'rediss', 'unix'):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("The redis package is required for redis:// frontiers (pip install redis)") from e
+        prefix = parts.fragment or 'frontier'
+        return RedisFrontier(redis.Redis.from_url(url.split('#', 1)[0], decode_responses=True), prefix=prefix)
+    raise ValueError(f"Unsupported frontier URL '{url}' (use sqlite:///path or redis://host)")
@@ -0,0 +1,64 @@
+import csv
+import json
+from itertools import islice
+from pathlib import Path
+from datetime import datetime
+import time
+from typing import Iterable, Any, Optional
+
+from src.core.data_models import Product
+from src.utils.logger import setup_logger
+from src.utils.metrics import MetricsRegistry
+
+class CSVExporter:
+    """ Export product data to CSV format"""
+
+    def __init__(self, output_path: str="./exports", chunk_size: int = 1000,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.output_path = Path(output_path)
+        self.output_path.mkdir(exist_ok=True)
+        self.chunk_size = chunk_size
+        self.logger = setup_logger(__name__)
+        self.metrics = metrics or MetricsRegistry()
+
+    def export_products(self, products: Iterable[Product], filename: str = None) -> str:
+        """
+        Export products to CSV file, writing ``chunk_size`` rows at a time
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"products_{timestamp}.csv"
+
+        file_path = self.output_path / filename
+
+        try:
+            count = 0
+            products = iter(products)
+            # utf-8-sig so Excel detects the encoding when opening the file
+            with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = None
+                while chunk := list(islice(products, self.chunk_size)):
+                    started = time.perf_counter()
+                    rows = [product.to_dict() for product in chunk]
+                    if writer is None:
+                        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+                        writer.writeheader()
+                    writer.writerows({key: self._cell_value(value) for key, value in row.items()}
+                                     for row in rows)
+                    count += len(rows)
+                    self.metrics.observe('export_batch_seconds', time.perf_counter() - started, format='csv')
+                    self.metrics.inc('export_rows_total', len(rows), format='csv')
+
+            self.logger.info(f"Successfully exported {count} products to {file_path}")
+            return str(file_path)
+
+        except Exception as e:
+            self.logger.error(f"Failed to export to CSV: {e}")
+            raise
+
+    @staticmethod
+    def _cell_value(value: Any) -> Any:
+        """Nested values such as specifications are written as JSON"""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        return value
@@ -1,22 +1,30 @@
-import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+import time
+from typing import Iterable, Any, Optional
+
+from openpyxl import Workbook
 
 from src.core.data_models import Product
 from src.utils.logger import setup_logger
+from src.utils.metrics import MetricsRegistry
 
 class ExcelExporter:
     """ Export product data to Excel format"""
 
-    def __init__(self, output_path: str="./exports"):
+    def __init__(self, output_path: str="./exports", metrics: Optional[MetricsRegistry] = None):
         self.output_path = Path(output_path)
         self.output_path.mkdir(exist_ok=True)
         self.logger = setup_logger(__name__)
+        self.metrics = metrics or MetricsRegistry()
 
-    def export_products(self, products: List[Product], filename: str = None) -> str:
+    def export_products(self, products: Iterable[Product], filename: str = None) -> str:
         """
-        Export list of products to Excel file
+        Export products to Excel file
+
+        Rows are streamed to a write-only workbook as products arrive, so
+        any iterable (e.g. ``ScraperEngine.iter_products()``) is exported
+        in constant memory.
         """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -25,16 +33,33 @@ class ExcelExporter:
         file_path = self.output_path / filename
         
         try:
-            # Convert products to dictionaries
-            product_dicts = [product.to_dict() for product in products]
+            started = time.perf_counter()
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet("Sheet1")
             
-            # Create DataFrame and export
-            df = pd.DataFrame(product_dicts)
-            df.to_excel(file_path, index=False, engine='openpyxl')
+            count = 0
+            for product in products:
+                product_dict = product.to_dict()
+                if count == 0:
+                    sheet.append(list(product_dict))
+                sheet.append([self._cell_value(value) for value in product_dict.values()])
+                count += 1
             
-            self.logger.info(f"Successfully exported {len(products)} products to {file_path}")
+            workbook.save(file_path)
+            # Includes producing the products when given a generator
+            self.metrics.observe('export_seconds', time.perf_counter() - started, format='excel')
+            self.metrics.inc('export_rows_total', count, format='excel')
+            
+            self.logger.info(f"Successfully exported {count} products to {file_path}")
             return str(file_path)
             
         except Exception as e:
             self.logger.error(f"Failed to export to Excel: {e}")
             raise
+
+    @staticmethod
+    def _cell_value(value: Any) -> Any:
+        """Excel cells hold scalars; containers such as specifications are written as text"""
+        if isinstance(value, (dict, list, tuple, set)):
+            return str(value)
+        return value
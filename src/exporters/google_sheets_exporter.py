@@ -2,24 +2,54 @@ import gspread
 from google.oauth2.service_account import Credentials
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import json
+import random
 import time
 
 from src.core.data_models import Product
 from src.utils.logger import setup_logger
+from src.utils.metrics import MetricsRegistry
+from src.utils.retry_after import retry_after_seconds
+
+# Responses worth retrying: rate limited or temporarily unavailable
+RETRY_STATUS_CODES = (429, 500, 503)
+# Columns that identify a product row in incremental mode, in order of preference
+KEY_COLUMNS = ('product_url', 'sku')
+# Columns that change on every run without the product changing
+VOLATILE_COLUMNS = ('scraped_timestamp',)
+
+def spreadsheet_title(template: str, incremental: bool = False) -> str:
+    """
+    Spreadsheet name from a configured template. ``{timestamp}`` is
+    expanded for full exports; incremental runs drop it so that every run
+    opens, and diffs against, the same spreadsheet.
+    """
+    if incremental:
+        return " ".join(template.replace("{timestamp}", "").split())
+    return template.replace("{timestamp}", datetime.now().strftime("%Y-%m-%d %H:%M"))
 
 class GoogleSheetsExporter:
     """
     Export product data to Google Sheets
     """
     
-    def __init__(self, credentials_file: str = "./configs/credentials.json"):
+    def __init__(self, credentials_file: str = "./configs/credentials.json", client=None,
+                 cells_per_request: int = 100000, max_retries: int = 5, backoff_base: float = 1.0,
+                 metrics: Optional[MetricsRegistry] = None):
         self.credentials_file = Path(credentials_file)
         self.logger = setup_logger(__name__)
-        self.client = None
+        # A ready gspread client (or a compatible fake) skips authentication
+        self.client = client
+        self.cells_per_request = cells_per_request
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.metrics = metrics or MetricsRegistry()
         
     def _authenticate(self) -> bool:
         """Authenticate with Google Sheets API"""
+        if self.client is not None:
+            return True
         try:
             if not self.credentials_file.exists():
                 self.logger.error(f"Credentials file not found: {self.credentials_file}")
@@ -45,13 +75,19 @@ class GoogleSheetsExporter:
             self.logger.error(f"Google Sheets authentication failed: {e}")
             return False
     
-    def export_products(self, products: List[Product], 
+    def export_products(self, products: Iterable[Product], 
                        spreadsheet_name: str = None,
-                       worksheet_name: str = "Products") -> Optional[str]:
+                       worksheet_name: str = "Products",
+                       incremental: bool = False) -> Optional[str]:
         """
         Export products to Google Sheets
         Returns the spreadsheet URL if successful
+
+        With ``incremental``, the existing worksheet is kept: rows of
+        products whose data changed (matched by URL, or SKU) are rewritten
+        and new products are appended.
         """
+        products = list(products)
         if not products:
             self.logger.warning("No products to export")
             return None
@@ -61,6 +97,7 @@ class GoogleSheetsExporter:
             return None
         
         try:
+            started = time.perf_counter()
             # Create spreadsheet name with timestamp
             if not spreadsheet_name:
                 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
@@ -71,21 +108,25 @@ class GoogleSheetsExporter:
             if not spreadsheet:
                 return None
             
-            # Create or clear worksheet
-            worksheet = self._prepare_worksheet(spreadsheet, worksheet_name)
-            if not worksheet:
-                return None
-            
             # Prepare data for export
             headers, rows = self._prepare_data(products)
             
-            # Update worksheet in batches to avoid API limits
-            self._update_worksheet_batch(worksheet, headers, rows)
+            # Create or open worksheet, sized for the data
+            worksheet = self._prepare_worksheet(spreadsheet, worksheet_name, len(rows), len(headers))
+            if not worksheet:
+                return None
             
-            # Format the spreadsheet
-            self._format_spreadsheet(worksheet, len(headers), len(rows) + 1)
+            # Incremental mode falls back to a full write when the layout differs
+            if not (incremental and self._update_incremental(worksheet, headers, rows)):
+                self._reset_worksheet(worksheet, len(rows), len(headers))
+                self._write_rows(worksheet, [(1, rows)], len(headers))
+                
+                # Format the spreadsheet
+                self._format_spreadsheet(worksheet, len(headers), len(rows))
             
             spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet.id}"
+            self.metrics.observe('export_seconds', time.perf_counter() - started, format='google_sheets')
+            self.metrics.inc('export_rows_total', len(products), format='google_sheets')
             self.logger.info(f"Successfully exported {len(products)} products to Google Sheets: {spreadsheet_url}")
             
             return spreadsheet_url
@@ -98,13 +139,14 @@ class GoogleSheetsExporter:
         """Get existing spreadsheet or create new one"""
         try:
             # Try to open existing spreadsheet
-            spreadsheet = self.client.open(name)
+            spreadsheet = self._call_with_backoff(self.client.open, name)
             self.logger.info(f"Opened existing spreadsheet: {name}")
         except gspread.SpreadsheetNotFound:
             try:
                 # Create new spreadsheet
                 folder_id = "1R6Nr9XgueUPnhl3JvlJWYMZvN_az3SB4"  # Google Drive folder ID of shared folder
-                spreadsheet = self.client.create(
+                spreadsheet = self._call_with_backoff(
+                    self.client.create,
                     name,
                     folder_id=folder_id
                 )
@@ -115,21 +157,20 @@ class GoogleSheetsExporter:
         
         return spreadsheet
     
-    def _prepare_worksheet(self, spreadsheet, worksheet_name: str):
-        """Prepare worksheet for data export"""
+    def _prepare_worksheet(self, spreadsheet, worksheet_name: str, num_rows: int, num_columns: int):
+        """Open the worksheet, or create it with room for the data"""
         try:
             # Try to get existing worksheet
-            worksheet = spreadsheet.worksheet(worksheet_name)
-            # Clear existing data
-            worksheet.clear()
-            self.logger.info(f"Cleared existing worksheet: {worksheet_name}")
+            worksheet = self._call_with_backoff(spreadsheet.worksheet, worksheet_name)
+            self.logger.info(f"Opened existing worksheet: {worksheet_name}")
         except gspread.WorksheetNotFound:
             try:
-                # Create new worksheet
-                worksheet = spreadsheet.add_worksheet(
+                # Create new worksheet at its final size
+                worksheet = self._call_with_backoff(
+                    spreadsheet.add_worksheet,
                     title=worksheet_name, 
-                    rows=1000, 
-                    cols=20
+                    rows=num_rows, 
+                    cols=num_columns
                 )
                 self.logger.info(f"Created new worksheet: {worksheet_name}")
             except Exception as e:
@@ -138,6 +179,12 @@ class GoogleSheetsExporter:
         
         return worksheet
     
+    def _reset_worksheet(self, worksheet, num_rows: int, num_columns: int):
+        """Clear the worksheet and resize it to the data in one go"""
+        self._call_with_backoff(worksheet.clear)
+        if (worksheet.row_count, worksheet.col_count) != (num_rows, num_columns):
+            self._call_with_backoff(worksheet.resize, rows=num_rows, cols=num_columns)
+    
     def _prepare_data(self, products: List[Product]):
         """Prepare data for Google Sheets export"""
         if not products:
@@ -152,37 +199,132 @@ class GoogleSheetsExporter:
         # Prepare rows
         rows = [headers]  # Header row
         for product in product_dicts:
-            row = [product.get(header, '') for header in headers]
+            row = [self._cell_value(product.get(header, '')) for header in headers]
             rows.append(row)
         
         return headers, rows
     
-    def _update_worksheet_batch(self, worksheet, headers: List[str], rows: List[List]):
-        """Update worksheet data in batches to avoid API limits"""
-        try:
-            # Update in larger batches for better performance
-            batch_size = 50
-            
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i:i + batch_size]
-                
-                # Calculate range
-                start_row = i + 1
-                end_row = i + len(batch)
-                range_str = f"A{start_row}:{self._get_column_letter(len(headers))}{end_row}"
-                
-                # Update batch
-                worksheet.update(range_str, batch, value_input_option='USER_ENTERED')
-                
-                self.logger.debug(f"Updated rows {start_row}-{end_row}")
-                
-                # Small delay to respect API limits
-                if i + batch_size < len(rows):
-                    time.sleep(1)
-                    
-        except Exception as e:
-            self.logger.error(f"Batch update failed: {e}")
-            raise
+    @staticmethod
+    def _cell_value(value: Any) -> Any:
+        """Sheet cells hold scalars; nested values such as specifications are written as JSON"""
+        if value is None:
+            return ''
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        return value
+    
+    def _write_rows(self, worksheet, blocks: List[Tuple[int, List[List]]], num_columns: int):
+        """
+        Write blocks of consecutive rows, given as (first row number, rows),
+        with as few batch_update calls as ``cells_per_request`` allows
+        """
+        rows_per_request = max(1, self.cells_per_request // max(1, num_columns))
+        last_column = self._get_column_letter(num_columns)
+        
+        request, request_rows = [], 0
+        for start_row, rows in blocks:
+            for offset in range(0, len(rows), rows_per_request):
+                chunk = rows[offset:offset + rows_per_request]
+                if request and request_rows + len(chunk) > rows_per_request:
+                    self._call_with_backoff(worksheet.batch_update, request, value_input_option='USER_ENTERED')
+                    request, request_rows = [], 0
+                first = start_row + offset
+                request.append({'range': f"A{first}:{last_column}{first + len(chunk) - 1}", 'values': chunk})
+                request_rows += len(chunk)
+        
+        if request:
+            self._call_with_backoff(worksheet.batch_update, request, value_input_option='USER_ENTERED')
+        self.logger.debug(f"Wrote {sum(len(rows) for _, rows in blocks)} rows")
+    
+    def _update_incremental(self, worksheet, headers: List[str], rows: List[List]) -> bool:
+        """
+        Rewrite only changed rows and append new ones. Returns False when
+        the worksheet has no matching header and needs a full write.
+        """
+        existing = self._call_with_backoff(worksheet.get_all_values)
+        if not existing or existing[0][:len(headers)] != headers:
+            self.logger.info("Worksheet layout differs, rewriting it")
+            return False
+        
+        key_indexes = [headers.index(column) for column in KEY_COLUMNS if column in headers]
+        compared = [i for i, header in enumerate(headers) if header not in VOLATILE_COLUMNS]
+        
+        def key(row) -> Optional[str]:
+            for i in key_indexes:
+                if i < len(row) and str(row[i]):
+                    return str(row[i])
+            return None
+        
+        row_numbers: Dict[str, int] = {}
+        for number, row in enumerate(existing[1:], start=2):
+            row_key = key(row)
+            if row_key is not None:
+                row_numbers.setdefault(row_key, number)
+        
+        changed: Dict[int, List] = {}
+        next_row = len(existing) + 1
+        for row in rows[1:]:
+            number = row_numbers.get(key(row))
+            if number is None:
+                changed[next_row] = row
+                next_row += 1
+            elif not self._rows_equal(existing[number - 1], row, compared):
+                changed[number] = row
+        
+        appended = next_row - len(existing) - 1
+        self.logger.info(f"Incremental update: {len(changed) - appended} changed, {appended} new rows")
+        if not changed:
+            return True
+        
+        if next_row - 1 > worksheet.row_count:
+            self._call_with_backoff(worksheet.resize, rows=next_row - 1)
+        
+        # Merge changed rows into blocks of consecutive rows
+        blocks: List[Tuple[int, List[List]]] = []
+        for number in sorted(changed):
+            if blocks and blocks[-1][0] + len(blocks[-1][1]) == number:
+                blocks[-1][1].append(changed[number])
+            else:
+                blocks.append((number, [changed[number]]))
+        
+        self._write_rows(worksheet, blocks, len(headers))
+        return True
+    
+    @staticmethod
+    def _rows_equal(sheet_row: List[str], row: List, columns: List[int]) -> bool:
+        """Compare a row read back from the sheet (formatted strings) with new values"""
+        for i in columns:
+            old = sheet_row[i] if i < len(sheet_row) else ''
+            new = row[i]
+            if str(new) == old:
+                continue
+            try:
+                # USER_ENTERED numbers come back formatted ("4" for 4.0)
+                if float(old) == float(new):
+                    continue
+            except (TypeError, ValueError):
+                pass
+            return False
+        return True
+    
+    def _call_with_backoff(self, func, *args, **kwargs):
+        """
+        Call the Sheets API, retrying rate limited (429) and unavailable
+        responses with exponential backoff. Retry-After is honored.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return func(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                status = getattr(e.response, 'status_code', None)
+                if status not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    raise
+                wait = retry_after_seconds(getattr(e.response, 'headers', {}).get('Retry-After'))
+                if wait is None:
+                    wait = self.backoff_base * 2 ** attempt + random.uniform(0, self.backoff_base)
+                self.logger.warning(f"Sheets API returned {status}, retrying in {wait:.1f}s")
+                self.metrics.inc('retries_total', host='sheets.googleapis.com')
+                time.sleep(wait)
     
     def _format_spreadsheet(self, worksheet, num_columns: int, num_rows: int):
         """Apply basic formatting to the spreadsheet"""
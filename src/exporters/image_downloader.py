@@ -1,62 +1,128 @@
-import requests
+import hashlib
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
-import imghdr
 
 from src.core.data_models import Product
-from src.utils.logger import setup_logger
+from src.utils.logger import SAMPLED, setup_logger
+from src.utils.metrics import MetricsRegistry
+from src.utils.request_manager import RequestManager
+
+# Leading bytes of the image formats we expect
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'jpg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+)
 
 class ImageDownloader:
     """Download and manage product images"""
-    
-    def __init__(self, download_path: str = "./exports/images"):
+
+    def __init__(self, download_path: str = "./exports/images", max_workers: int = 8,
+                 request_config: Optional[Dict[str, Any]] = None, chunk_size: int = 64 * 1024,
+                 metrics: Optional[MetricsRegistry] = None):
         self.download_path = Path(download_path)
         self.download_path.mkdir(parents=True, exist_ok=True)
         self.logger = setup_logger(__name__)
-    
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+        # Pooled keep-alive session, retries and a per-host rate limit
+        config = {
+            'requests_per_second': 10,
+            'burst': max_workers,
+            'timeout': 30,
+            'retry_attempts': 3,
+            'max_concurrency_per_host': max_workers,
+        }
+        config.update(request_config or {})
+        self.metrics = metrics or MetricsRegistry()
+        self.request_manager = RequestManager(config, metrics=self.metrics)
+
     def download_product_images(self, products: List[Product]) -> List[str]:
-        """Download images for all products"""
-        downloaded_paths = []
-        
-        for product in products:
-            if product.image_url:
-                image_path = self.download_image(product.image_url, product.product_name)
-                if image_path:
-                    downloaded_paths.append(image_path)
-        
+        """Download images for all products, several at a time"""
+        # Products sharing an image URL share the downloaded file
+        image_urls = {product.image_url: product.product_name for product in products if product.image_url}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-worker") as executor:
+            paths = dict(zip(image_urls, executor.map(self.download_image, image_urls, image_urls.values())))
+
+        downloaded_paths = [paths[product.image_url] for product in products
+                            if product.image_url and paths[product.image_url]]
+
         self.logger.info(f"Downloaded {len(downloaded_paths)} product images")
         return downloaded_paths
-    
-    def download_image(self, image_url: str, product_name: str) -> str:
-        """Download a single image"""
+
+    def download_image(self, image_url: str, product_name: str) -> Optional[str]:
+        """Download a single image, streaming it to disk"""
+        temp_path = None
         try:
-            response = requests.get(image_url, timeout=30)
-            response.raise_for_status()
-            
-            # Determine file extension
-            content_type = response.headers.get('content-type', '')
-            if 'jpeg' in content_type or 'jpg' in content_type:
-                extension = 'jpg'
-            elif 'png' in content_type:
-                extension = 'png'
-            else:
-                # Try to detect from content
-                extension = imghdr.what(None, response.content) or 'jpg'
-            
-            # Create safe filename
-            safe_name = "".join(c for c in product_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_name = safe_name[:50]  # Limit length
-            filename = f"{safe_name}.{extension}"
-            filepath = self.download_path / filename
-            
-            # Save image
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-            
-            self.logger.debug(f"Downloaded image: {filename}")
+            self.request_manager.rate_limiter.acquire(urlparse(image_url).netloc)
+            timeout = self.request_manager.config.get('timeout', 30)
+            started = time.perf_counter()
+
+            with self.request_manager.session.get(image_url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                chunks = response.iter_content(chunk_size=self.chunk_size)
+                first_chunk = next(chunks, b'')
+
+                # Determine file extension
+                extension = self._extension(response.headers.get('content-type', ''), first_chunk)
+
+                # Write to a temporary file next to the target, renamed once complete
+                with tempfile.NamedTemporaryFile(dir=self.download_path, suffix='.part', delete=False) as f:
+                    temp_path = f.name
+                    f.write(first_chunk)
+                    size = len(first_chunk)
+                    for chunk in chunks:
+                        f.write(chunk)
+                        size += len(chunk)
+
+            filepath = self.download_path / self._filename(image_url, product_name, extension)
+            os.replace(temp_path, filepath)
+            self.metrics.observe('image_download_seconds', time.perf_counter() - started)
+            self.metrics.inc('image_bytes_total', size)
+            self.metrics.inc('images_total', result='downloaded')
+
+            self.logger.debug("Downloaded image: %s", filepath.name, extra=SAMPLED)
             return str(filepath)
-            
+
         except Exception as e:
-            self.logger.warning(f"Failed to download image {image_url}: {e}")
-            return None
\ No newline at end of file
+            self.logger.warning(f"Failed to download image {image_url}: {e}", extra=SAMPLED)
+            self.metrics.inc('images_total', result='failed')
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+
+    @staticmethod
+    def _extension(content_type: str, first_chunk: bytes) -> str:
+        if 'jpeg' in content_type or 'jpg' in content_type:
+            return 'jpg'
+        if 'png' in content_type:
+            return 'png'
+        if 'webp' in content_type:
+            return 'webp'
+
+        # Try to detect from content
+        for signature, extension in IMAGE_SIGNATURES:
+            if first_chunk.startswith(signature):
+                return extension
+        if first_chunk[:4] == b'RIFF' and first_chunk[8:12] == b'WEBP':
+            return 'webp'
+        return 'jpg'
+
+    @staticmethod
+    def _filename(image_url: str, product_name: str, extension: str) -> str:
+        """
+        Readable, collision-safe filename: products with the same name get
+        different files, the same image URL always maps to the same file
+        """
+        safe_name = "".join(c for c in product_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        safe_name = safe_name[:50]  # Limit length
+        url_hash = hashlib.blake2b(image_url.encode('utf-8'), digest_size=4).hexdigest()
+        return f"{safe_name}_{url_hash}.{extension}"
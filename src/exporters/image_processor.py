@@ -0,0 +1,130 @@
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from src.utils.logger import setup_logger
+
+# Pillow format names and file extensions of the supported outputs
+OUTPUT_FORMATS = {'jpeg': ('JPEG', 'jpg'), 'webp': ('WEBP', 'webp')}
+
+
+def _save_atomic(image: Image.Image, path: Path, pil_format: str, quality: int) -> None:
+    """Save next to the target and rename, so readers never see half a file"""
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix='.part', delete=False) as f:
+        temp_path = f.name
+        try:
+            image.save(f, pil_format, quality=quality, optimize=pil_format == 'JPEG')
+        except Exception:
+            f.close()
+            os.remove(temp_path)
+            raise
+    os.replace(temp_path, path)
+
+
+def _for_format(image: Image.Image, pil_format: str) -> Image.Image:
+    """Convert to a mode the output format can store"""
+    if pil_format == 'JPEG' and image.mode != 'RGB':
+        if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+            # JPEG has no alpha: flatten onto white
+            rgba = image.convert('RGBA')
+            background = Image.new('RGB', rgba.size, (255, 255, 255))
+            background.paste(rgba, mask=rgba.getchannel('A'))
+            return background
+        return image.convert('RGB')
+    if pil_format == 'WEBP' and image.mode not in ('RGB', 'RGBA'):
+        return image.convert('RGBA' if 'transparency' in image.info or 'A' in image.mode else 'RGB')
+    return image
+
+
+def _process_image(source: str, options: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Resize, recompress and thumbnail one image in a worker process.
+    Returns (processed path, thumbnail path, error).
+    """
+    try:
+        pil_format, extension = OUTPUT_FORMATS[options['format']]
+        max_size = tuple(options['max_size'])
+        thumbnail_size = tuple(options['thumbnail_size']) if options['thumbnail_size'] else None
+        name = Path(source).stem + '.' + extension
+
+        with Image.open(source) as image:
+            # JPEG can decode straight to a smaller scale (1/2, 1/4, 1/8)
+            if image.format == 'JPEG':
+                image.draft('RGB', max_size)
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail(max_size, Image.Resampling.LANCZOS)
+            image = _for_format(image, pil_format)
+
+        processed_path = Path(options['output_path']) / name
+        _save_atomic(image, processed_path, pil_format, options['quality'])
+
+        thumbnail_path = None
+        if thumbnail_size:
+            image.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
+            thumbnail_path = Path(options['thumbnail_path']) / name
+            _save_atomic(image, thumbnail_path, pil_format, options['quality'])
+
+        return str(processed_path), str(thumbnail_path) if thumbnail_path else None, None
+
+    except Exception as e:
+        return None, None, str(e)
+
+
+class ImageProcessor:
+    """Resize, recompress and thumbnail downloaded images across CPU cores"""
+
+    def __init__(self, output_path: str = "./exports/images/processed",
+                 thumbnail_path: str = "./exports/images/thumbnails",
+                 max_size: Tuple[int, int] = (1200, 1200), format: str = "jpeg", quality: int = 85,
+                 thumbnail_size: Optional[Tuple[int, int]] = (200, 200), workers: Optional[int] = None):
+        if format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported image format: {format} (use one of {', '.join(OUTPUT_FORMATS)})")
+
+        self.output_path = Path(output_path)
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        self.thumbnail_path = Path(thumbnail_path)
+        if thumbnail_size:
+            self.thumbnail_path.mkdir(parents=True, exist_ok=True)
+        self.workers = workers or os.cpu_count() or 1
+        self.logger = setup_logger(__name__)
+
+        self.options = {
+            'output_path': str(self.output_path),
+            'thumbnail_path': str(self.thumbnail_path),
+            'max_size': tuple(max_size),
+            'format': format,
+            'quality': quality,
+            'thumbnail_size': tuple(thumbnail_size) if thumbnail_size else None,
+        }
+
+    def process_images(self, image_paths: List[str]) -> List[str]:
+        """
+        Process images in a pool of worker processes.
+        Returns the processed image paths, in input order.
+        """
+        if not image_paths:
+            return []
+
+        # Batches keep inter-process overhead low for many small images
+        chunksize = max(1, min(32, len(image_paths) // (self.workers * 4)))
+        processed = []
+
+        # Spawned, not forked: the downloader and log writer threads are
+        # running, and a forked child could deadlock on locks they hold
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = pool.map(_process_image, image_paths, [self.options] * len(image_paths),
+                               chunksize=chunksize)
+            for source, (processed_path, _, error) in zip(image_paths, results):
+                if error:
+                    self.logger.warning(f"Failed to process image {source}: {error}")
+                else:
+                    processed.append(processed_path)
+
+        self.logger.info(f"Processed {len(processed)} of {len(image_paths)} images with {self.workers} workers")
+        return processed
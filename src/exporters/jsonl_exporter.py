@@ -0,0 +1,50 @@
+import json
+import time
+from itertools import islice
+from pathlib import Path
+from datetime import datetime
+from typing import Iterable, Optional
+
+from src.core.data_models import Product
+from src.utils.logger import setup_logger
+from src.utils.metrics import MetricsRegistry
+
+class JSONLinesExporter:
+    """ Export product data to JSON Lines format (one product per line)"""
+
+    def __init__(self, output_path: str="./exports", chunk_size: int = 1000,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.output_path = Path(output_path)
+        self.output_path.mkdir(exist_ok=True)
+        self.chunk_size = chunk_size
+        self.logger = setup_logger(__name__)
+        self.metrics = metrics or MetricsRegistry()
+
+    def export_products(self, products: Iterable[Product], filename: str = None) -> str:
+        """
+        Export products to JSON Lines file, writing ``chunk_size`` lines at a time
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"products_{timestamp}.jsonl"
+
+        file_path = self.output_path / filename
+
+        try:
+            count = 0
+            products = iter(products)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                while chunk := list(islice(products, self.chunk_size)):
+                    started = time.perf_counter()
+                    f.write(''.join(json.dumps(product.to_dict(), ensure_ascii=False) + '\n'
+                                    for product in chunk))
+                    count += len(chunk)
+                    self.metrics.observe('export_batch_seconds', time.perf_counter() - started, format='jsonl')
+                    self.metrics.inc('export_rows_total', len(chunk), format='jsonl')
+
+            self.logger.info(f"Successfully exported {count} products to {file_path}")
+            return str(file_path)
+
+        except Exception as e:
+            self.logger.error(f"Failed to export to JSON Lines: {e}")
+            raise
@@ -0,0 +1,63 @@
+import time
+from itertools import islice
+from pathlib import Path
+from datetime import datetime
+from typing import Iterable, Optional
+
+import pyarrow.parquet as pq
+
+from src.core.data_models import Product
+from src.core.product_batch import PRODUCT_SCHEMA, ProductBatch
+from src.utils.logger import setup_logger
+from src.utils.metrics import MetricsRegistry
+
+class ParquetExporter:
+    """ Export product data to Parquet format"""
+
+    def __init__(self, output_path: str="./exports", chunk_size: int = 10000, compression: str = "zstd",
+                 metrics: Optional[MetricsRegistry] = None):
+        self.output_path = Path(output_path)
+        self.output_path.mkdir(exist_ok=True)
+        self.chunk_size = chunk_size
+        self.compression = compression
+        self.logger = setup_logger(__name__)
+        self.metrics = metrics or MetricsRegistry()
+
+    def export_products(self, products: Iterable[Product], filename: str = None) -> str:
+        """
+        Export products to Parquet file, one row group per ``chunk_size`` products
+
+        A ``ProductBatch`` is written straight from its Arrow columns.
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"products_{timestamp}.parquet"
+
+        file_path = self.output_path / filename
+
+        try:
+            count = 0
+            with pq.ParquetWriter(file_path, PRODUCT_SCHEMA, compression=self.compression) as writer:
+                if isinstance(products, ProductBatch):
+                    started = time.perf_counter()
+                    writer.write_table(products.to_arrow(), row_group_size=self.chunk_size)
+                    count = len(products)
+                    self._record_batch(started, count)
+                else:
+                    products = iter(products)
+                    while chunk := list(islice(products, self.chunk_size)):
+                        started = time.perf_counter()
+                        writer.write_table(ProductBatch.from_products(chunk).to_arrow())
+                        count += len(chunk)
+                        self._record_batch(started, len(chunk))
+
+            self.logger.info(f"Successfully exported {count} products to {file_path}")
+            return str(file_path)
+
+        except Exception as e:
+            self.logger.error(f"Failed to export to Parquet: {e}")
+            raise
+
+    def _record_batch(self, started: float, rows: int) -> None:
+        self.metrics.observe('export_batch_seconds', time.perf_counter() - started, format='parquet')
+        self.metrics.inc('export_rows_total', rows, format='parquet')
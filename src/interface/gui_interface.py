@@ -204,7 +204,14 @@ class ScraperGUI:
             
             # Start scraping
             self.gui_logger.info(f"Starting scrape for {website_name}...")
-            products = self.scraper.scrape_catalog()
+            # Products stream in, so Stop takes effect mid-crawl
+            products = []
+            for product in self.scraper.iter_products():
+                products.append(product)
+                if not self.is_scraping:
+                    break
+            # Same price/rating columns as the CLI, which gets them from scrape_catalog
+            products = self.scraper.normalize_products(products)
             
             if products and self.is_scraping:
                 self.gui_logger.info(f"Successfully scraped {len(products)} products")
@@ -0,0 +1,270 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Optional, List, Dict, Any
+from urllib.parse import urljoin
+
+from src.core.data_models import Product
+from src.utils.logger import SAMPLED, setup_logger
+from src.utils.url_canonicalizer import UrlCanonicalizer
+
+# Numbers in text like "4.5 out of 5"
+RATING_NUMBER = re.compile(r'\d+\.?\d*')
+PRICE_JUNK = re.compile(r'[^\d.,]')
+
+class BaseParser(ABC):
+    """
+    Backend-independent product extraction.
+
+    Subclasses parse HTML with a specific library and implement the backend
+    hooks; field priority, fallbacks and cleaning live here so every backend
+    produces the same ``Product`` for the same page.
+    """
+    
+    # Built-in fallbacks, tried in order after the configured selector
+    NAME_FALLBACKS = ['h1', '.product-title', '.product-name', '[data-testid="product-title"]']
+    PRICE_FALLBACKS = ['.price', '.current-price', '.product-price', '[data-testid="price"]']
+    DESCRIPTION_FALLBACKS = ['.product-description', '.description', '[itemprop="description"]']
+    CATEGORY_FALLBACKS = ['.breadcrumb li:last-child', '.category', '[data-testid="breadcrumb-item"]:last-child']
+    OUT_OF_STOCK_INDICATORS = [
+        '.out-of-stock', '.sold-out', '.unavailable',
+        '[data-testid="out-of-stock"]', '.stock-out'
+    ]
+    IN_STOCK_INDICATORS = [
+        '.in-stock', '.available', '[data-testid="in-stock"]',
+        '.add-to-cart', '.buy-now'
+    ]
+    IMAGE_FALLBACKS = [
+        '.product-image img', '.main-image img', '[data-testid="product-image"]',
+        'img[alt*="product"]', 'img[src*="product"]', '.gallery img'
+    ]
+    SKU_SELECTORS = ['.sku', '[itemprop="sku"]', '.product-sku', '[data-testid="sku"]']
+    RATING_SELECTORS = ['.rating', '.review-score', '[itemprop="ratingValue"]', '[data-testid="rating"]']
+    
+    def __init__(self, base_url: str, selectors: dict, url_rules: Optional[dict] = None):
+        self.base_url = base_url
+        self.selectors = selectors
+        self.url_rules = url_rules
+        self.canonicalizer = UrlCanonicalizer(url_rules)
+        self.logger = setup_logger(type(self).__module__)
+        self._compile(self.product_selectors())
+    
+    def __getstate__(self) -> dict:
+        # Compiled selectors are not always picklable; rebuild them instead
+        return {'base_url': self.base_url, 'selectors': self.selectors, 'url_rules': self.url_rules}
+    
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['base_url'], state['selectors'], state.get('url_rules'))
+    
+    def product_selectors(self) -> List[str]:
+        """All selectors a product page is matched against, in priority order"""
+        configured = [self.selectors.get(key) for key in ('name', 'price', 'description', 'category', 'image', 'rating')]
+        selectors = (
+            configured + self.NAME_FALLBACKS + self.PRICE_FALLBACKS + self.DESCRIPTION_FALLBACKS
+            + self.CATEGORY_FALLBACKS + self.OUT_OF_STOCK_INDICATORS + self.IN_STOCK_INDICATORS
+            + self.IMAGE_FALLBACKS + self.SKU_SELECTORS + self.RATING_SELECTORS
+        )
+        return list(dict.fromkeys(s for s in selectors if s))
+    
+    # --- Backend hooks -------------------------------------------------
+    
+    @abstractmethod
+    def _compile(self, selectors: List[str]) -> None:
+        """Compile the product page selectors once per parser"""
+    
+    @abstractmethod
+    def _match(self, html: str) -> Dict[str, Any]:
+        """Parse a product page and return the first element matching each selector"""
+    
+    @abstractmethod
+    def _element_text(self, element: Any) -> str:
+        """Text of an element, with each string stripped and joined without separator"""
+    
+    @abstractmethod
+    def _element_attribute(self, element: Any, attribute: str) -> Optional[str]:
+        """Value of an element attribute"""
+    
+    @abstractmethod
+    def _link_hrefs(self, html: str, selector: str) -> List[Optional[str]]:
+        """``href`` of every element matching ``selector`` in a listing page"""
+    
+    # --- Shared extraction ---------------------------------------------
+    
+    def parse_product_page(self, html: str, product_url: str) -> Optional[Product]:
+        """
+        Parse product details from HTML content with enhanced extraction
+        """
+        try:
+            # First match of every selector
+            matches = self._match(html)
+            
+            # Enhanced data extraction with multiple fallback selectors
+            price = self._extract_with_fallbacks(matches, ['price'], self.PRICE_FALLBACKS)
+            product_data = {
+                'product_url': product_url,
+                'product_name': self._extract_with_fallbacks(matches, ['name'], self.NAME_FALLBACKS),
+                'price': price,
+                'availability': self._extract_availability(matches),
+                'description': self._extract_with_fallbacks(matches, ['description'], self.DESCRIPTION_FALLBACKS),
+                'category': self._extract_with_fallbacks(matches, ['category'], self.CATEGORY_FALLBACKS),
+                'image_url': self._extract_image(matches),
+                'sku': self._extract_sku(matches),
+                'rating': self._extract_rating(matches),
+                # Raw values for batch normalization (amount, currency, rating words)
+                'price_text': price,
+                'rating_text': self._extract_rating_text(matches)
+            }
+            
+            # Clean and validate data
+            product_data = self._clean_product_data(product_data)
+            
+            # Create Product object
+            product = Product(**product_data)
+            
+            self.logger.debug("Parsed product: %s", product.product_name, extra=SAMPLED)
+            return product
+            
+        except Exception as e:
+            self.logger.error(f"Failed to parse product page {product_url}: {e}", extra=SAMPLED)
+            return None
+        
+    def _extract_text(self, matches: Dict[str, Any], selector: str) -> Optional[str]:
+        """Extract text of the element matched by a CSS selector"""
+        if not selector:
+            return None
+        
+        element = matches.get(selector)
+        return self._element_text(element) if element is not None else None
+    
+    def _extract_attribute(self, matches: Dict[str, Any], selector: str, attribute: str) -> Optional[str]:
+        """Extract attribute value of the element matched by a CSS selector"""
+        if not selector:
+            return None
+        
+        element = matches.get(selector)
+        return self._element_attribute(element, attribute) if element is not None else None
+    
+    def extract_product_links(self, html: str, base_page_url: str = None) -> List[str]:
+
+        links = []
+
+        selector = self.selectors.get('product_links')
+        if not selector:
+            self.logger.warning("No product_links selector configured")
+            return links
+
+        # Canonical form, so tracking parameters, fragments and "../" or
+        # trailing-slash variants of one product are fetched once
+        canonical = map(self.canonicalizer.canonicalize, self.extract_links(html, selector, base_page_url))
+        links = list(dict.fromkeys(canonical))
+
+        self.logger.info(f"Found {len(links)} product links", extra=SAMPLED)
+        return links
+    
+    def extract_links(self, html: str, selector: str, base_page_url: str = None) -> List[str]:
+        """Absolute URLs of every element matching ``selector``"""
+        # Prefer listing page URL when joining; fallback to base_url
+        join_base = base_page_url or self.base_url
+
+        return [urljoin(join_base, href) for href in self._link_hrefs(html, selector) if href]
+    
+    def _extract_with_fallbacks(self, matches: Dict[str, Any], config_keys: list, fallback_selectors: list) -> Optional[str]:
+        """Extract data using configured selectors first, then fallbacks"""
+        # Try configured selectors first
+        for key in config_keys:
+            selector = self.selectors.get(key)
+            if selector:
+                result = self._extract_text(matches, selector)
+                if result:
+                    return result
+        
+        # Try fallback selectors
+        for selector in fallback_selectors:
+            result = self._extract_text(matches, selector)
+            if result:
+                return result
+        
+        return None
+    
+    def _extract_availability(self, matches: Dict[str, Any]) -> str:
+        """Extract product availability status"""
+        # Look for out-of-stock indicators
+        for selector in self.OUT_OF_STOCK_INDICATORS:
+            if selector in matches:
+                return "Out of stock"
+        
+        # Look for in-stock indicators
+        for selector in self.IN_STOCK_INDICATORS:
+            if selector in matches:
+                return "In stock"
+        
+        return "Unknown"
+    def _extract_image(self, matches: Dict[str, Any]) -> Optional[str]:
+        """Extract product image with multiple strategies"""
+        # Try configured selector first
+        configured_selector = self.selectors.get('image')
+        if configured_selector:
+            image_url = self._extract_attribute(matches, configured_selector, 'src')
+            if image_url:
+                return image_url
+        
+        # Fallback strategies
+        for selector in self.IMAGE_FALLBACKS:
+            image_url = self._extract_attribute(matches, selector, 'src')
+            if image_url and not any(x in image_url.lower() for x in ['logo', 'icon', 'placeholder']):
+                return image_url
+        
+        return None
+    def _extract_sku(self, matches: Dict[str, Any]) -> Optional[str]:
+        """Extract product SKU"""
+        for selector in self.SKU_SELECTORS:
+            sku = self._extract_text(matches, selector)
+            if sku:
+                return sku.strip()
+        
+        return None
+    def _extract_rating(self, matches: Dict[str, Any]) -> Optional[float]:
+        """Extract product rating"""
+        for selector in self.RATING_SELECTORS:
+            rating_text = self._extract_text(matches, selector)
+            if rating_text:
+                try:
+                    # Extract numbers from text like "4.5 out of 5"
+                    numbers = RATING_NUMBER.findall(rating_text)
+                    if numbers:
+                        return float(numbers[0])
+                except (ValueError, IndexError):
+                    continue
+        
+        return None
+    
+    def _extract_rating_text(self, matches: Dict[str, Any]) -> Optional[str]:
+        """Raw rating text, or the class of icon-only ratings ("star-rating Three")"""
+        configured_selector = self.selectors.get('rating')
+        for selector in ([configured_selector] if configured_selector else []) + self.RATING_SELECTORS:
+            element = matches.get(selector)
+            if element is None:
+                continue
+            text = self._element_text(element)
+            if text:
+                return text
+            css_class = self._element_attribute(element, 'class')
+            if css_class:
+                # bs4 returns class as a list
+                return ' '.join(css_class) if isinstance(css_class, list) else css_class
+        
+        return None
+    
+    def _clean_product_data(self, product_data: dict) -> dict:
+        """Clean and normalize product data"""
+        cleaned = product_data.copy()
+        
+        # Clean price
+        if cleaned['price']:
+            # Remove currency symbols and extra spaces
+            cleaned['price'] = PRICE_JUNK.sub('', cleaned['price']).strip()
+        
+        # Clean description - remove extra whitespace
+        if cleaned['description']:
+            cleaned['description'] = ' '.join(cleaned['description'].split())
+        
+        return cleaned
\ No newline at end of file
@@ -0,0 +1,27 @@
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from typing import List
+
+# Parse bytes as UTF-8 so documents with an encoding declaration are accepted
+HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+def parse_document(html: str) -> etree._Element:
+    """Parse an HTML document with lxml"""
+    return lxml.html.document_fromstring(html.encode('utf-8'), parser=HTML_PARSER)
+
+class LinkExtractor:
+    """
+    Fast path for listing pages: returns the ``href`` of every element
+    matching a CSS selector. The selector is compiled once to an XPath that
+    selects the attribute values directly, so no element objects are built
+    and the C-level tree is freed as soon as the call returns.
+    """
+    
+    def __init__(self, selector: str):
+        self.selector = selector
+        path = CSSSelector(selector, translator='html').path
+        self._hrefs = etree.XPath(f"({path})/@href")
+    
+    def hrefs(self, html: str) -> List[str]:
+        return [str(href) for href in self._hrefs(parse_document(html))]
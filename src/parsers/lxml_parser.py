@@ -0,0 +1,42 @@
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from typing import Optional, List, Dict
+
+from src.parsers.base_parser import BaseParser
+from src.parsers.link_extractor import LinkExtractor, parse_document
+
+# Text nodes BeautifulSoup's get_text() would return (no script/style/template content)
+VISIBLE_TEXT = etree.XPath('.//text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+
+class LxmlParser(BaseParser):
+    """
+    Native lxml.html parser with selectors precompiled to XPath via cssselect
+    """
+    
+    def _compile(self, selectors: List[str]) -> None:
+        # "(expr)[1]" lets libxml2 return only the first match in document order
+        self._first_match = {
+            selector: etree.XPath(f"({CSSSelector(selector, translator='html').path})[1]")
+            for selector in selectors
+        }
+        self._link_extractors: Dict[str, LinkExtractor] = {}
+    
+    def _match(self, html: str) -> Dict[str, etree._Element]:
+        root = parse_document(html)
+        matches = {}
+        for selector, xpath in self._first_match.items():
+            found = xpath(root)
+            if found:
+                matches[selector] = found[0]
+        return matches
+    
+    def _element_text(self, element: etree._Element) -> str:
+        return ''.join(text.strip() for text in VISIBLE_TEXT(element))
+    
+    def _element_attribute(self, element: etree._Element, attribute: str) -> Optional[str]:
+        return element.get(attribute)
+    
+    def _link_hrefs(self, html: str, selector: str) -> List[Optional[str]]:
+        if selector not in self._link_extractors:
+            self._link_extractors[selector] = LinkExtractor(selector)
+        return self._link_extractors[selector].hrefs(html)
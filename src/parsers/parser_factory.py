@@ -0,0 +1,31 @@
+from typing import Optional
+
+from src.parsers.base_parser import BaseParser
+from src.parsers.bs4_parser import BS4Parser
+from src.utils.logger import setup_logger
+
+PARSER_BACKENDS = ('bs4', 'lxml', 'selectolax')
+
+def create_parser(backend: str, base_url: str, selectors: dict, url_rules: Optional[dict] = None) -> BaseParser:
+    """
+    Create the parser backend named in a website template's "parser" key.
+    ``url_rules`` are the template's "url_canonicalization" rules.
+    Falls back to BS4Parser if the backend is unknown or not installed.
+    """
+    logger = setup_logger(__name__)
+    backend = (backend or 'bs4').lower()
+
+    try:
+        if backend == 'lxml':
+            from src.parsers.lxml_parser import LxmlParser
+            return LxmlParser(base_url, selectors, url_rules)
+        if backend == 'selectolax':
+            from src.parsers.selectolax_parser import SelectolaxParser
+            return SelectolaxParser(base_url, selectors, url_rules)
+    except ImportError as e:
+        logger.warning(f"Parser backend '{backend}' is not available ({e}), using bs4")
+        return BS4Parser(base_url, selectors, url_rules)
+
+    if backend != 'bs4':
+        logger.warning(f"Unknown parser backend '{backend}', using bs4")
+    return BS4Parser(base_url, selectors, url_rules)
@@ -0,0 +1,41 @@
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from typing import Optional, List, Dict
+
+from src.parsers.base_parser import BaseParser
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+HIDDEN_TEXT_PARENTS = {'script', 'style', 'template'}
+
+class SelectolaxParser(BaseParser):
+    """
+    selectolax (lexbor) parser, the fastest backend for large pages.
+
+    lexbor is an HTML5 parser, so on malformed markup its tree can differ from
+    lxml's (e.g. it inserts <tbody> into tables); keep selectors tolerant.
+    """
+    
+    def _compile(self, selectors: List[str]) -> None:
+        # lexbor compiles and caches selectors internally
+        self._selectors = selectors
+    
+    def _match(self, html: str) -> Dict[str, LexborNode]:
+        tree = LexborHTMLParser(html)
+        matches = {}
+        for selector in self._selectors:
+            node = tree.css_first(selector)
+            if node is not None:
+                matches[selector] = node
+        return matches
+    
+    def _element_text(self, element: LexborNode) -> str:
+        return ''.join(
+            node.text_content.strip()
+            for node in element.traverse(include_text=True)
+            if node.tag == '-text' and node.parent.tag not in HIDDEN_TEXT_PARENTS
+        )
+    
+    def _element_attribute(self, element: LexborNode, attribute: str) -> Optional[str]:
+        return element.attributes.get(attribute)
+    
+    def _link_hrefs(self, html: str, selector: str) -> List[Optional[str]]:
+        return [node.attributes.get('href') for node in LexborHTMLParser(html).css(selector)]
@@ -0,0 +1,173 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+# Parts of a selector that never contribute a required tag/class/id
+_PAREN_CONTENT = re.compile(r'\([^()]*\)')
+_ATTRIBUTE = re.compile(r'\[\s*([\w-]+)[^\]]*\]')
+_ATTRIBUTE_MARKER = re.compile(r'\[(\d+)\]')
+_COMBINATORS = re.compile(r'\s*[>+~]\s*|\s+')
+_ID = re.compile(r'#([\w-]+)')
+_CLASS = re.compile(r'\.([\w-]+)')
+_TAG = re.compile(r'^([a-zA-Z][\w-]*)')
+
+
+def _split_selector(selector: str) -> Optional[Tuple[str, List[Tuple[str, List[str]]]]]:
+    """
+    Split a selector into compounds, each paired with its attribute names.
+    Also returns the selector with pseudo-class arguments and attribute
+    blocks masked out. Returns None for selector lists and namespaces.
+    """
+    if ',' in selector or '|' in selector:
+        return None
+
+    # Drop pseudo-class arguments such as :not(.x) so they are never used as keys
+    stripped = selector
+    while _PAREN_CONTENT.search(stripped):
+        stripped = _PAREN_CONTENT.sub('', stripped)
+
+    # Replace attribute blocks with an indexed marker that survives the split
+    attributes = [name.lower() for name in _ATTRIBUTE.findall(stripped)]
+    counter = iter(range(len(attributes)))
+    stripped = _ATTRIBUTE.sub(lambda m: f'[{next(counter)}]', stripped).strip()
+
+    compounds = [
+        (compound, [attributes[int(i)] for i in _ATTRIBUTE_MARKER.findall(compound)])
+        for compound in _COMBINATORS.split(stripped) if compound
+    ]
+    return stripped, compounds
+
+
+def _compound_key(compound: str, attributes: List[str]) -> Optional[tuple]:
+    """
+    A cheap necessary condition for an element to match a compound selector:
+    ('id', x), ('class', x), ('attr', x) or ('tag', x), most selective first.
+    """
+    id_match = _ID.search(compound)
+    if id_match:
+        return ('id', id_match.group(1))
+    class_match = _CLASS.search(compound)
+    if class_match:
+        return ('class', class_match.group(1))
+    if attributes:
+        return ('attr', attributes[0])
+    tag_match = _TAG.match(compound)
+    if tag_match:
+        return ('tag', tag_match.group(1).lower())
+    return None
+
+
+def _prefilter_key(selector: str) -> Optional[tuple]:
+    """
+    Return a cheap necessary condition for an element to match ``selector``,
+    taken from its rightmost compound. Returns None when no safe key can be
+    derived.
+    """
+    split = _split_selector(selector)
+    if not split or not split[1]:
+        return None
+    return _compound_key(*split[1][-1])
+
+
+def listing_strainer(selector: str) -> Optional[SoupStrainer]:
+    """
+    Build a SoupStrainer that keeps only the subtrees that can contain
+    matches of ``selector``: elements matching its leftmost compound, with
+    everything below them.
+
+    Returns None (parse the whole page) when straining could change the
+    result: sibling combinators, pseudo-classes on the leftmost compound
+    (e.g. :nth-child depends on dropped siblings) or no usable key.
+    """
+    split = _split_selector(selector)
+    if not split or not split[1]:
+        return None
+    stripped, compounds = split
+    if '+' in stripped or '~' in stripped:
+        return None
+
+    first, attributes = compounds[0]
+    if ':' in first:
+        return None
+
+    key = _compound_key(first, attributes)
+    if key is None:
+        return None
+    kind, value = key
+    if kind == 'tag':
+        return SoupStrainer(value)
+    if kind == 'class':
+        return SoupStrainer(class_=value)
+    if kind == 'id':
+        return SoupStrainer(id=value)
+    return SoupStrainer(attrs={value: True})
+
+
+class SelectorPlan:
+    """
+    A set of CSS selectors compiled once and resolved in a single traversal.
+
+    ``match`` returns, for every selector, the first element in document
+    order that matches it - the same element ``soup.select_one`` would
+    return - while walking the document only once. Each element is only
+    tested against selectors whose rightmost id/class/attribute/tag it has.
+    """
+
+    def __init__(self, selectors: Iterable[str]):
+        # Keep first occurrence order, drop empties and duplicates
+        self.selectors: List[str] = list(dict.fromkeys(s for s in selectors if s))
+        self._compiled = [soupsieve.compile(s) for s in self.selectors]
+
+        self._by_id: Dict[str, List[int]] = {}
+        self._by_class: Dict[str, List[int]] = {}
+        self._by_attr: Dict[str, List[int]] = {}
+        self._by_tag: Dict[str, List[int]] = {}
+        self._unfiltered: List[int] = []
+
+        index_for = {'id': self._by_id, 'class': self._by_class,
+                     'attr': self._by_attr, 'tag': self._by_tag}
+        for i, selector in enumerate(self.selectors):
+            key = _prefilter_key(selector)
+            if key is None:
+                self._unfiltered.append(i)
+            else:
+                index_for[key[0]].setdefault(key[1], []).append(i)
+
+    def match(self, soup: BeautifulSoup) -> Dict[str, Tag]:
+        """Return the first matching element for each selector that matches"""
+        compiled = self._compiled
+        by_id, by_class, by_attr, by_tag = self._by_id, self._by_class, self._by_attr, self._by_tag
+        unfiltered = self._unfiltered
+        found: Dict[int, Tag] = {}
+        total = len(compiled)
+
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+
+            candidates = []
+            if element.name in by_tag:
+                candidates.extend(by_tag[element.name])
+            attrs = element.attrs
+            if attrs:
+                for attr in attrs:
+                    if attr in by_attr:
+                        candidates.extend(by_attr[attr])
+                element_id = attrs.get('id')
+                if element_id in by_id:
+                    candidates.extend(by_id[element_id])
+                for css_class in attrs.get('class', ()):
+                    if css_class in by_class:
+                        candidates.extend(by_class[css_class])
+            candidates.extend(unfiltered)
+
+            for i in candidates:
+                if i not in found and compiled[i].match(element):
+                    found[i] = element
+
+            if len(found) == total:
+                break
+
+        return {self.selectors[i]: element for i, element in found.items()}
@@ -0,0 +1,193 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .logger import setup_logger
+from .rate_limiter import HostRateLimiter
+from .retry_after import retry_after_seconds
+
+# Statuses a server uses to say "slow down"
+OVERLOAD_STATUS = (429, 503)
+
+DEFAULT_SETTINGS = {
+    'initial_concurrency': 1,
+    'min_concurrency': 1,
+    'max_concurrency': None,  # default: max_concurrency_per_host
+    'min_requests_per_second': 0.2,
+    'max_requests_per_second': None,  # default: 4x the configured rate
+    'rate_increase': 0.5,  # requests/second added per healthy window
+    'decrease_factor': 0.5,  # multiplier on overload
+    'latency_factor': 2.0,  # TTFB this many times the baseline counts as overload
+    'cooldown_seconds': 5.0,  # minimum time between two decreases
+    'backoff_seconds': 1.0,  # pause after a 429/503 without Retry-After, doubled each time
+    'max_pause_seconds': 300.0,
+}
+
+
+class HostThrottle:
+    """
+    AIMD controller for one host.
+
+    Every healthy window (as many good responses as the current
+    concurrency) adds one concurrent request and ``rate_increase`` to the
+    request rate. A 429/503, a timeout, or a time-to-first-byte well above
+    the host's baseline multiplies both by ``decrease_factor``. A 429/503
+    also pauses the host for its Retry-After, or an exponential backoff.
+    """
+
+    def __init__(self, host: str, bucket, settings: Dict[str, Any], max_concurrency: int):
+        self.host = host
+        self.bucket = bucket
+        self.settings = settings
+        self.logger = setup_logger(__name__)
+
+        self.max_concurrency = settings['max_concurrency'] or max_concurrency
+        self.min_concurrency = min(settings['min_concurrency'], self.max_concurrency)
+        self.concurrency = max(self.min_concurrency, min(settings['initial_concurrency'], self.max_concurrency))
+        # Rate control only applies when the host is rate limited at all
+        self.rate_limited = bucket.rate > 0
+        self.min_rate = settings['min_requests_per_second']
+        self.max_rate = settings['max_requests_per_second'] or bucket.rate * 4
+
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.healthy = 0
+        self.overloads = 0
+        self.last_decrease = 0.0
+        self.ttfb_baseline: Optional[float] = None
+        self.ttfb_recent: Optional[float] = None
+        self.samples = 0
+        self._condition = threading.Condition()
+
+    def pause_remaining(self) -> float:
+        return max(0.0, self.paused_until - time.monotonic())
+
+    def acquire(self) -> None:
+        """Block until the host is not paused and a concurrency slot is free"""
+        with self._condition:
+            while True:
+                pause = self.pause_remaining()
+                if pause <= 0 and self.in_flight < self.concurrency:
+                    self.in_flight += 1
+                    return
+                self._condition.wait(pause if pause > 0 else None)
+
+    def release(self, status: Optional[int], ttfb: Optional[float], retry_after: Optional[float]) -> None:
+        """
+        Report the outcome of a request: its status (None for a connection
+        error or timeout), time to first byte and Retry-After
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if status in OVERLOAD_STATUS:
+                self._pause(status, retry_after)
+                self._decrease(f"HTTP {status}")
+            elif status is None:
+                self._decrease("connection error or timeout")
+            elif ttfb is not None and self._slow(ttfb):
+                self._decrease(f"TTFB {self.ttfb_recent * 1000:.0f} ms vs baseline "
+                               f"{self.ttfb_baseline * 1000:.0f} ms")
+            elif status < 500:
+                self.overloads = 0
+                self.healthy += 1
+                if self.healthy >= self.concurrency:
+                    self._increase()
+            self._condition.notify_all()
+
+    def _slow(self, ttfb: float) -> bool:
+        """Track TTFB averages; True when recent requests are well above the baseline"""
+        self.samples += 1
+        if self.ttfb_baseline is None:
+            self.ttfb_baseline = self.ttfb_recent = ttfb
+            return False
+        # Fast average reacts within a few requests, the baseline drifts slowly
+        self.ttfb_recent += 0.3 * (ttfb - self.ttfb_recent)
+        self.ttfb_baseline += 0.02 * (ttfb - self.ttfb_baseline)
+        return self.samples >= 10 and self.ttfb_recent > self.ttfb_baseline * self.settings['latency_factor']
+
+    def _pause(self, status: int, retry_after: Optional[float]) -> None:
+        self.overloads += 1
+        if retry_after is None:
+            pause = self.settings['backoff_seconds'] * 2 ** (self.overloads - 1)
+        else:
+            pause = retry_after
+        pause = min(pause, self.settings['max_pause_seconds'])
+        if pause > self.pause_remaining():
+            self.paused_until = time.monotonic() + pause
+            source = "Retry-After" if retry_after is not None else "backoff"
+            self.logger.warning(f"{self.host}: HTTP {status}, pausing {pause:.1f}s ({source})")
+
+    def _decrease(self, reason: str) -> None:
+        self.healthy = 0
+        now = time.monotonic()
+        # One decrease per cooldown: a burst of errors is one congestion event
+        if now - self.last_decrease < self.settings['cooldown_seconds']:
+            return
+        self.last_decrease = now
+
+        concurrency = max(self.min_concurrency, int(self.concurrency * self.settings['decrease_factor']))
+        rate = self.bucket.rate
+        if self.rate_limited:
+            rate = max(self.min_rate, rate * self.settings['decrease_factor'])
+        self.logger.info(f"{self.host}: backing off ({reason}): concurrency {self.concurrency} -> {concurrency}"
+                         + (f", rate {self.bucket.rate:.2f} -> {rate:.2f}/s" if self.rate_limited else ""))
+        self.concurrency = concurrency
+        if self.rate_limited:
+            self.bucket.set_rate(rate)
+
+    def _increase(self) -> None:
+        self.healthy = 0
+        concurrency = min(self.max_concurrency, self.concurrency + 1)
+        rate = self.bucket.rate
+        if self.rate_limited:
+            rate = min(self.max_rate, rate + self.settings['rate_increase'])
+        if concurrency == self.concurrency and rate == self.bucket.rate:
+            return
+        self.logger.info(f"{self.host}: healthy, concurrency {self.concurrency} -> {concurrency}"
+                         + (f", rate {self.bucket.rate:.2f} -> {rate:.2f}/s" if self.rate_limited else ""))
+        self.concurrency = concurrency
+        if self.rate_limited:
+            self.bucket.set_rate(rate)
+
+
+class AdaptiveThrottle:
+    """Keeps one AIMD controller per host, adjusting the rate limiter's buckets"""
+
+    def __init__(self, rate_limiter: HostRateLimiter, max_concurrency: int,
+                 settings: Optional[Dict[str, Any]] = None):
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency
+        self.settings = {**DEFAULT_SETTINGS, **(settings or {})}
+        self._hosts: Dict[str, HostThrottle] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict, rate_limiter: HostRateLimiter) -> Optional["AdaptiveThrottle"]:
+        """Build from request settings' "adaptive" block, None if not enabled"""
+        adaptive = config.get('adaptive') or {}
+        if not adaptive.get('enabled'):
+            return None
+        settings = {key: value for key, value in adaptive.items() if key != 'enabled'}
+        return cls(rate_limiter, config.get('max_concurrency_per_host', 8), settings)
+
+    def host(self, host: str) -> HostThrottle:
+        """Return the controller for a host, creating it on first use"""
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostThrottle(host, self.rate_limiter.bucket(host), self.settings,
+                                                 self.max_concurrency)
+            return self._hosts[host]
+
+    def acquire(self, host: str) -> None:
+        self.host(host).acquire()
+
+    def release(self, host: str, response) -> None:
+        """Report a response (None for a connection error or timeout)"""
+        if response is None:
+            self.host(host).release(None, None, None)
+            return
+        self.host(host).release(response.status_code, response.elapsed.total_seconds(),
+                                retry_after_seconds(response.headers.get('Retry-After')))
+
+    def pause_remaining(self, host: str) -> float:
+        return self.host(host).pause_remaining()
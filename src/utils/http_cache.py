@@ -0,0 +1,184 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .logger import setup_logger
+
+# Headers worth keeping with a cached body
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control', 'Content-Language')
+# Reads are recorded in memory and written this many at a time
+ACCESS_FLUSH_SIZE = 256
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: bytes
+    headers: Dict[str, str]
+    encoding: Optional[str]
+    stored_at: float
+
+    @property
+    def etag(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get('Last-Modified')
+
+    def is_fresh(self, ttl_seconds: float) -> bool:
+        return ttl_seconds > 0 and time.time() - self.stored_at < ttl_seconds
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a 200 response from the cached body"""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.url
+        response._content = self.body
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response.reason = 'OK'
+        response.from_cache = True
+        return response
+
+
+class HttpCache:
+    """
+    Persistent on-disk HTTP response cache (SQLite).
+
+    Stores bodies with their validators (ETag / Last-Modified) and evicts
+    the least recently used entries once the total body size exceeds
+    ``max_size_mb``. Thread-safe.
+
+    Reads do not write: their last-access times are kept in memory and
+    stored in batches, and always before an eviction.
+    """
+
+    def __init__(self, path: str = "cache/http_cache.sqlite3", max_size_mb: float = 500):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.logger = setup_logger(__name__)
+        self._lock = threading.Lock()
+        self._accessed: Dict[str, float] = {}  # url -> last access not yet stored
+
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                headers TEXT NOT NULL,
+                encoding TEXT,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)")
+        self._db.commit()
+        self._total_size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached entry for a URL and mark it as recently used"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, headers, encoding, stored_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[url] = time.time()
+            if len(self._accessed) >= ACCESS_FLUSH_SIZE:
+                self._flush_access()
+                self._db.commit()
+
+        body, headers, encoding, stored_at = row
+        return CacheEntry(url, body, json.loads(headers), encoding, stored_at)
+
+    def put(self, url: str, response: requests.Response) -> None:
+        """Store a successful response"""
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control:
+            return
+
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        now = time.time()
+
+        with self._lock:
+            self._flush_access()
+            previous = self._db.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, json.dumps(headers), response.encoding, now, now, len(body))
+            )
+            self._total_size += len(body) - (previous[0] if previous else 0)
+            self._evict()
+            self._db.commit()
+
+    def refresh(self, url: str, response: requests.Response) -> None:
+        """Record a successful revalidation (304) and any updated validators"""
+        with self._lock:
+            row = self._db.execute("SELECT headers FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return
+            headers = json.loads(row[0])
+            for name in ('ETag', 'Last-Modified', 'Cache-Control'):
+                if name in response.headers:
+                    headers[name] = response.headers[name]
+            now = time.time()
+            self._accessed.pop(url, None)
+            self._db.execute(
+                "UPDATE responses SET headers = ?, stored_at = ?, last_access = ? WHERE url = ?",
+                (json.dumps(headers), now, now, url)
+            )
+            self._db.commit()
+
+    def _flush_access(self) -> None:
+        """Store the pending last-access times; the caller holds the lock and commits"""
+        if self._accessed:
+            self._db.executemany("UPDATE responses SET last_access = ? WHERE url = ?",
+                                 [(accessed, url) for url, accessed in self._accessed.items()])
+            self._accessed.clear()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is under its cap"""
+        if self._total_size <= self.max_bytes:
+            return
+
+        # Evict down to 90% so eviction does not run on every insert
+        target = self.max_bytes * 0.9
+        evicted = 0
+        rows = self._db.execute("SELECT url, size FROM responses ORDER BY last_access").fetchall()
+        for url, size in rows:
+            if self._total_size <= target:
+                break
+            self._db.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._total_size -= size
+            evicted += 1
+        self.logger.debug(f"Evicted {evicted} cached responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_access()
+            self._db.commit()
+            self._db.close()
@@ -1,32 +1,202 @@
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-def setup_logger(name: str, log_level:str="INFO") -> logging.Logger:
-    """ 
-    Set up a logger with constant formatting
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Pass as ``extra=SAMPLED`` on per-URL / per-page messages to rate-limit them
+SAMPLED = {'sampled': True}
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """One JSON object per record"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class ModuleFileHandler(logging.Handler):
+    """Writes each logger's records to ``<log_dir>/<logger name>.log``"""
+
+    def __init__(self, log_dir: str = "logs"):
+        super().__init__()
+        # Files are opened lazily, so pin the directory against later chdir()
+        self.log_dir = Path(log_dir).resolve()
+        self._files: Dict[str, logging.FileHandler] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        handler = self._files.get(record.name)
+        if handler is None:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            handler = logging.FileHandler(self.log_dir / f"{record.name}.log")
+            handler.setFormatter(self.formatter)
+            self._files[record.name] = handler
+        handler.emit(record)
+
+    def close(self) -> None:
+        for handler in self._files.values():
+            handler.close()
+        self._files.clear()
+        super().close()
+
+
+class SamplingFilter(logging.Filter):
     """
-    logger=logging.getLogger(name)
+    Rate-limits records logged with ``extra=SAMPLED``, per call site.
 
-    if logger.handlers:
-        return logger
-    logger.setLevel(getattr(logging, log_level.upper()))
+    In every ``interval`` seconds a call site logs its first ``burst``
+    records, then one in ``every`` (``every=0`` drops the rest). The next
+    record let through says how many were suppressed. Warnings and errors
+    are never sampled.
+    """
+
+    def __init__(self, burst: int = 5, interval: float = 10.0, every: int = 100):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.every = every
+        self._sites: Dict[Tuple[str, int], Tuple[float, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, 'sampled', False) or record.levelno >= logging.WARNING:
+            return True
+        now = time.monotonic()
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            window_start, seen, suppressed = self._sites.get(key, (now, 0, 0))
+            if now - window_start >= self.interval:
+                window_start, seen = now, 0
+            seen += 1
+            keep = seen <= self.burst or (self.every > 0 and (seen - self.burst) % self.every == 0)
+            self._sites[key] = (window_start, seen, 0 if keep else suppressed + 1)
+        if keep and suppressed:
+            record.msg = f"{record.getMessage()} [{suppressed} similar messages suppressed]"
+            record.args = ()
+        return keep
+
+
+class SharedQueueHandler(QueueHandler):
+    """
+    Puts records on the queue of the shared writer thread. A forked child
+    has no writer thread, so records are written there directly.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue):
+        super().__init__(log_queue)
+        self.pid = os.getpid()
+        self.listener: Optional[QueueListener] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if os.getpid() == self.pid or self.listener is None:
+            super().emit(record)
+        else:
+            self.listener.handle(record)
 
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
 
+_lock = threading.Lock()
+_handler: Optional[SharedQueueHandler] = None
+# configure_logging() arguments of the running writer
+_settings: Dict = {}
+
+
+def _shared_handler() -> SharedQueueHandler:
+    with _lock:
+        if _handler is None:
+            _start_backend()
+        return _handler
+
+
+def _start_backend(log_dir: str = "logs", json_path: Optional[str] = None,
+                   sampling: Optional[Dict] = None) -> None:
+    """(Re)start the writer thread; the caller holds ``_lock``"""
+    global _handler, _settings
+    _settings = {'log_dir': log_dir, 'json_path': json_path, 'sampling': sampling}
+    if _handler is None:
+        _handler = SharedQueueHandler(queue.SimpleQueue())
+        atexit.register(shutdown_logging)
+    elif _handler.listener:
+        _stop_listener(_handler.listener)
+
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    file_handler = ModuleFileHandler(log_dir)
+    file_handler.setFormatter(formatter)
+    handlers = [console_handler, file_handler]
+    if json_path:
+        Path(json_path).parent.mkdir(parents=True, exist_ok=True)
+        json_handler = logging.FileHandler(json_path)
+        json_handler.setFormatter(JSONLinesFormatter())
+        handlers.append(json_handler)
 
+    _handler.filters = [SamplingFilter(**(sampling or {}))]
+    _handler.pid = os.getpid()
+    _handler.listener = QueueListener(_handler.queue, *handlers, respect_handler_level=True)
+    _handler.listener.start()
 
-    log_file = Path("logs") / f"{name}.log"
-    log_file.parent.mkdir(exist_ok=True)
 
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+def _stop_listener(listener: QueueListener) -> None:
+    """Write out what is queued, then close the handlers"""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def configure_logging(log_dir: str = "logs", json_path: Optional[str] = None,
+                      sampling: Optional[Dict] = None) -> None:
+    """
+    Configure the shared log writer used by every ``setup_logger`` logger:
+    per-logger files in ``log_dir``, an optional JSON-lines file at
+    ``json_path``, and the SamplingFilter settings (burst, interval, every).
+    """
+    with _lock:
+        _start_backend(log_dir, json_path, sampling)
+
+
+def logging_settings() -> Dict:
+    """The current configure_logging() arguments, to set up worker processes the same way"""
+    with _lock:
+        return dict(_settings)
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the shared writer (runs at exit)"""
+    with _lock:
+        if _handler and _handler.listener and _handler.pid == os.getpid():
+            _stop_listener(_handler.listener)
+            _handler.listener = None
+
+
+def setup_logger(name: str, log_level:str="INFO") -> logging.Logger:
+    """
+    Set up a logger with constant formatting. Records go through a queue
+    to one shared writer thread, so logging never blocks on file I/O.
+    """
+    logger=logging.getLogger(name)
+
+    if logger.handlers:
+        return logger
+    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.addHandler(_shared_handler())
 
     return logger
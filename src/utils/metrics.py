@@ -0,0 +1,215 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Latency buckets in seconds (upper bounds), as in Prometheus client defaults
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: str = "") -> str:
+    parts = [f'{name}="{value}"' for name, value in key]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Histogram:
+    """Bucketed distribution of observed values"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating inside its bucket"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'buckets': dict(zip([*map(str, self.buckets), '+Inf'], self.counts)),
+        }
+
+
+class MetricsRegistry:
+    """
+    Thread-safe counters and latency histograms with labels.
+
+    ``snapshot()`` gives the current values as a dict (JSON-ready),
+    ``to_prometheus()`` in the Prometheus text format, and ``summary()``
+    as readable lines for the end of a run.
+    """
+
+    def __init__(self, prefix: str = "scraper"):
+        self.prefix = prefix
+        self.started = time.monotonic()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram()
+            series[key].observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Observe the duration of a ``with`` block in seconds"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def counter_total(self, name: str, **labels) -> float:
+        """Sum of a counter over every series matching ``labels``"""
+        wanted = set(_label_key(labels))
+        with self._lock:
+            return sum(value for key, value in self._counters.get(name, {}).items() if wanted <= set(key))
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def snapshot(self) -> dict:
+        elapsed = self.elapsed()
+        with self._lock:
+            counters = {name: [{'labels': dict(key), 'value': value} for key, value in series.items()]
+                        for name, series in self._counters.items()}
+            histograms = {name: [{'labels': dict(key), **histogram.to_dict()} for key, histogram in series.items()]
+                          for name, series in self._histograms.items()}
+        pages = sum(item['value'] for item in counters.get('pages_total', []))
+        return {
+            'elapsed_seconds': elapsed,
+            'pages_per_second': pages / elapsed if elapsed else 0.0,
+            'counters': counters,
+            'histograms': histograms,
+        }
+
+    def to_prometheus(self) -> str:
+        """Current values in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = [f"# TYPE {self.prefix}_elapsed_seconds gauge",
+                 f"{self.prefix}_elapsed_seconds {snapshot['elapsed_seconds']:.3f}",
+                 f"# TYPE {self.prefix}_pages_per_second gauge",
+                 f"{self.prefix}_pages_per_second {snapshot['pages_per_second']:.3f}"]
+
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {self.prefix}_{name} counter")
+                for key, value in series.items():
+                    lines.append(f"{self.prefix}_{name}{_format_labels(key)} {value:g}")
+
+            for name, series in sorted(self._histograms.items()):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for key, histogram in series.items():
+                    cumulative = 0
+                    for bound, count in zip([*map(str, histogram.buckets), '+Inf'], histogram.counts):
+                        cumulative += count
+                        bucket_labels = _format_labels(key, f'le="{bound}"')
+                        lines.append(f"{metric}_bucket{bucket_labels} {cumulative}")
+                    lines.append(f"{metric}_sum{_format_labels(key)} {histogram.sum:.6f}")
+                    lines.append(f"{metric}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> List[str]:
+        """Readable lines: totals per counter, and count / p50 / p95 / total time per histogram"""
+        snapshot = self.snapshot()
+        lines = [f"elapsed {snapshot['elapsed_seconds']:.1f}s, {snapshot['pages_per_second']:.2f} pages/s"]
+        for name, series in sorted(snapshot['counters'].items()):
+            parts = ", ".join(f"{_describe(item['labels'])} {item['value']:g}"
+                              for item in sorted(series, key=lambda item: -item['value']))
+            lines.append(f"{name}: {parts}")
+        for name, series in sorted(snapshot['histograms'].items()):
+            for item in series:
+                lines.append(f"{name}{_describe(item['labels'], brackets=True)}: n={item['count']} "
+                             f"p50={item['p50'] * 1000:.1f}ms p95={item['p95'] * 1000:.1f}ms "
+                             f"total={item['sum']:.2f}s")
+        return lines
+
+    def write(self, path: str) -> None:
+        """Write a snapshot atomically: Prometheus text for .prom files, JSON otherwise"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = self.to_prometheus() if path.suffix == '.prom' else json.dumps(self.snapshot(), indent=2)
+        with tempfile.NamedTemporaryFile('w', dir=path.parent, suffix='.tmp', delete=False,
+                                         encoding='utf-8') as f:
+            f.write(text)
+        os.replace(f.name, path)
+
+
+def _describe(labels: Dict[str, str], brackets: bool = False) -> str:
+    text = ",".join(f"{name}={value}" for name, value in labels.items())
+    if brackets:
+        return f"[{text}]" if text else ""
+    return text or "total"
+
+
+class MetricsReporter:
+    """Writes a registry snapshot to a file every ``interval`` seconds on a daemon thread"""
+
+    def __init__(self, registry: MetricsRegistry, path: str, interval: float = 10.0):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="metrics-reporter", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reporting and write a final snapshot"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.registry.write(self.path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.registry.write(self.path)
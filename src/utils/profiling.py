@@ -0,0 +1,256 @@
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .logger import setup_logger
+
+CPU_MODES = ('sample', 'cprofile')
+
+
+def profile_stage(profiler: Optional["StageProfiler"], name: str):
+    """``profiler.stage(name)``, or a no-op context when profiling is off"""
+    return profiler.stage(name) if profiler else nullcontext()
+
+
+class StageProfiler:
+    """
+    Profiles a crawl per pipeline stage (discovery, fetch, parse, export,
+    images), as marked by ``with profiler.stage(name):`` blocks.
+
+    CPU:
+      "sample"    a background thread samples the stacks of threads inside
+                  a stage every ``interval`` seconds; cheap enough for
+                  production crawls. Writes ``<stage>.collapsed`` files
+                  (flamegraph.pl / speedscope input).
+      "cprofile"  deterministic cProfile of every ``sample_every``-th entry
+                  of each stage, per thread, merged into ``<stage>.pstats``.
+    Memory (``memory=True``): tracemalloc snapshots around every
+    ``sample_every``-th stage entry; the allocation growth is summed per
+    stage into ``<stage>.allocations.txt`` (top ``top`` lines).
+
+    Stages may nest; work is attributed to the innermost one. Parsing in
+    the pipeline engine's worker processes is not seen by the profiler.
+    Reports and a ``summary.txt`` go to a timestamped directory under
+    ``output_dir``.
+    """
+
+    def __init__(self, output_dir: str = "logs/profile", cpu: Optional[str] = "sample", memory: bool = False,
+                 interval: float = 0.005, sample_every: int = 1, top: int = 25, memory_frames: int = 5):
+        if cpu is not None and cpu not in CPU_MODES:
+            raise ValueError(f"Unknown CPU profiling mode '{cpu}' (use one of {', '.join(CPU_MODES)})")
+        self.output_dir = Path(output_dir) / datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.cpu = cpu
+        self.memory = memory
+        self.interval = interval
+        self.sample_every = max(1, sample_every)
+        self.top = top
+        self.memory_frames = memory_frames
+        self.logger = setup_logger(__name__)
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._thread_stages: Dict[int, str] = {}
+        self._entries: Counter = Counter()
+        self._stage_seconds: Counter = Counter()
+        self._samples: Counter = Counter()  # (stage, stack) -> samples
+        self._profiles: Dict[Tuple[str, int], cProfile.Profile] = {}
+        self._allocations: Dict[str, Counter] = defaultdict(Counter)  # stage -> traceback -> bytes
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._started_tracemalloc = False
+
+    def start(self) -> "StageProfiler":
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(self.memory_frames)
+            self._started_tracemalloc = True
+        if self.cpu == 'sample' and self._sampler is None:
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample_loop, name="profile-sampler", daemon=True)
+            self._sampler.start()
+        return self
+
+    def stop(self) -> Path:
+        """Stop profiling and write the reports. Returns the report directory."""
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.write_reports()
+        return self.output_dir
+
+    def __enter__(self) -> "StageProfiler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Attribute the work done in this block, on this thread, to ``name``"""
+        thread_id = threading.get_ident()
+        # (stage, its enabled cProfile or None) for each open stage of this thread
+        stack: List[Tuple[str, Optional[cProfile.Profile]]] = self._local.__dict__.setdefault('stages', [])
+        with self._lock:
+            self._entries[name] += 1
+            sampled = self._entries[name] % self.sample_every == 0 or self._entries[name] == 1
+
+        outer_profile = stack[-1][1] if stack else None
+        profile = self._profile(name, thread_id) if sampled and self.cpu == 'cprofile' else None
+        before = tracemalloc.take_snapshot() if sampled and self.memory and tracemalloc.is_tracing() else None
+
+        # Only one profile can be active per thread: pause the outer stage's
+        if outer_profile:
+            outer_profile.disable()
+        if profile and not self._enable(profile):
+            profile = None
+        stack.append((name, profile))
+        self._thread_stages[thread_id] = name
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            if outer_profile:
+                self._enable(outer_profile)
+            elapsed = time.perf_counter() - started
+            stack.pop()
+            if stack:
+                self._thread_stages[thread_id] = stack[-1][0]
+            else:
+                self._thread_stages.pop(thread_id, None)
+            if before is not None and tracemalloc.is_tracing():
+                self._record_allocations(name, before, tracemalloc.take_snapshot())
+            with self._lock:
+                self._stage_seconds[name] += elapsed
+
+    @staticmethod
+    def _enable(profile: cProfile.Profile) -> bool:
+        try:
+            profile.enable()
+            return True
+        except ValueError:
+            # Python 3.12+ allows one active profiler per interpreter
+            return False
+
+    def _profile(self, name: str, thread_id: int) -> cProfile.Profile:
+        with self._lock:
+            key = (name, thread_id)
+            if key not in self._profiles:
+                self._profiles[key] = cProfile.Profile()
+            return self._profiles[key]
+
+    def _record_allocations(self, name: str, before, after) -> None:
+        # Leave out the profiler's own bookkeeping
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        before, after = before.filter_traces(filters), after.filter_traces(filters)
+        growth = Counter()
+        for stat in after.compare_to(before, 'traceback'):
+            if stat.size_diff > 0:
+                growth[tuple(str(frame) for frame in stat.traceback)] += stat.size_diff
+        with self._lock:
+            self._allocations[name].update(growth)
+
+    def _sample_loop(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            stages = dict(self._thread_stages)
+            if not stages:
+                continue
+            frames = sys._current_frames()
+            for thread_id, name in stages.items():
+                frame = frames.get(thread_id)
+                if frame is None or thread_id == own_id:
+                    continue
+                self._samples[(name, self._stack(frame))] += 1
+
+    @staticmethod
+    def _stack(frame, limit: int = 64) -> Tuple[str, ...]:
+        """Root-first "file:function" frames of a stack"""
+        names = []
+        while frame is not None and len(names) < limit:
+            code = frame.f_code
+            names.append(f"{Path(code.co_filename).name}:{code.co_name}")
+            frame = frame.f_back
+        return tuple(reversed(names))
+
+    def write_reports(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        summary = [f"Profile of {', '.join(sorted(self._entries))} "
+                   f"(cpu={self.cpu}, memory={self.memory}, sample_every={self.sample_every})", ""]
+        for name in sorted(self._entries):
+            summary.append(f"{name}: {self._entries[name]} entries, {self._stage_seconds[name]:.2f}s "
+                           f"(summed over threads)")
+        summary.append("")
+
+        if self.cpu == 'sample':
+            summary += self._write_samples()
+        elif self.cpu == 'cprofile':
+            summary += self._write_pstats()
+        if self.memory:
+            summary += self._write_allocations()
+
+        (self.output_dir / "summary.txt").write_text("\n".join(summary) + "\n", encoding='utf-8')
+        self.logger.info(f"Profile reports written to {self.output_dir}")
+
+    def _write_samples(self) -> List[str]:
+        lines = []
+        by_stage: Dict[str, Counter] = defaultdict(Counter)
+        for (name, stack), count in self._samples.items():
+            by_stage[name][stack] += count
+
+        for name, stacks in sorted(by_stage.items()):
+            collapsed = [f"{';'.join(stack)} {count}" for stack, count in stacks.most_common()]
+            (self.output_dir / f"{name}.collapsed").write_text("\n".join(collapsed) + "\n", encoding='utf-8')
+
+            # Functions on top of the stack most often
+            self_samples = Counter()
+            for stack, count in stacks.items():
+                self_samples[stack[-1]] += count
+            total = sum(stacks.values())
+            lines.append(f"[{name}] {total} samples, top functions by self time:")
+            lines += [f"  {count / total:6.1%}  {function}" for function, count in self_samples.most_common(self.top)]
+            lines.append("")
+        return lines
+
+    def _write_pstats(self) -> List[str]:
+        lines = []
+        by_stage: Dict[str, List[cProfile.Profile]] = defaultdict(list)
+        for (name, _), profile in self._profiles.items():
+            by_stage[name].append(profile)
+
+        for name, profiles in sorted(by_stage.items()):
+            stats = pstats.Stats(profiles[0])
+            for profile in profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(str(self.output_dir / f"{name}.pstats"))
+
+            text = io.StringIO()
+            pstats.Stats(str(self.output_dir / f"{name}.pstats"), stream=text).sort_stats('cumulative') \
+                .print_stats(self.top)
+            lines.append(f"[{name}] cProfile, top {self.top} by cumulative time:")
+            lines.append(text.getvalue())
+        return lines
+
+    def _write_allocations(self) -> List[str]:
+        lines = []
+        for name, growth in sorted(self._allocations.items()):
+            report = [f"{size / 1024:10.1f} KiB  " + " <- ".join(reversed(frames))
+                      for frames, size in growth.most_common(self.top)]
+            (self.output_dir / f"{name}.allocations.txt").write_text("\n".join(report) + "\n", encoding='utf-8')
+            lines.append(f"[{name}] top allocations (growth summed over sampled entries):")
+            lines += [f"  {line}" for line in report[:10]]
+            lines.append("")
+        return lines
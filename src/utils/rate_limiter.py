@@ -0,0 +1,89 @@
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill at ``rate`` per second up to ``burst``. A rate of 0 or less
+    means unlimited.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token and return how many seconds the caller must wait
+        before using it. The balance may go negative, so concurrent callers
+        are queued one interval apart.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping the tokens accrued at the old one"""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate > 0:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = rate
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns the time spent waiting"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """Keeps one token bucket per host"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "HostRateLimiter":
+        """
+        Build a limiter from request settings. ``requests_per_second`` wins;
+        otherwise ``delay_between_requests`` is read as the interval between
+        requests.
+        """
+        rate: Optional[float] = config.get('requests_per_second')
+        if rate is None:
+            delay = config.get('delay_between_requests', 1.0)
+            rate = 1.0 / delay if delay and delay > 0 else 0
+        return cls(rate=rate, burst=config.get('burst', 1))
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Return the bucket for a host, creating it on first use"""
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def reserve(self, host: str) -> float:
+        return self.bucket(host).reserve()
+
+    def acquire(self, host: str) -> float:
+        return self.bucket(host).acquire()
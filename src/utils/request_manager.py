@@ -1,34 +1,67 @@
+import asyncio
 import time
+from collections import deque
 import requests
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable, Iterator, List
+from urllib.parse import urlparse
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from .logger import setup_logger
+from .adaptive_throttle import OVERLOAD_STATUS, AdaptiveThrottle
+from .http_cache import CacheEntry, HttpCache
+from .logger import SAMPLED, setup_logger
+from .metrics import MetricsRegistry
+from .profiling import profile_stage
+from .rate_limiter import HostRateLimiter
 
 class RequestManager:
     """
     Manages HTTP requests with retry logic and rate limiting
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], metrics: Optional[MetricsRegistry] = None):
         self.config = config
         self.logger = setup_logger(__name__)
+        # Request counters and fetch latencies, shared with the engine when given
+        self.metrics = metrics or MetricsRegistry()
+        # Set by ScraperEngine.enable_profiling()
+        self.profiler = None
+        self.rate_limiter = HostRateLimiter.from_config(config)
+        # Per-host AIMD control of concurrency and rate, if enabled
+        self.throttle = AdaptiveThrottle.from_config(config, self.rate_limiter)
         self.session = self._create_session()  # This line is correct
+        self.cache = self._create_cache()
+
+        # Async state (per event loop)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._async_loop = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
         
     def _create_session(self) -> requests.Session:  # Fixed method name - was `_create_session`
         """Create a session with retry strategy"""
         session = requests.Session()
         
-        # Retry strategy
+        # Retry strategy. With the adaptive throttle, 429/503 are not
+        # retried here: the throttle pauses the whole host and backs off
+        status_forcelist = [429, 500, 502, 503, 504]
+        if self.throttle:
+            status_forcelist = [status for status in status_forcelist if status not in OVERLOAD_STATUS]
         retry_strategy = Retry(
             total=self.config.get('retry_attempts', 3),
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=status_forcelist,
             allowed_methods=["GET", "POST"],
-            backoff_factor=1
+            backoff_factor=self.config.get('retry_backoff', 1),
+            respect_retry_after_header=not self.throttle
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep enough pooled connections for every in-flight request
+        pool_size = max(10, self.config.get('max_concurrency_per_host', 8))
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -40,25 +73,219 @@ class RequestManager:
         
         return session
     
+    def _create_cache(self) -> Optional[HttpCache]:
+        """Open the on-disk response cache if enabled in the request settings"""
+        cache_config = self.config.get('cache') or {}
+        if not cache_config.get('enabled'):
+            return None
+        
+        return HttpCache(
+            path=cache_config.get('path', 'cache/http_cache.sqlite3'),
+            max_size_mb=cache_config.get('max_size_mb', 500)
+        )
+    
     def get(self, url: str, delay: Optional[float] = None) -> Optional[requests.Response]:
         """
         Make a GET request with rate limiting
+
+        Requests are paced by the per-host token bucket. Passing ``delay``
+        sleeps that long instead, as before.
         """
-        if delay is None:
-            delay = self.config.get('delay_between_requests', 1.0)
-        
-        # Rate limiting
-        time.sleep(delay)
+        # Fresh cache entries need no request at all
+        entry = self._cache_entry(url)
+        cached = self._fresh_response(url, entry)
+        if cached is not None:
+            return cached
         
+        # Rate limiting; with the adaptive throttle, _send takes the token
+        if delay is not None:
+            time.sleep(delay)
+        elif self.throttle is None:
+            self.rate_limiter.acquire(urlparse(url).netloc)
+
+        return self._fetch(url, entry)
+
+    def get_many(self, urls: Iterable[str]) -> List[Optional[requests.Response]]:
+        """
+        Fetch several URLs on the worker pool, sharing the pooled session.
+
+        Up to ``max_concurrency_per_host`` requests are in flight while the
+        token bucket keeps the configured rate. Responses are returned in the
+        order of ``urls``; failed requests are None.
+        """
+        return list(self.iter_many(urls))
+
+    def iter_many(self, urls: Iterable[str], window: Optional[int] = None) -> Iterator[Optional[requests.Response]]:
+        """
+        Like ``get_many``, but yields each response as soon as it is next in
+        order. At most ``window`` requests (default: twice the concurrency)
+        are submitted ahead of the consumer, so a slow consumer applies
+        backpressure instead of buffering the whole crawl.
+        """
+        executor = self._get_executor()
+        window = window or self.config.get('max_concurrency_per_host', 8) * 2
+        pending = deque()
+
         try:
-            response = self.session.get(
-                url, 
-                timeout=self.config.get('timeout', 30)
-            )
+            for url in urls:
+                pending.append(executor.submit(self.get, url))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # The consumer stopped early: drop requests that have not started
+            for future in pending:
+                future.cancel()
+
+    async def get_async(self, url: str, delay: Optional[float] = None) -> Optional[requests.Response]:
+        """
+        Make a GET request from a coroutine.
+
+        At most ``max_concurrency_per_host`` requests are in flight per host,
+        and request starts are paced by the same token bucket as ``get``.
+        """
+        entry = self._cache_entry(url)
+        cached = self._fresh_response(url, entry)
+        if cached is not None:
+            return cached
+
+        host = urlparse(url).netloc
+        async with self._get_host_semaphore(host):
+            # Wait out a Retry-After pause here rather than on a worker thread
+            if self.throttle:
+                await asyncio.sleep(self.throttle.pause_remaining(host))
+            if delay is not None:
+                wait = delay
+            else:
+                wait = self.rate_limiter.reserve(host) if self.throttle is None else 0
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self._fetch, url, entry)
+
+    def _cache_entry(self, url: str) -> Optional[CacheEntry]:
+        """The cached entry for a URL; looked up once per request"""
+        return self.cache.get(url) if self.cache is not None else None
+
+    def _fresh_response(self, url: str, entry: Optional[CacheEntry]) -> Optional[requests.Response]:
+        """The cached response if the entry is still within the site's TTL"""
+        if entry and entry.is_fresh(self.config['cache'].get('ttl_seconds', 0)):
+            self.metrics.inc('cache_hits_total', host=urlparse(url).netloc, kind='fresh')
+            self.logger.debug("Cache hit: %s", url, extra=SAMPLED)
+            return entry.to_response()
+        return None
+
+    def _fetch(self, url: str, entry: Optional[CacheEntry] = None) -> Optional[requests.Response]:
+        """
+        Perform the GET request without any rate limiting. A stale cached
+        ``entry`` is revalidated instead of downloaded again.
+        """
+        try:
+            response = self._send(url, entry.validators() if entry else None)
+            
+            if entry and response.status_code == 304:
+                self.cache.refresh(url, response)
+                self.metrics.inc('cache_hits_total', host=urlparse(url).netloc, kind='revalidated')
+                self.logger.debug("Not modified, served from cache: %s", url, extra=SAMPLED)
+                return entry.to_response()
+            
             response.raise_for_status()
-            self.logger.debug(f"Successfully fetched: {url}")
+            self.logger.debug("Successfully fetched: %s", url, extra=SAMPLED)
+            if self.cache is not None:
+                self.cache.put(url, response)
             return response
-            
+
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to fetch {url}: {e}")
-            return None
\ No newline at end of file
+            self.logger.error(f"Failed to fetch {url}: {e}", extra=SAMPLED)
+            return None
+
+    def _send(self, url: str, headers: Optional[Dict[str, str]]) -> requests.Response:
+        """
+        GET through the adaptive throttle, if enabled. A 429/503 is retried
+        once the throttle's pause for the host is over.
+
+        Every attempt takes its rate token only after it got a concurrency
+        slot, so requests that waited out a pause or a slot are still spaced
+        at the (possibly just reduced) rate instead of leaving at once.
+        """
+        if self.throttle is None:
+            return self._get(url, headers)
+
+        host = urlparse(url).netloc
+        for attempt in range(self.config.get('retry_attempts', 3) + 1):
+            if attempt:
+                self.metrics.inc('retries_total', host=host)
+            self.throttle.acquire(host)
+            response = None
+            try:
+                self.rate_limiter.acquire(host)
+                response = self._get(url, headers)
+            finally:
+                self.throttle.release(host, response)
+            if response.status_code not in OVERLOAD_STATUS:
+                break
+        return response
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]]) -> requests.Response:
+        """
+        One GET on the session, counted and timed in the metrics.
+
+        requests does not expose connection setup separately, so time to
+        first byte includes connecting on a new connection; download time
+        is the rest of the request.
+        """
+        host = urlparse(url).netloc
+        started = time.perf_counter()
+        try:
+            with profile_stage(self.profiler, 'fetch'):
+                response = self.session.get(url, timeout=self.config.get('timeout', 30), headers=headers)
+        except requests.exceptions.RequestException:
+            self.metrics.inc('requests_total', host=host, status='error')
+            raise
+        seconds = time.perf_counter() - started
+        ttfb = response.elapsed.total_seconds()
+
+        self.metrics.inc('requests_total', host=host, status=response.status_code)
+        self.metrics.inc('response_bytes_total', len(response.content), host=host)
+        self.metrics.observe('fetch_seconds', seconds, host=host)
+        self.metrics.observe('fetch_ttfb_seconds', ttfb, host=host)
+        self.metrics.observe('fetch_download_seconds', max(0.0, seconds - ttfb), host=host)
+        # Retries urllib3 made inside this call
+        retries = getattr(getattr(response.raw, 'retries', None), 'history', None)
+        if retries:
+            self.metrics.inc('retries_total', len(retries), host=host)
+        return response
+
+    def _get_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Return the concurrency semaphore for a host on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            # Semaphores are bound to the loop they were first used on
+            self._async_loop = loop
+            self._host_semaphores = {}
+
+        if host not in self._host_semaphores:
+            limit = self.config.get('max_concurrency_per_host', 8)
+            self._host_semaphores[host] = asyncio.Semaphore(limit)
+        return self._host_semaphores[host]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the worker pool used for blocking HTTP calls"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.get('max_concurrency_per_host', 8),
+                thread_name_prefix="request-worker"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Release pooled connections and worker threads"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.cache is not None:
+            self.cache.close()
+        self.session.close()
@@ -0,0 +1,104 @@
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+# Campaign and ad click parameters that only track where a visitor came
+# from. Session and analytics names such as "sid" or "spm" are real
+# parameters on some sites, so sites opt into those with strip_params.
+TRACKING_PARAMS = ['utm_*', 'gclid', 'gclsrc', 'dclid', 'fbclid', 'msclkid', 'yclid']
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def remove_dot_segments(path: str) -> str:
+    """Resolve "." and ".." path segments (RFC 3986, section 5.2.4)"""
+    if '.' not in path:
+        return path
+
+    output: List[str] = []
+    segments = path.split('/')
+    for segment in segments:
+        if segment == '..':
+            # Never pop the leading '' of an absolute path
+            if len(output) > 1:
+                output.pop()
+        elif segment != '.':
+            output.append(segment)
+
+    # "/a/b/.." and "/a/b/." name a directory: keep the trailing slash
+    if segments[-1] in ('.', '..'):
+        output.append('')
+    return '/'.join(output)
+
+
+class UrlCanonicalizer:
+    """
+    Rewrites URLs into one canonical form so that variants of the same
+    page are fetched once.
+
+    Rules (a website template's "url_canonicalization" block):
+      strip_params     query parameters to drop, glob patterns ("utm_*");
+                       tracking parameters are always included
+      keep_params      if set, drop every other query parameter
+      sort_params      sort the remaining parameters (default true)
+      strip_fragment   drop "#..." (default true)
+      trailing_slash   "keep" (default), "strip" or "add"
+      lowercase_path   lowercase the path, for case-insensitive sites
+    """
+
+    def __init__(self, rules: Optional[Dict[str, Any]] = None):
+        rules = rules or {}
+        self.strip_params = [p.lower() for p in TRACKING_PARAMS + list(rules.get('strip_params', []))]
+        keep_params = rules.get('keep_params')
+        self.keep_params = {p.lower() for p in keep_params} if keep_params is not None else None
+        self.sort_params = rules.get('sort_params', True)
+        self.strip_fragment = rules.get('strip_fragment', True)
+        self.trailing_slash = rules.get('trailing_slash', 'keep')
+        self.lowercase_path = rules.get('lowercase_path', False)
+        if self.trailing_slash not in ('keep', 'strip', 'add'):
+            raise ValueError(f"trailing_slash must be 'keep', 'strip' or 'add', not {self.trailing_slash!r}")
+
+    def canonicalize(self, url: str) -> str:
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        try:
+            port = parts.port
+        except ValueError:
+            # Malformed port ("host:abc"): leave the URL for the fetch to fail alone
+            return url
+
+        # Lowercase host, drop default ports and empty credentials
+        netloc = (parts.hostname or '').rstrip('.')
+        if ':' in netloc:
+            # IPv6 literal: hostname comes without its brackets
+            netloc = f"[{netloc}]"
+        if port and port != DEFAULT_PORTS.get(scheme):
+            netloc = f"{netloc}:{port}"
+        if parts.username:
+            credentials = parts.username + (f":{parts.password}" if parts.password else '')
+            netloc = f"{credentials}@{netloc}"
+
+        path = remove_dot_segments(parts.path) or '/'
+        if self.lowercase_path:
+            path = path.lower()
+        if self.trailing_slash == 'strip' and path != '/':
+            path = path.rstrip('/') or '/'
+        elif self.trailing_slash == 'add' and not path.endswith('/') and '.' not in path.rsplit('/', 1)[-1]:
+            path += '/'
+
+        query = parts.query
+        if query:
+            # Kept "name=value" pairs stay exactly as encoded in the URL
+            params = [(unquote_plus(pair.split('=', 1)[0]), pair) for pair in query.split('&') if pair]
+            params = [(name, pair) for name, pair in params if self._keep_param(name)]
+            if self.sort_params:
+                params.sort()
+            query = '&'.join(pair for _, pair in params)
+
+        fragment = '' if self.strip_fragment else parts.fragment
+        return urlunsplit((scheme, netloc, path, query, fragment))
+
+    def _keep_param(self, name: str) -> bool:
+        name = name.lower()
+        if self.keep_params is not None:
+            return name in self.keep_params
+        return not any(fnmatchcase(name, pattern) for pattern in self.strip_params)
@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+
+from src.utils.logger import configure_logging
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_log_dir(tmp_path_factory):
+    """Send the per-module log files to a tmp directory instead of the repo's logs/"""
+    log_dir = tmp_path_factory.mktemp("logs")
+    configure_logging(str(log_dir))
+    return log_dir
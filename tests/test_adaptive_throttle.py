@@ -0,0 +1,127 @@
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+
+from src.utils.adaptive_throttle import AdaptiveThrottle
+from src.utils.rate_limiter import HostRateLimiter
+from src.utils.request_manager import RequestManager
+from src.utils.retry_after import retry_after_seconds
+
+
+def _throttle(**settings):
+    limiter = HostRateLimiter(rate=2.0)
+    return AdaptiveThrottle(limiter, max_concurrency=8, settings={'cooldown_seconds': 0, **settings})
+
+
+def test_healthy_windows_increase_concurrency_and_rate():
+    host = _throttle().host("shop.example")
+    assert (host.concurrency, host.bucket.rate) == (1, 2.0)
+
+    # One good response per concurrent slot makes a window
+    for expected in (2, 3, 4):
+        for _ in range(host.concurrency):
+            host.acquire()
+            host.release(200, 0.05, None)
+        assert host.concurrency == expected
+
+    assert host.bucket.rate == 3.5
+    assert host.max_rate == 8.0
+
+
+def test_overload_backs_off_and_pauses():
+    host = _throttle(initial_concurrency=8).host("shop.example")
+
+    host.acquire()
+    host.release(429, 0.05, 1.5)
+    assert (host.concurrency, host.bucket.rate) == (4, 1.0)
+    assert 1.0 < host.pause_remaining() <= 1.5
+
+    # Without Retry-After the backoff doubles with each overload in a row
+    host.paused_until = 0
+    host.acquire()
+    host.release(503, 0.05, None)
+    assert 1.5 < host.pause_remaining() <= 2.0
+    assert (host.concurrency, host.bucket.rate) == (2, 0.5)
+
+
+def test_rising_ttfb_backs_off_once_per_cooldown():
+    host = _throttle(initial_concurrency=8, cooldown_seconds=60).host("shop.example")
+    for _ in range(20):
+        host.acquire()
+        host.release(200, 0.05, None)
+    assert host.concurrency == 8
+
+    for _ in range(5):
+        host.acquire()
+        host.release(200, 1.0, None)
+    assert host.concurrency == 4
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds("3") == 3.0
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert retry_after_seconds("soon") is None
+
+
+@pytest.fixture
+def rate_limited_site():
+    """Answers 429 with Retry-After to the first request, 200 afterwards"""
+    stats = {"requests": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            stats["requests"] += 1
+            if stats["requests"] == 1:
+                self.send_response(429)
+                self.send_header("Retry-After", "0.3")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            data = b"<html>ok</html>"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", stats
+    server.shutdown()
+    server.server_close()
+
+
+def test_request_manager_waits_out_retry_after(rate_limited_site):
+    base_url, stats = rate_limited_site
+    manager = RequestManager({
+        'delay_between_requests': 0,
+        'retry_attempts': 2,
+        'max_concurrency_per_host': 4,
+        'adaptive': {'enabled': True, 'initial_concurrency': 4},
+    })
+
+    tokens = []
+    acquire = manager.rate_limiter.acquire
+    manager.rate_limiter.acquire = lambda host: tokens.append(host) or acquire(host)
+
+    started = time.monotonic()
+    response = manager.get(f"{base_url}/book")
+
+    assert response.status_code == 200
+    assert stats["requests"] == 2
+    # One rate token per attempt, the retry included
+    assert len(tokens) == 2
+    assert time.monotonic() - started >= 0.25
+    assert manager.throttle.host(base_url.split("//")[1]).concurrency == 2
+    manager.close()
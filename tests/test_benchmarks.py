@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from benchmarks.corpus import LISTING_URL, large_listing_page, large_product_page, synthetic_products
+from benchmarks.run_benchmarks import Benchmark, compare, run_benchmark
+from src.parsers.parser_factory import create_parser
+from src.utils.config_loader import ConfigLoader
+
+
+def test_synthetic_pages_parse_like_the_fixtures():
+    website_config = ConfigLoader.load_website_config("books_toscrape")
+    parser = create_parser("lxml", website_config["base_url"], website_config["selectors"])
+
+    links = parser.extract_product_links(large_listing_page(50), LISTING_URL)
+    assert len(set(links)) == 50
+
+    product = parser.parse_product_page(large_product_page(5, 5), LISTING_URL)
+    assert product.product_name == "Sharp Objects"
+    assert len(product.description) > 1000
+
+    assert len({p.price for p in synthetic_products(100)}) > 90
+
+
+def test_run_benchmark_and_compare_with_baseline():
+    result = run_benchmark(Benchmark("sum", lambda: sum(range(10_000)), 10_000, "row"), min_time=0.01)
+    assert result.seconds > 0
+    assert result.items_per_second > 0
+    assert result.peak_kb >= 0
+
+    baseline = {"sum": {"seconds": result.seconds / 2}}
+    assert compare([result], baseline, tolerance=0.25)[0].startswith("sum:")
+    assert compare([result], baseline, tolerance=2.0) == []
@@ -0,0 +1,124 @@
+import subprocess
+import sys
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from openpyxl import load_workbook
+
+from src.core.data_models import Product
+from src.exporters.excel_exporter import ExcelExporter
+
+
+def _products(count):
+    for i in range(count):
+        yield Product(product_url=f"http://shop.example/p/{i}", product_name=f"Product {i}",
+                      price=f"{i}.99", rating=4.0, specifications={"UPC": str(i)})
+
+
+def test_excel_export_streams_any_iterable(tmp_path):
+    output = ExcelExporter(str(tmp_path)).export_products(_products(3), "products.xlsx")
+
+    rows = list(load_workbook(output).active.iter_rows(values_only=True))
+    expected = next(_products(1)).to_dict()
+    assert rows[0] == tuple(expected)
+    assert len(rows) == 4
+    assert rows[1][:3] == ("http://shop.example/p/0", "Product 0", "0.99")
+    assert rows[1][list(expected).index("specifications")] == "{'UPC': '0'}"
+
+
+def test_excel_exporter_does_not_import_pandas():
+    code = ("import sys; sys.path.insert(0, 'src'); "
+            "import src.exporters.excel_exporter; print('pandas' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=Path(__file__).parent.parent)
+    assert result.stdout.strip() == "False"
+
+
+def test_csv_jsonl_and_parquet_exports_round_trip(tmp_path):
+    import csv
+    import json
+    import pyarrow.parquet as pq
+    from src.exporters.csv_exporter import CSVExporter
+    from src.exporters.jsonl_exporter import JSONLinesExporter
+    from src.exporters.parquet_exporter import ParquetExporter
+
+    expected = [product.to_dict() for product in _products(5)]
+
+    csv_file = CSVExporter(str(tmp_path), chunk_size=2).export_products(_products(5), "p.csv")
+    with open(csv_file, newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["product_url"] for row in rows] == [p["product_url"] for p in expected]
+    assert json.loads(rows[4]["specifications"]) == {"UPC": "4"}
+
+    jsonl_file = JSONLinesExporter(str(tmp_path), chunk_size=2).export_products(_products(5), "p.jsonl")
+    lines = Path(jsonl_file).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["price"] for line in lines] == [p["price"] for p in expected]
+
+    parquet_file = ParquetExporter(str(tmp_path), chunk_size=2).export_products(_products(5), "p.parquet")
+    parquet = pq.ParquetFile(parquet_file)
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column("rating").to_pylist() == [4.0] * 5
+    # specifications is a nested map column
+    assert table.column("specifications").to_pylist()[1] == [("UPC", "1")]
+
+
+def test_image_downloader_streams_concurrently_without_collisions(tmp_path):
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from src.exporters.image_downloader import ImageDownloader
+
+    images = {"/a.png": b"\x89PNG\r\n\x1a\n" + b"a" * 200_000, "/b.jpg": b"\xff\xd8\xff" + b"b" * 100}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = images.get(self.path)
+            self.send_response(200 if body else 404)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(body or b"")))
+            self.end_headers()
+            self.wfile.write(body or b"")
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        # Same product name, different images, plus a missing one
+        products = [Product(product_url=f"{base_url}/p/{i}", product_name="Same Name", image_url=f"{base_url}{path}")
+                    for i, path in enumerate(["/a.png", "/b.jpg", "/missing.png", "/a.png"])]
+        downloader = ImageDownloader(str(tmp_path), max_workers=4, request_config={"retry_attempts": 0},
+                                     chunk_size=4096)
+        paths = downloader.download_product_images(products)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(paths) == 3 and paths[0] == paths[2] != paths[1]
+    assert Path(paths[0]).suffix == ".png" and Path(paths[1]).suffix == ".jpg"
+    assert Path(paths[0]).read_bytes() == images["/a.png"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted({Path(p).name for p in paths})
+
+
+def test_image_processor_resizes_recompresses_and_thumbnails(tmp_path):
+    from PIL import Image
+    from src.exporters.image_processor import ImageProcessor
+
+    Image.new("RGB", (2400, 1600), (200, 30, 30)).save(tmp_path / "large.jpg", quality=95)
+    Image.new("RGBA", (300, 300), (0, 0, 255, 128)).save(tmp_path / "alpha.png")
+    (tmp_path / "broken.jpg").write_bytes(b"not an image")
+
+    processor = ImageProcessor(str(tmp_path / "processed"), str(tmp_path / "thumbs"),
+                               max_size=(800, 800), quality=80, thumbnail_size=(100, 100), workers=2)
+    paths = processor.process_images([str(tmp_path / name) for name in ("large.jpg", "broken.jpg", "alpha.png")])
+
+    assert [Path(p).name for p in paths] == ["large.jpg", "alpha.jpg"]
+    with Image.open(paths[0]) as image:
+        assert image.format == "JPEG" and image.size == (800, 533)
+    with Image.open(tmp_path / "thumbs" / "alpha.jpg") as thumbnail:
+        assert thumbnail.mode == "RGB" and thumbnail.size == (100, 100)
@@ -0,0 +1,169 @@
+import re
+import sys
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import gspread
+import requests
+
+from src.core.data_models import Product
+from src.exporters import google_sheets_exporter
+from src.exporters.google_sheets_exporter import GoogleSheetsExporter, spreadsheet_title
+
+
+def _column_number(letters):
+    number = 0
+    for letter in letters:
+        number = number * 26 + ord(letter) - 64
+    return number
+
+
+class FakeWorksheet:
+    """In-memory stand-in for gspread.Worksheet that records API calls"""
+
+    def __init__(self, title, rows, cols):
+        self.title = title
+        self.row_count, self.col_count = rows, cols
+        self.grid = []
+        self.calls = []
+        self.throttle = 0
+
+    def clear(self):
+        self.calls.append("clear")
+        self.grid = []
+
+    def resize(self, rows=None, cols=None):
+        self.calls.append("resize")
+        self.row_count = rows or self.row_count
+        self.col_count = cols or self.col_count
+
+    def batch_update(self, data, value_input_option=None):
+        if self.throttle:
+            self.throttle -= 1
+            response = requests.Response()
+            response.status_code = 429
+            response.headers["Retry-After"] = "2"
+            raise gspread.exceptions.APIError(response)
+        self.calls.append(("batch_update", [update["range"] for update in data]))
+        for update in data:
+            first, last_column, last = re.match(r"A(\d+):([A-Z]+)(\d+)", update["range"]).groups()
+            assert int(last) <= self.row_count and _column_number(last_column) <= self.col_count
+            for offset, row in enumerate(update["values"]):
+                index = int(first) - 1 + offset
+                while len(self.grid) <= index:
+                    self.grid.append([])
+                # The sheet hands values back formatted
+                self.grid[index] = [str(int(v)) if isinstance(v, float) and v.is_integer() else str(v)
+                                    for v in row]
+
+    def get_all_values(self):
+        self.calls.append("get_all_values")
+        return [list(row) for row in self.grid]
+
+    def format(self, *args, **kwargs):
+        self.calls.append("format")
+
+    def columns_auto_resize(self, *args):
+        self.calls.append("columns_auto_resize")
+
+    def freeze(self, **kwargs):
+        self.calls.append("freeze")
+
+
+class FakeSpreadsheet:
+    id = "fake-spreadsheet"
+
+    def __init__(self):
+        self.worksheets = {}
+
+    def worksheet(self, title):
+        if title not in self.worksheets:
+            raise gspread.WorksheetNotFound(title)
+        return self.worksheets[title]
+
+    def add_worksheet(self, title, rows, cols):
+        self.worksheets[title] = FakeWorksheet(title, rows, cols)
+        return self.worksheets[title]
+
+
+class FakeClient:
+    def __init__(self):
+        self.spreadsheets = {}
+        self.throttle = 0
+
+    def open(self, name):
+        if self.throttle:
+            self.throttle -= 1
+            response = requests.Response()
+            response.status_code = 429
+            raise gspread.exceptions.APIError(response)
+        if name not in self.spreadsheets:
+            raise gspread.SpreadsheetNotFound(name)
+        return self.spreadsheets[name]
+
+    def create(self, name, folder_id=None):
+        self.spreadsheets[name] = FakeSpreadsheet()
+        return self.spreadsheets[name]
+
+
+def _products(prices):
+    return [Product(product_url=f"http://shop.example/p/{i}", product_name=f"Product {i}",
+                    price=price, rating=4.0, specifications={"UPC": str(i)})
+            for i, price in enumerate(prices)]
+
+
+def test_full_export_writes_once_and_backs_off_on_429(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(google_sheets_exporter.time, "sleep", sleeps.append)
+    client = FakeClient()
+    exporter = GoogleSheetsExporter(client=client)
+
+    # Create the worksheet, then get throttled once on the rewrite
+    exporter.export_products(_products(["1.00", "2.00", "3.00"]), "Shop", "Products")
+    worksheet = client.spreadsheets["Shop"].worksheets["Products"]
+    worksheet.throttle = 1
+    worksheet.calls.clear()
+    url = exporter.export_products(_products(["1.00", "2.00", "3.00"]), "Shop", "Products")
+
+    assert url == "https://docs.google.com/spreadsheets/d/fake-spreadsheet"
+    assert sleeps == [2.0]
+    assert [call for call in worksheet.calls if call[0] == "batch_update"] == [("batch_update", ["A1:Q4"])]
+    assert (worksheet.row_count, worksheet.col_count) == (4, 17)
+    assert worksheet.grid[1][10] == '{"UPC": "0"}'
+
+
+def test_incremental_export_rewrites_only_changed_and_new_rows():
+    client = FakeClient()
+    exporter = GoogleSheetsExporter(client=client)
+    exporter.export_products(_products(["1.00", "2.00", "3.00"]), "Shop", "Products")
+    worksheet = client.spreadsheets["Shop"].worksheets["Products"]
+    worksheet.calls.clear()
+
+    # New timestamps everywhere, one price change and one new product
+    exporter.export_products(_products(["1.00", "2.50", "3.00", "4.00"]), "Shop", "Products", incremental=True)
+
+    assert worksheet.calls == ["get_all_values", "resize", ("batch_update", ["A3:Q3", "A5:Q5"])]
+    assert [row[2] for row in worksheet.grid[1:]] == ["1.00", "2.50", "3.00", "4.00"]
+
+
+def test_incremental_runs_reuse_one_spreadsheet(monkeypatch):
+    monkeypatch.setattr(google_sheets_exporter.time, "sleep", lambda seconds: None)
+    client = FakeClient()
+    exporter = GoogleSheetsExporter(client=client)
+    template = "Scraped Products {timestamp}"
+    assert spreadsheet_title(template, incremental=True) == "Scraped Products"
+    assert spreadsheet_title(template) != "Scraped Products"
+
+    exporter.export_products(_products(["1.00", "2.00"]), spreadsheet_title(template, True), incremental=True)
+    worksheet = client.spreadsheets["Scraped Products"].worksheets["Products"]
+    worksheet.calls.clear()
+    # A 429 while opening the spreadsheet is retried, not fatal
+    client.throttle = 1
+    url = exporter.export_products(_products(["1.00", "2.50"]), spreadsheet_title(template, True),
+                                   incremental=True)
+
+    assert url and list(client.spreadsheets) == ["Scraped Products"]
+    assert worksheet.calls == ["get_all_values", ("batch_update", ["A3:Q3"])]
@@ -0,0 +1,103 @@
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+import requests
+
+from src.utils.http_cache import HttpCache
+from src.utils.request_manager import RequestManager
+
+
+@pytest.fixture
+def etag_site():
+    """Local server that answers If-None-Match with 304 and counts requests"""
+    stats = {"requests": 0, "not_modified": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            stats["requests"] += 1
+            if self.headers.get("If-None-Match") == '"v1"':
+                stats["not_modified"] += 1
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                return
+            data = f"<html><body><h1>{self.path}</h1></body></html>".encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", stats
+    server.shutdown()
+    server.server_close()
+
+
+def _manager(tmp_path, ttl_seconds):
+    return RequestManager({
+        'delay_between_requests': 0,
+        'retry_attempts': 0,
+        'cache': {'enabled': True, 'path': str(tmp_path / "cache.sqlite3"), 'ttl_seconds': ttl_seconds},
+    })
+
+
+def test_stale_entries_are_revalidated(tmp_path, etag_site):
+    base_url, stats = etag_site
+    manager = _manager(tmp_path, ttl_seconds=0)
+    lookups = []
+    cache_get = manager.cache.get
+    manager.cache.get = lambda url: lookups.append(url) or cache_get(url)
+
+    first = manager.get(f"{base_url}/book")
+    second = manager.get(f"{base_url}/book")
+
+    assert stats == {"requests": 2, "not_modified": 1}
+    # One cache lookup per request, fresh or not
+    assert len(lookups) == 2
+    assert second.text == first.text == "<html><body><h1>/book</h1></body></html>"
+    assert getattr(second, "from_cache", False)
+    manager.close()
+
+
+def test_fresh_entries_skip_the_network_across_runs(tmp_path, etag_site):
+    base_url, stats = etag_site
+    _manager(tmp_path, ttl_seconds=3600).get(f"{base_url}/book")
+
+    # A new manager (next run) reads the same on-disk cache
+    response = _manager(tmp_path, ttl_seconds=3600).get(f"{base_url}/book")
+
+    assert stats["requests"] == 1
+    assert response.status_code == 200
+    assert response.text.endswith("</html>")
+
+
+def test_lru_eviction_respects_size_cap(tmp_path):
+    cache = HttpCache(str(tmp_path / "cache.sqlite3"), max_size_mb=2500 / (1024 * 1024))
+
+    def response(body):
+        r = requests.Response()
+        r.status_code = 200
+        r._content = body
+        return r
+
+    cache.put("http://x/a", response(b"a" * 1000))
+    cache.put("http://x/b", response(b"b" * 1000))
+    cache.get("http://x/a")  # a is now more recently used than b
+    cache.put("http://x/c", response(b"c" * 1000))
+
+    assert cache.get("http://x/b") is None
+    assert cache.get("http://x/a").body == b"a" * 1000
+    assert cache.get("http://x/c") is not None
@@ -0,0 +1,65 @@
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+
+from src.utils.logger import SAMPLED, SamplingFilter, configure_logging, setup_logger, shutdown_logging
+
+
+def _record(message, lineno=10, sampled=True, level=logging.INFO):
+    record = logging.LogRecord("test", level, "page.py", lineno, message, (), None)
+    if sampled:
+        record.sampled = True
+    return record
+
+
+def test_sampling_filter_keeps_a_burst_then_one_in_every():
+    sampling = SamplingFilter(burst=2, interval=60, every=3)
+    records = [_record(f"page {i}") for i in range(8)]
+    kept = [record.getMessage() for record in records if sampling.filter(record)]
+
+    assert kept == ["page 0", "page 1", "page 4 [2 similar messages suppressed]",
+                    "page 7 [2 similar messages suppressed]"]
+    # Other call sites and unmarked records are not limited
+    assert sampling.filter(_record("other", lineno=20))
+    assert all(sampling.filter(_record("plain", sampled=False)) for _ in range(10))
+
+
+def test_sampling_never_drops_errors():
+    sampling = SamplingFilter(burst=1, interval=60, every=0)
+    assert sampling.filter(_record("page 0"))
+    assert all(sampling.filter(_record(f"failed {i}", level=logging.ERROR)) for i in range(5))
+    assert not sampling.filter(_record("page 1"))
+
+
+def test_sampling_window_restarts_after_interval():
+    sampling = SamplingFilter(burst=1, interval=0, every=0)
+    assert all(sampling.filter(_record(f"page {i}")) for i in range(3))
+
+
+@pytest.fixture
+def log_dir(tmp_path, test_log_dir):
+    yield tmp_path
+    configure_logging(str(test_log_dir))
+
+
+def test_shared_writer_writes_module_files_and_json_lines(log_dir):
+    configure_logging(str(log_dir), json_path=str(log_dir / "scraper.jsonl"),
+                      sampling={'burst': 1, 'every': 0})
+    logger = setup_logger("test_logger.shared")
+    logger.info("crawl started")
+    for i in range(5):
+        logger.info(f"Found {i} product links", extra=SAMPLED)
+    shutdown_logging()  # drains the queue
+
+    lines = (log_dir / "test_logger.shared.log").read_text().splitlines()
+    assert [line.split(" - ")[-1] for line in lines] == ["crawl started", "Found 0 product links"]
+    entries = [json.loads(line) for line in (log_dir / "scraper.jsonl").read_text().splitlines()]
+    assert entries[0]["logger"] == "test_logger.shared"
+    assert [entry["message"] for entry in entries] == ["crawl started", "Found 0 product links"]
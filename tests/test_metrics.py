@@ -0,0 +1,50 @@
+import json
+import sys
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from src.utils.metrics import Histogram, MetricsRegistry
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+    for value in (0.05, 0.15, 0.15, 0.3, 1.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.count == 5 and abs(histogram.sum - 1.65) < 1e-9
+    assert 0.1 < histogram.quantile(0.5) <= 0.2
+    assert histogram.quantile(1.0) == 0.4
+
+
+def test_registry_snapshot_prometheus_and_summary(tmp_path):
+    metrics = MetricsRegistry()
+    metrics.inc('requests_total', host='shop.example', status=200)
+    metrics.inc('requests_total', host='shop.example', status=200)
+    metrics.inc('requests_total', host='shop.example', status=404)
+    metrics.inc('pages_total', result='parsed')
+    with metrics.timer('parse_seconds'):
+        pass
+
+    assert metrics.counter_total('requests_total') == 3
+    assert metrics.counter_total('requests_total', status=200) == 2
+
+    text = metrics.to_prometheus()
+    assert 'scraper_requests_total{host="shop.example",status="200"} 2' in text
+    assert 'scraper_parse_seconds_bucket{le="+Inf"} 1' in text
+    assert 'scraper_parse_seconds_count 1' in text
+
+    summary = metrics.summary()
+    assert summary[0].startswith("elapsed")
+    assert "requests_total: host=shop.example,status=200 2, host=shop.example,status=404 1" in summary
+    assert any(line.startswith("parse_seconds: n=1") for line in summary)
+
+    metrics.write(str(tmp_path / "metrics.json"))
+    metrics.write(str(tmp_path / "metrics.prom"))
+    snapshot = json.loads((tmp_path / "metrics.json").read_text())
+    assert snapshot['counters']['pages_total'][0] == {'labels': {'result': 'parsed'}, 'value': 1}
+    assert snapshot['pages_per_second'] > 0
+    assert (tmp_path / "metrics.prom").read_text().startswith("# TYPE scraper_elapsed_seconds gauge")
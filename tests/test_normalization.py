@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.core.data_models import Product
+from src.core.normalization import normalize_batch, normalize_frame, parse_prices, parse_ratings
+from src.core.product_batch import ProductBatch
+from src.parsers.parser_factory import create_parser
+from src.utils.config_loader import ConfigLoader
+
+FIXTURES = Path(__file__).parent / "fixtures" / "books_toscrape"
+
+
+@pytest.mark.parametrize("text, amount, currency", [
+    ("£51.77", 51.77, "GBP"),
+    ("1.234,56 €", 1234.56, "EUR"),
+    ("51,77 €", 51.77, "EUR"),
+    ("$1,299", 1299.0, "USD"),
+    ("USD 1,299.50", 1299.5, "USD"),
+    ("CHF 1'234.50", 1234.5, "CHF"),
+    ("1 234,50 zł", 1234.5, "PLN"),
+    ("NEW 10", 10.0, None),
+    ("free", None, None),
+])
+def test_parse_prices(text, amount, currency):
+    parsed = parse_prices(pa.array([text]))
+    assert parsed["price_amount"].to_pylist() == [amount]
+    assert parsed["price_currency"].to_pylist() == [currency]
+
+
+def test_parse_prices_uses_site_decimal_separator_for_ambiguous_groups():
+    texts = pa.array(["1.234", "1,234", "12,50"] * 3)
+    assert parse_prices(texts)["price_amount"].to_pylist()[:3] == [1.234, 1234.0, 12.5]
+    assert parse_prices(texts, decimal=",")["price_amount"].to_pylist()[:3] == [1234.0, 1.234, 12.5]
+
+
+def test_parse_ratings():
+    texts = pa.array(["star-rating Three", "4.5 out of 5", None, "Five stars"])
+    assert parse_ratings(texts).to_pylist() == [3.0, 4.5, None, 5.0]
+
+
+def test_scraped_product_normalizes_in_batch_and_frame():
+    website_config = ConfigLoader.load_website_config("books_toscrape")
+    parser = create_parser("lxml", website_config["base_url"], website_config["selectors"])
+    html = (FIXTURES / "product_sharp_objects.html").read_text()
+    product = parser.parse_product_page(html, "http://books.toscrape.com/sharp-objects")
+    assert (product.price, product.price_text, product.rating_text) == ("47.82", "£47.82", "star-rating Four")
+
+    normalized = normalize_batch(ProductBatch.from_products([product]))[0]
+    assert (normalized.price_amount, normalized.price_currency, normalized.rating) == (47.82, "GBP", 4.0)
+
+    frame = normalize_frame(pd.DataFrame([product.to_dict(), Product("http://x", "Two", price="€3").to_dict()]))
+    assert frame["price_amount"].tolist() == [47.82, 3.0]
+    assert frame["price_currency"].tolist() == ["GBP", "EUR"]
+    assert frame["rating"].tolist()[0] == 4.0
@@ -0,0 +1,98 @@
+import pickle
+import sys
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.parsers.base_parser import BaseParser
+from src.parsers.bs4_parser import BS4Parser
+from src.parsers.parser_factory import create_parser
+from src.parsers.selector_plan import SelectorPlan, listing_strainer
+from src.utils.config_loader import ConfigLoader
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PRODUCT_PAGES = [
+    FIXTURES / "books_toscrape" / "product_a_light_in_the_attic.html",
+    FIXTURES / "books_toscrape" / "product_sharp_objects.html",
+    FIXTURES / "generic_shop" / "product_page.html",
+]
+
+
+@pytest.mark.parametrize("page", PRODUCT_PAGES, ids=lambda p: p.stem)
+def test_selector_plan_matches_select_one(page):
+    """The single-pass plan finds the same element as select_one for every selector"""
+    website_config = ConfigLoader.load_website_config("books_toscrape")
+    parser = BS4Parser(website_config['base_url'], website_config['selectors'])
+    extra = ['#product_description + p', 'table tr:nth-child(2) td', '.product_main > p:not(.price_color)',
+             'ol.breadcrumb, ul.breadcrumb', 'p[class~="star-rating"]']
+    plan = SelectorPlan(parser.plan.selectors + extra)
+
+    soup = BeautifulSoup(page.read_text(), 'lxml')
+    matches = plan.match(soup)
+
+    for selector in plan.selectors:
+        assert matches.get(selector) is soup.select_one(selector), selector
+
+
+@pytest.mark.parametrize("backend", ["lxml", "selectolax"])
+def test_parser_backends_produce_identical_products(backend):
+    """Every backend extracts the same Products and links as BS4Parser"""
+    website_config = ConfigLoader.load_website_config("books_toscrape")
+    reference = create_parser("bs4", website_config['base_url'], website_config['selectors'])
+    parser = create_parser(backend, website_config['base_url'], website_config['selectors'])
+    assert type(parser).__name__ != "BS4Parser"
+
+    # Backends must survive pickling for the pipeline engine's worker processes
+    parser = pickle.loads(pickle.dumps(parser))
+
+    for page in PRODUCT_PAGES:
+        html = page.read_text()
+        expected = reference.parse_product_page(html, "http://example.com/p").to_dict()
+        actual = parser.parse_product_page(html, "http://example.com/p").to_dict()
+        expected.pop("scraped_timestamp")
+        actual.pop("scraped_timestamp")
+        assert actual == expected, page.stem
+
+    listing = (FIXTURES / "books_toscrape" / "listing_page_1.html").read_text()
+    page_url = "http://books.toscrape.com/catalogue/page-1.html"
+    assert parser.extract_product_links(listing, page_url) == reference.extract_product_links(listing, page_url)
+
+
+def test_unknown_parser_backend_falls_back_to_bs4():
+    parser = create_parser("nonexistent", "http://example.com", {'name': 'h1'})
+    assert isinstance(parser, BS4Parser)
+
+
+@pytest.mark.parametrize("selector", [
+    ".product_pod h3 a", "article.product_pod > h3 > a", "ol.row li a[title]",
+    "section a", ".image_container a", "ul.pager li a",
+])
+def test_listing_strainer_keeps_all_matches(selector):
+    """Partial parsing of listing pages finds the same links as a full parse"""
+    listing = (FIXTURES / "books_toscrape" / "listing_page_1.html").read_text()
+    strainer = listing_strainer(selector)
+    assert strainer is not None
+
+    full = [a.get('href') for a in BeautifulSoup(listing, 'lxml').select(selector)]
+    partial = [a.get('href') for a in BeautifulSoup(listing, 'lxml', parse_only=strainer).select(selector)]
+    assert partial == full and full
+
+
+def test_listing_strainer_refuses_unsafe_selectors():
+    assert listing_strainer("h3 + p a") is None
+    assert listing_strainer("li:nth-child(2) a") is None
+    assert listing_strainer(".a a, .b a") is None
+
+
+def test_backend_missing_a_hook_fails_on_creation():
+    class PartialParser(BaseParser):
+        def _compile(self, selectors):
+            pass
+
+    with pytest.raises(TypeError, match="_match"):
+        PartialParser("http://shop.example/", {})
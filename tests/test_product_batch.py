@@ -0,0 +1,53 @@
+import pickle
+import sys
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+
+from src.core.data_models import Product
+from src.core.product_batch import ProductBatch
+
+
+def _products():
+    return [
+        Product(product_url="http://shop.example/p/1", product_name="One", price="51.77",
+                rating=3.0, review_count=0, specifications={"UPC": "a897fe39b1053632"}),
+        Product(product_url="http://shop.example/p/2", product_name="Two"),
+    ]
+
+
+def test_product_is_slotted_and_picklable():
+    product = _products()[0]
+    assert not hasattr(product, "__dict__")
+    with pytest.raises(AttributeError):
+        product.unknown_field = 1
+    assert pickle.loads(pickle.dumps(product)) == product
+
+
+def test_product_batch_round_trips_products():
+    products = _products()
+    batch = ProductBatch.from_products(products)
+
+    assert len(batch) == 2
+    assert list(batch) == products
+    assert batch[-1] == products[1]
+    assert batch.to_dicts() == [product.to_dict() for product in products]
+    assert batch.column("rating").to_pylist() == [3.0, None]
+
+    joined = ProductBatch.concat([batch, batch])
+    assert len(joined) == 4 and joined[2] == products[0]
+
+
+def test_product_batch_to_pandas_shares_arrow_buffers():
+    batch = ProductBatch.from_products(_products())
+    frame = batch.to_pandas()
+
+    assert list(frame.columns) == list(_products()[0].to_dict())
+    assert str(frame["rating"].dtype) == "double[pyarrow]"
+    # The DataFrame column wraps the batch's own Arrow array
+    assert frame["price"].array.__arrow_array__().chunks[0].buffers()[2].address == \
+        batch.column("price").chunks[0].buffers()[2].address
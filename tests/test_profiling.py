@@ -0,0 +1,50 @@
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pstats
+
+from src.utils.profiling import StageProfiler
+
+
+def _busy(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+def test_sampling_attributes_stacks_to_the_innermost_stage(tmp_path):
+    with StageProfiler(str(tmp_path), interval=0.001) as profiler:
+        with profiler.stage("discovery"):
+            _busy(0.05)
+            with profiler.stage("fetch"):
+                _busy(0.05)
+
+    report_dir = profiler.output_dir
+    discovery = (report_dir / "discovery.collapsed").read_text()
+    fetch = (report_dir / "fetch.collapsed").read_text()
+    assert "test_profiling.py:_busy" in discovery
+    assert "test_profiling.py:_busy" in fetch
+    # Collapsed stacks: "root;...;leaf count"
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in fetch.splitlines())
+    assert "discovery: 1 entries" in (report_dir / "summary.txt").read_text()
+
+
+def test_cprofile_and_memory_sample_every_nth_entry(tmp_path):
+    profiler = StageProfiler(str(tmp_path), cpu="cprofile", memory=True, sample_every=2).start()
+    kept = []
+    for i in range(4):
+        with profiler.stage("parse"):
+            kept.append(bytearray(100_000))
+    report_dir = profiler.stop()
+
+    stats = pstats.Stats(str(report_dir / "parse.pstats"))
+    assert stats.total_calls > 0
+    allocations = (report_dir / "parse.allocations.txt").read_text()
+    assert "test_profiling.py" in allocations
+    # Entries 1, 2 and 4 are instrumented
+    assert float(allocations.split()[0]) >= 3 * 97
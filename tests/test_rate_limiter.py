@@ -0,0 +1,60 @@
+import sys
+import threading
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from src.utils.rate_limiter import TokenBucket, HostRateLimiter
+from src.utils.request_manager import RequestManager
+
+
+def test_token_bucket_burst_then_paced():
+    """Burst tokens are free, later requests queue one interval apart"""
+    bucket = TokenBucket(rate=10, burst=3)
+
+    waits = [bucket.reserve() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert 0.09 < waits[3] <= 0.1
+    assert 0.19 < waits[4] <= 0.2
+
+
+def test_rate_limiter_from_config():
+    """delay_between_requests is read as a rate, 0 means unlimited"""
+    limiter = HostRateLimiter.from_config({'delay_between_requests': 0.5, 'burst': 2})
+    assert limiter.rate == 2.0
+    assert limiter.burst == 2
+    assert limiter.bucket("a.example") is not limiter.bucket("b.example")
+
+    unlimited = HostRateLimiter.from_config({'delay_between_requests': 0})
+    assert all(unlimited.reserve("a.example") == 0.0 for _ in range(10))
+
+    explicit = HostRateLimiter.from_config({'delay_between_requests': 1.0, 'requests_per_second': 5})
+    assert explicit.rate == 5
+
+
+def test_iter_many_cancels_queued_requests_when_closed_early():
+    manager = RequestManager({'delay_between_requests': 0, 'max_concurrency_per_host': 1})
+    fetched = []
+    second_started, release = threading.Event(), threading.Event()
+
+    def get(url):
+        fetched.append(url)
+        if url == "u1":
+            second_started.set()
+            release.wait()
+        return url
+
+    manager.get = get
+    responses = manager.iter_many([f"u{i}" for i in range(10)], window=4)
+    assert next(responses) == "u0"
+    assert second_started.wait(1)
+
+    responses.close()
+    release.set()
+    manager.close()
+
+    # Only the request already running when the stream closed was fetched
+    assert fetched == ["u0", "u1"]
@@ -0,0 +1,297 @@
+import gc
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+
+from src.core.data_models import ScrapingConfig
+from src.core.scraper_engine import ScraperEngine
+
+FIXTURES = Path(__file__).parent / "fixtures" / "books_toscrape"
+
+
+def _site_pages():
+    """Map URL paths of a fake books.toscrape site to fixture HTML"""
+    attic = (FIXTURES / "product_a_light_in_the_attic.html").read_text()
+    sharp = (FIXTURES / "product_sharp_objects.html").read_text()
+    return {
+        "/catalogue/page-1.html": (FIXTURES / "listing_page_1.html").read_text(),
+        "/catalogue/page-2.html": (FIXTURES / "listing_page_2.html").read_text(),
+        # page-3.html onwards is missing and returns 404
+        "/catalogue/a-light-in-the-attic_1000/index.html": attic,
+        "/catalogue/tipping-the-velvet_999/index.html": attic,
+        "/catalogue/sharp-objects_997/index.html": sharp,
+        # soumission_998 is missing and returns 404
+    }
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Keep checkpoint journals out of the repository"""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def site_pages():
+    return _site_pages()
+
+
+@pytest.fixture
+def local_site(site_pages):
+    pages = site_pages
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = pages.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def _website_config(base_url):
+    return {
+        "name": "local_books",
+        "base_url": base_url,
+        "selectors": {
+            "product_links": ".product_pod h3 a",
+            "name": ".product_main h1",
+            "price": ".product_main .price_color",
+            "availability": ".product_main .availability",
+            "description": "#product_description + p",
+            "category": ".breadcrumb li:nth-last-child(2) a",
+            "image": ".item.active img"
+        },
+        "pagination": {"pattern": "catalogue/page-{page_number}.html", "max_pages": 1},
+        "request_settings": {"delay_between_requests": 0, "timeout": 5, "retry_attempts": 0},
+    }
+
+
+@pytest.mark.parametrize("scraping_config", [
+    ScrapingConfig(engine="async", max_concurrency_per_host=4),
+    ScrapingConfig(engine="pipeline", parser_workers=2, pipeline_queue_size=2),
+], ids=["async", "pipeline"])
+def test_concurrent_engines_match_sync_engine(local_site, scraping_config):
+    """Concurrent engines keep product order and failed_urls semantics"""
+    sync_scraper = ScraperEngine(_website_config(local_site))
+    sync_products = sync_scraper.scrape_catalog()
+
+    other_scraper = ScraperEngine(_website_config(local_site), scraping_config)
+    other_products = other_scraper.scrape_catalog()
+
+    assert [p.product_url for p in other_products] == [p.product_url for p in sync_products]
+    assert [p.product_name for p in other_products] == [
+        "A Light in the Attic", "A Light in the Attic", "Sharp Objects"
+    ]
+    assert other_scraper.failed_urls == sync_scraper.failed_urls
+    assert other_scraper.failed_urls[0].endswith("soumission_998/index.html")
+
+
+def test_discovery_dedupes_and_stops_at_first_missing_page(local_site):
+    """Listing pages are fetched ahead but processed in order"""
+    website_config = _website_config(local_site)
+    website_config["pagination"]["max_pages"] = 10
+    scraper = ScraperEngine(website_config)
+
+    urls = scraper._get_all_product_urls(local_site)
+
+    # Page 2 repeats page 1's products in another order
+    assert [url.rsplit("/", 2)[-2] for url in urls] == [
+        "a-light-in-the-attic_1000", "tipping-the-velvet_999", "soumission_998", "sharp-objects_997"
+    ]
+
+
+def test_detect_total_pages():
+    scraper = ScraperEngine(_website_config("http://books.example/"))
+    listing = (FIXTURES / "listing_page_1.html").read_text()
+    assert scraper._detect_total_pages(listing) == 50
+
+    # A lone "next" link says nothing about the total
+    next_only = listing.replace("Page 1 of 50", "")
+    assert scraper._detect_total_pages(next_only) is None
+
+    last_link = next_only.replace('<li class="next">', '<li class="last"><a href="page-42.html">last</a></li><li class="next">')
+    assert scraper._detect_total_pages(last_link) == 42
+
+
+def test_change_detection_skips_unchanged_products(local_site, site_pages, tmp_path):
+    """Second run reuses unchanged products and reports a change feed"""
+    website_config = _website_config(local_site)
+    website_config["change_detection"] = {
+        "enabled": True, "region": "article.product_page", "path": str(tmp_path / "products.sqlite3")
+    }
+
+    first = ScraperEngine(website_config)
+    first.scrape_catalog()
+    assert first.change_tracker.summary() == {"new": 3, "changed": 0, "removed": 0, "unchanged": 0}
+
+    # One price changes, one product disappears from the listing
+    sharp = "/catalogue/sharp-objects_997/index.html"
+    listing = "/catalogue/page-1.html"
+    site_pages[sharp] = site_pages[sharp].replace("47.82", "12.34")
+    site_pages[listing] = site_pages[listing].replace("tipping-the-velvet_999", "sharp-objects_997")
+
+    second = ScraperEngine(website_config)
+    products = second.scrape_catalog()
+
+    assert second.change_tracker.summary() == {"new": 0, "changed": 1, "removed": 1, "unchanged": 1}
+    assert [p.price for p in products] == ["51.77", "12.34"]
+    assert second.change_tracker.removed[0].endswith("tipping-the-velvet_999/index.html")
+
+    feed = tmp_path / "changes.jsonl"
+    second.change_tracker.write_change_feed(str(feed))
+    assert [json.loads(line)["change"] for line in feed.read_text().splitlines()] == ["changed", "removed"]
+
+
+def test_resume_continues_from_checkpoint_without_rediscovery(local_site, site_pages, tmp_path):
+    """An interrupted crawl resumes from its journal, skipping listing pages"""
+    journal = tmp_path / "books.jsonl"
+    scraping_config = ScrapingConfig(checkpoint_path=str(journal))
+    expected = ScraperEngine(_website_config(local_site), scraping_config).scrape_catalog()
+
+    # Interrupt after the first product, mid-way through writing the next line
+    lines = journal.read_text().splitlines(keepends=True)
+    assert [json.loads(line)["type"] for line in lines[:3]] == ["start", "frontier", "done"]
+    journal.write_text("".join(lines[:3]) + '{"type": "do')
+
+    # Listing pages are gone: resuming must not need them
+    del site_pages["/catalogue/page-1.html"]
+    scraper = ScraperEngine(_website_config(local_site), scraping_config)
+    assert len(scraper.load_progress()) == 3
+
+    products = scraper.scrape_catalog(resume=True)
+
+    assert [p.to_dict() for p in products][:1] == [expected[0].to_dict()]
+    assert [p.product_url for p in products] == [p.product_url for p in expected]
+    assert scraper.failed_urls[0].endswith("soumission_998/index.html")
+    assert scraper.checkpoint.load().finished
+
+
+def test_resume_after_finished_run_starts_fresh(local_site, site_pages, tmp_path):
+    """A completed journal is not replayed: the catalog is crawled again"""
+    scraping_config = ScrapingConfig(checkpoint_path=str(tmp_path / "books.jsonl"))
+    ScraperEngine(_website_config(local_site), scraping_config).scrape_catalog()
+
+    sharp = "/catalogue/sharp-objects_997/index.html"
+    site_pages[sharp] = site_pages[sharp].replace("47.82", "12.34")
+    scraper = ScraperEngine(_website_config(local_site), scraping_config)
+    products = scraper.scrape_catalog(resume=True)
+
+    assert [p.price for p in products][-1] == "12.34"
+    assert scraper.metrics.counter_total("listing_pages_total") == 1
+    assert scraper.checkpoint.load().finished
+
+
+@pytest.mark.parametrize("engine", ["sync", "async"])
+def test_iter_products_streams_without_keeping_products(local_site, engine):
+    scraper = ScraperEngine(_website_config(local_site), ScrapingConfig(engine=engine))
+    products = scraper.iter_products()
+
+    first = next(products)
+    assert first.product_name == "A Light in the Attic"
+    assert scraper.scraped_products == []
+
+    # Stopping early leaves the journal open for a resume
+    products.close()
+    assert not scraper.checkpoint.load().finished
+    assert [p.product_name for p in scraper.iter_products(resume=True)] == [
+        "A Light in the Attic", "A Light in the Attic", "Sharp Objects"
+    ]
+
+
+def test_crawl_workers_share_a_frontier(local_site, tmp_path):
+    """Workers split the URLs between them and a crashed worker's lease is reclaimed"""
+    from src.core.crawl_worker import CrawlWorker
+    from src.core.shared_frontier import SQLiteFrontier
+
+    frontier = SQLiteFrontier(str(tmp_path / "frontier.sqlite3"))
+    seeder = CrawlWorker(ScraperEngine(_website_config(local_site)), frontier)
+    assert seeder.seed() == 4
+
+    # A worker claims a batch and dies without reporting back
+    crashed = frontier.claim("crashed", 1, lease_seconds=-1)
+
+    workers = [CrawlWorker(ScraperEngine(_website_config(local_site), ScrapingConfig(engine=engine)),
+                           frontier, worker_id=engine, batch_size=2, max_attempts=2, poll_interval=0)
+               for engine in ("sync", "async")]
+    workers[0].run(max_batches=1)
+    workers[1].run()
+
+    assert frontier.stats() == {"pending": 0, "leased": 0, "done": 3, "failed": 1}
+    assert frontier.failed_urls()[0].endswith("soumission_998/index.html")
+    products = seeder.collect()
+    assert crashed[0] in [p.product_url for p in products]
+    assert sorted(p.product_name for p in products) == [
+        "A Light in the Attic", "A Light in the Attic", "Sharp Objects"
+    ]
+    frontier.close()
+
+
+def test_engine_records_stage_metrics(local_site):
+    scraper = ScraperEngine(_website_config(local_site),
+                            ScrapingConfig(metrics_path="logs/metrics_{site}.json", metrics_interval=60))
+    scraper.scrape_catalog()
+
+    metrics = scraper.metrics
+    assert metrics.counter_total("listing_pages_total") == 1
+    assert metrics.counter_total("pages_total", result="parsed") == 3
+    assert metrics.counter_total("pages_total", result="fetch_failed") == 1
+    assert metrics.counter_total("requests_total", status=200) == 4
+    assert metrics.counter_total("requests_total", status=404) == 1
+    assert metrics.counter_total("response_bytes_total") > 0
+
+    snapshot = json.loads(Path("logs/metrics_local_books.json").read_text())
+    histograms = snapshot["histograms"]
+    assert histograms["parse_seconds"][0]["count"] == 3
+    assert histograms["fetch_ttfb_seconds"][0]["count"] == 5
+    assert [item["labels"] for item in histograms["stage_seconds"]] == [{"stage": "discovery"}]
+    # Normalization runs after the crawl, so only the live registry has it
+    stages = metrics.snapshot()["histograms"]["stage_seconds"]
+    assert {item["labels"]["stage"] for item in stages} == {"discovery", "normalize"}
+
+
+def test_engine_profiling_hook_writes_stage_reports(local_site, tmp_path):
+    scraper = ScraperEngine(_website_config(local_site), ScrapingConfig())
+    profiler = scraper.enable_profiling(output_dir=str(tmp_path), cpu="cprofile")
+    assert scraper.request_manager.profiler is profiler
+    scraper.scrape_catalog()
+    report_dir = scraper.disable_profiling()
+
+    assert scraper.profiler is None
+    assert {path.name for path in report_dir.glob("*.pstats")} == {
+        "discovery.pstats", "fetch.pstats", "parse.pstats"}
+
+
+def test_closing_async_stream_early_leaves_no_pending_tasks(local_site, caplog):
+    """The GUI Stop path: page tasks and async generators are finished before the loop closes"""
+    scraper = ScraperEngine(_website_config(local_site), ScrapingConfig(engine="async"))
+    products = scraper.iter_products()
+    next(products)
+
+    products.close()
+    gc.collect()
+
+    assert "Task was destroyed but it is pending" not in caplog.text
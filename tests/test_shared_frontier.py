@@ -0,0 +1,147 @@
+import sys
+from collections import defaultdict, deque
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+
+from src.core.shared_frontier import RedisFrontier, SQLiteFrontier, open_frontier
+
+
+class FakeRedis:
+    """In-process stand-in for the Redis commands RedisFrontier uses"""
+
+    def __init__(self):
+        self.sets = defaultdict(set)
+        self.lists = defaultdict(deque)
+        self.zsets = defaultdict(dict)
+        self.hashes = defaultdict(dict)
+
+    def sadd(self, key, member):
+        added = member not in self.sets[key]
+        self.sets[key].add(member)
+        return int(added)
+
+    def scard(self, key):
+        return len(self.sets[key])
+
+    def smembers(self, key):
+        return set(self.sets[key])
+
+    def rpush(self, key, value):
+        self.lists[key].append(value)
+
+    def lpush(self, key, value):
+        self.lists[key].appendleft(value)
+
+    def lpop(self, key):
+        return self.lists[key].popleft() if self.lists[key] else None
+
+    def llen(self, key):
+        return len(self.lists[key])
+
+    def zadd(self, key, mapping):
+        self.zsets[key].update(mapping)
+
+    def zrem(self, key, member):
+        return int(self.zsets[key].pop(member, None) is not None)
+
+    def zrangebyscore(self, key, low, high):
+        return sorted((m for m, score in self.zsets[key].items() if score <= high), key=self.zsets[key].get)
+
+    def zcard(self, key):
+        return len(self.zsets[key])
+
+    def hset(self, key, field, value):
+        self.hashes[key][field] = value
+
+    def hget(self, key, field):
+        return self.hashes[key].get(field)
+
+    def hdel(self, key, field):
+        self.hashes[key].pop(field, None)
+
+    def hincrby(self, key, field, amount):
+        self.hashes[key][field] = int(self.hashes[key].get(field, 0)) + amount
+
+    def hlen(self, key):
+        return len(self.hashes[key])
+
+    def hgetall(self, key):
+        return dict(self.hashes[key])
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def frontier(request, tmp_path):
+    if request.param == "sqlite":
+        frontier = SQLiteFrontier(str(tmp_path / "frontier.sqlite3"))
+    else:
+        frontier = RedisFrontier(FakeRedis(), prefix="test")
+    yield frontier
+    frontier.close()
+
+
+URLS = [f"https://example.com/item/{i}" for i in range(5)]
+
+
+def test_claims_are_disjoint_and_results_are_collected(frontier):
+    assert frontier.add_urls(URLS) == 5
+    assert frontier.add_urls(URLS[:2]) == 0
+
+    first = frontier.claim("a", 3, lease_seconds=60)
+    second = frontier.claim("b", 3, lease_seconds=60)
+    assert first == URLS[:3] and second == URLS[3:]
+    assert frontier.claim("c", 3, lease_seconds=60) == []
+
+    for url in first + second:
+        frontier.complete("a" if url in first else "b", url, {"product_url": url})
+
+    assert frontier.stats() == {"pending": 0, "leased": 0, "done": 5, "failed": 0}
+    assert sorted(url for url, _ in frontier.products()) == URLS
+
+
+def test_expired_leases_are_reclaimed(frontier):
+    frontier.add_urls(URLS[:2])
+    crashed = frontier.claim("crashed", 2, lease_seconds=-1)
+
+    # The crashed worker's URLs go to the next claimer
+    assert sorted(frontier.claim("b", 5, lease_seconds=60)) == sorted(crashed)
+
+    # A late failure report from the old lease holder is ignored
+    frontier.fail("crashed", crashed[0])
+    assert frontier.stats()["leased"] == 2
+
+
+def test_failed_urls_are_retried_until_max_attempts(frontier):
+    frontier.add_urls(URLS[:1])
+    for attempt in range(3):
+        assert frontier.claim("a", 1, lease_seconds=60) == URLS[:1]
+        frontier.fail("a", URLS[0], max_attempts=3)
+
+    assert frontier.claim("a", 1, lease_seconds=60) == []
+    assert frontier.failed_urls() == URLS[:1]
+    assert frontier.stats()["failed"] == 1
+
+
+def test_urls_whose_leases_keep_expiring_fail(frontier):
+    frontier.add_urls(URLS[:1])
+    # Each worker crashes on the URL and never reports back
+    for attempt in range(2):
+        assert frontier.claim(f"worker-{attempt}", 1, lease_seconds=-1, max_attempts=2) == URLS[:1]
+
+    assert frontier.claim("next", 1, lease_seconds=60, max_attempts=2) == []
+    assert frontier.failed_urls() == URLS[:1]
+    assert frontier.stats() == {"pending": 0, "leased": 0, "done": 0, "failed": 1}
+
+
+def test_open_frontier(tmp_path):
+    frontier = open_frontier(f"sqlite:///{tmp_path}/nested/frontier.sqlite3")
+    assert isinstance(frontier, SQLiteFrontier)
+    assert frontier.path == tmp_path / "nested" / "frontier.sqlite3"
+    frontier.close()
+
+    with pytest.raises(ValueError):
+        open_frontier("ftp://example.com/frontier")
@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+
+from src.core.frontier import BloomFilter, UrlFrontier
+from src.parsers.parser_factory import create_parser
+from src.utils.url_canonicalizer import UrlCanonicalizer
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTP://Example.COM:80/a/./b/../c?b=2&a=1#reviews", "http://example.com/a/c?a=1&b=2"),
+    ("https://example.com/item?utm_source=mail&utm_medium=x&gclid=1&id=7", "https://example.com/item?id=7"),
+    ("https://example.com:8443/catalogue/../item/", "https://example.com:8443/item/"),
+    ("https://example.com", "https://example.com/"),
+    ("http://[::1]:8080/x", "http://[::1]:8080/x"),
+    ("http://[2001:DB8::1]:80/x?sid=4", "http://[2001:db8::1]/x?sid=4"),
+    ("https://example.com/s?q=a+b&utm_id=1&p=b%2Fc&e=", "https://example.com/s?e=&p=b%2Fc&q=a+b"),
+    ("http://host:abc/x?utm_source=y", "http://host:abc/x?utm_source=y"),
+])
+def test_canonicalize_default_rules(url, expected):
+    assert UrlCanonicalizer().canonicalize(url) == expected
+
+
+def test_canonicalize_site_rules():
+    canonicalizer = UrlCanonicalizer({'trailing_slash': 'strip', 'strip_params': ['ref*'], 'strip_fragment': False})
+    assert canonicalizer.canonicalize("https://example.com/item/?ref=home&color=red#top") == \
+        "https://example.com/item?color=red#top"
+
+    canonicalizer = UrlCanonicalizer({'keep_params': ['id'], 'trailing_slash': 'add'})
+    assert canonicalizer.canonicalize("https://example.com/item?id=7&session=x") == "https://example.com/item/?id=7"
+    assert canonicalizer.canonicalize("https://example.com/item.html") == "https://example.com/item.html"
+
+
+def test_extract_product_links_canonicalizes_and_deduplicates():
+    html = """
+    <div class="p"><a href="../item-1/index.html?utm_source=x">1</a></div>
+    <div class="p"><a href="/catalogue/item-1/index.html#reviews">1 again</a></div>
+    <div class="p"><a href="item-2/index.html">2</a></div>
+    """
+    for backend in ("bs4", "lxml", "selectolax"):
+        parser = create_parser(backend, "http://example.com/", {'product_links': '.p a'})
+        links = parser.extract_product_links(html, base_page_url="http://example.com/catalogue/page-1.html")
+        assert links == [
+            "http://example.com/item-1/index.html",
+            "http://example.com/catalogue/item-1/index.html",
+            "http://example.com/catalogue/item-2/index.html",
+        ]
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_error():
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    urls = [f"https://example.com/item/{i}" for i in range(10_000)]
+    assert all(bloom.add(url) for url in urls[:100])
+    for url in urls[100:]:
+        bloom.add(url)
+
+    assert all(url in bloom for url in urls)
+    false_positives = sum(f"https://example.com/other/{i}" in bloom for i in range(10_000))
+    assert false_positives < 300
+    # About 1.2 bytes per item at 1%
+    assert len(bloom.bits) < 13_000
+
+
+@pytest.mark.parametrize("mode", ["set", "bloom"])
+def test_frontier_add_reports_new_urls(mode):
+    frontier = UrlFrontier.from_config({'mode': mode, 'capacity': 1000})
+    assert frontier.add("https://example.com/a")
+    assert not frontier.add("https://example.com/a")
+    assert frontier.add("https://example.com/b")
+    assert "https://example.com/a" in frontier
+    assert len(frontier) == 2
+
+    with pytest.raises(ValueError):
+        UrlFrontier(mode="list")